@@ -0,0 +1,45 @@
+import logging
+
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+
+from app.application.service.ingest_job_service import IngestJobService, get_ingest_job_service
+from app.core.config import settings
+from app.infrastructure.upload.spooled_upload import save_upload
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.post("", status_code=202)
+async def submit_job(
+    file: UploadFile = File(...),
+    service: IngestJobService = Depends(get_ingest_job_service),
+):
+    """업로드를 저장하고 ingest job 을 등록한 뒤 바로 job_id 를 반환한다."""
+    upload = await save_upload(file, settings.INGEST_JOB_SPOOL_DIR)
+    job = service.submit(upload)
+    logger.info("ingest job submitted -> %s (%s)", job.job_id, job.filename)
+    return {"job_id": job.job_id, "status": job.status.value}
+
+
+@router.get("/{job_id}")
+async def get_job(
+    job_id: str,
+    service: IngestJobService = Depends(get_ingest_job_service),
+):
+    job = service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return job.to_dict()
+
+
+@router.delete("/{job_id}")
+async def cancel_job(
+    job_id: str,
+    service: IngestJobService = Depends(get_ingest_job_service),
+):
+    job = service.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return job.to_dict()
@@ -1,14 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, UploadFile, File, Request, HTTPException
-import fitz
-import base64
 import logging
 from dotenv import load_dotenv
-from langchain_experimental.text_splitter import SemanticChunker
-from langchain_openai.embeddings import OpenAIEmbeddings
 from platformdirs.version import version_tuple
 
+from app.application.service.incremental_ingest_service import IncrementalIngestService
 from app.application.service.parse_document_service import ParseDocumentService
 from app.application.service.question_service import QuestionService
 from app.domain.llm.embedding.openai_embeding_service import OpenAIEmbed
@@ -17,7 +14,13 @@ from app.infrastructure.vector_store.vector_db import VectorDB
 from app.infrastructure.vector_store.vector_factory import VectorFactory, VectorType
 from app.infrastructure.vector_store.vector_filter import VectorFilter
 from app.service.chunk.parser.text_parseprocessor import TextParseProcessor
-from app.service.pdf_service import PdfService
+from app.service.pdf_service import PdfService, open_pdf
+from app.infrastructure.upload.spooled_upload import spool_upload
+from app.infrastructure.cache.llama_parse_cache import LlamaParseCache
+from app.infrastructure.dedup.chunk_deduplicator import get_chunk_deduplicator
+from app.infrastructure.executor.executor import run_cpu, run_io
+from app.domain.document.entity.image_extraction_mode import ImageExtractionMode
+from app.domain.document.services.document_classifier_service import classification_stats
 from app.service.chunk.chunking_service import ChunkingService
 from app.service.chunk.nlp.nlp_service import NLPService
 # from app.services.chunk.chunking_service import ChunkingService
@@ -27,84 +30,73 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()  
 @router.post("/parse-detail")
-async def parse_pdf_detail(file: UploadFile = File(...)):
-    pdf_bytes = await file.read()
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+async def parse_pdf_detail(file: UploadFile = File(...), image_mode: ImageExtractionMode = ImageExtractionMode.METADATA):
+    pdf_service = PdfService(image_mode=image_mode)
+    images_seen: dict = {}
 
     result = []
 
-    for page_num, page in enumerate(doc):
-        text = page.get_text("text")
-        imgs = []
+    async with spool_upload(file) as upload:
+        with open_pdf(upload.path) as doc:
+            for page_num, page in enumerate(doc):
+                text = page.get_text("text")
+                imgs = pdf_service.extract_page_images(doc, page, images_seen)
 
-        for img in page.get_images(full=True):
-            xref = img[0]
-            pix = fitz.Pixmap(doc, xref)
-            img_bytes = pix.tobytes("png")
-
-            # base64 인코딩
-            encoded = base64.b64encode(img_bytes).decode("utf-8")
-
-            imgs.append({
-                "xref": xref,
-                # "image_base64": encoded
-            })
-
-        result.append({
-            "page": page_num + 1,
-            "text": text,
-            "images": imgs
-        })
+                result.append({
+                    "page": page_num + 1,
+                    "text": text,
+                    "images": imgs
+                })
 
     return result
 
 @router.post("/chunk")
 def chunk_test():
-        text_splitter = SemanticChunker(OpenAIEmbeddings())
-        chunks = text_splitter.split_text("Hello, world!")
+        chunks = ChunkingService().split_text("Hello, world!")
 
         return chunks
 # -----------------------------
 # PDF 업로드 → 텍스트 → 청킹
 # -----------------------------
 @router.post("/parse-and-chunk")
-async def parse_and_chunk(file: UploadFile = File(...)):
-    # 1) PDF 읽기
-    pdf_bytes = await file.read()
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-
-    # 2) 전체 페이지 텍스트 합치기
-    full_text = ""
-    for page in doc:
-        text = page.get_text("text")
-        full_text += text + "\n"
-
-    # 3) OpenAI Embedding 준비
-    # embedder = OpenAIEmbeddings()
-    # 4) Semantic Chunker 준비
-    # text_splitter = SemanticChunker(OpenAIEmbeddings())
-
-    # 5) 청킹 수행
-    text_splitter = SemanticChunker(
-        embeddings=OpenAIEmbeddings(),
-        breakpoint_threshold_type="percentile",  # 또는 "cosine"
-        breakpoint_threshold_amount=65          # ← 민감도 (값 낮출수록 더 많이 쪼개짐)
+async def parse_and_chunk(file: UploadFile = File(...), collection: Optional[str] = None):
+    # 1) PDF 읽기 (디스크 spool) + 2) 전체 페이지 텍스트 합치기 (CPU 풀)
+    async with spool_upload(file) as upload:
+        with open_pdf(upload.path) as doc:
+            page_count = len(doc)
+        full_text = await run_cpu(PdfService().parse_full_text, upload.path)
+
+    # 3) 청킹 수행 (문장 임베딩은 캐시 + batch)
+    chunking_service = ChunkingService(
+        threshold_type="percentile",
+        threshold_amount=65,          # ← 민감도 (값 낮출수록 더 많이 쪼개짐)
     )
 
-    chunks = text_splitter.split_text(full_text)
-
-    # 6) 결과 반환
-    return {
-        "page_count": len(doc),
+    # 4) collection 을 주면 바로 적재 (설정에 따라 청크 벡터 재사용)
+    if collection:
+        result = await run_io(
+            chunking_service.chunk_and_upsert, full_text, collection, {"file_name": file.filename}
+        )
+        chunks = result["chunks"]
+    else:
+        result = None
+        chunks = await run_io(chunking_service.split_text, full_text)
+
+    # 5) 결과 반환
+    response = {
+        "page_count": page_count,
         "chunk_count": len(chunks),
         "chunks": chunks
     }
+    if result is not None:
+        response["upsert_count"] = result["upsert_count"]
+    return response
 
 @router.post("/parse-and-chunk-with-service")
 async def parse_and_chunk_with_service(file: UploadFile = File(...)):
     pdf_service = PdfService()
-    pdf_bytes = await file.read()
-    result = pdf_service.parse_pdf(pdf_bytes)
+    async with spool_upload(file) as upload:
+        result = pdf_service.parse_pdf(upload.path)
 
     chunking_service = ChunkingService()
     chunks = chunking_service.split_text_with_metadata(result)
@@ -118,8 +110,8 @@ async def parse_and_chunk_with_service(file: UploadFile = File(...)):
 
 @router.post("/nlp-test")
 def nlp_test(text: str, request: Request):
-    nlp_service = NLPService()
-    tokens = nlp_service.test(request,text)
+    nlp_service = NLPService(request.app.state.kiwi)
+    tokens = nlp_service.test(text)
     return tokens
 
 @router.post("/parse/pdf")
@@ -128,12 +120,11 @@ async def parse_pdf(file: UploadFile = File(...)):
     if not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다.")
 
-    # 업로드된 파일 bytes 읽기
-    file_bytes = await file.read()
     llama_parse_service = LlamaParseService()
-    # 파싱 실행
+    # 파싱 실행 (spool 된 경로를 그대로 LlamaParse 에 전달)
     try:
-        result = llama_parse_service.parse_bytes(file_bytes, file.filename)
+        async with spool_upload(file) as upload:
+            result = await run_io(llama_parse_service.parse_path, upload.path, file.filename)
         # return {
         #     "file_name": file.filename,
         #     "pages": result["pages"],
@@ -144,13 +135,39 @@ async def parse_pdf(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Parsing failed: {str(e)}")
 
 @router.post("/test/pd")
-async def test_pdf(file:UploadFile = File(...)):
-    file_bytes = await file.read()
+async def test_pdf(file:UploadFile = File(...), stream: bool = False):
     svc = ParseDocumentService()
 
-    return svc.execute(file_bytes,file.filename)
+    async with spool_upload(file) as upload:
+        return await svc.aexecute_path(upload.path, file.filename, file_hash=upload.sha256, stream=stream)
     # return  text_parser.preprocess_text('# 크크크앱 개발자 매뉴얼\n\n\n\n\n# 1. 안드로이드앱 빌드 및 스토어 등록')
 
+@router.get("/classification/stats")
+async def classification_stats_endpoint():
+    """규칙 분류로 확정된 문서 비율 (LLM 호출을 생략한 비율)."""
+    return classification_stats.to_dict()
+
+@router.get("/llama-parse/cache/stats")
+async def llama_parse_cache_stats():
+    return await run_io(lambda: LlamaParseCache().stats())
+
+@router.get("/dedup/{collection}/stats")
+async def dedup_stats(collection: str):
+    return await run_io(lambda: get_chunk_deduplicator(collection).index.stats())
+
+@router.post("/ingest/incremental")
+async def ingest_incremental(file: UploadFile = File(...), doc_key: Optional[str] = None):
+    """
+    같은 doc_key(기본: 파일명)로 재업로드된 문서에서 바뀐 페이지만 다시 적재한다.
+    """
+    svc = IncrementalIngestService()
+
+    async with spool_upload(file) as upload:
+        result = await run_io(
+            svc.execute_path, upload.path, file.filename, doc_key=doc_key, version=upload.sha256
+        )
+    return result.to_dict()
+
 @router.post("/test/question")
 async def test_question(question:str):
     vector_db:VectorDB = VectorFactory.get_vectorstore(VectorType.QDRANT,OpenAIEmbed().embeddings)
@@ -158,9 +175,11 @@ async def test_question(question:str):
     vector_filter_list.append(
         VectorFilter.match("metadata.role","child")
     )
-    svc = QuestionService(
+    # retriever 생성 시 Qdrant 컬렉션 확인(네트워크)이 있으므로 io 풀에서 생성
+    svc = await run_io(
+        QuestionService,
         collection="test",
         vector_db=vector_db,
         vector_filters=vector_filter_list,
     )
-    return svc.execute(question)
\ No newline at end of file
+    return await svc.aexecute(question)
\ No newline at end of file
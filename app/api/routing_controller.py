@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import AsyncIterator, Iterator, List, Optional
+
+from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.infrastructure.upload.spooled_upload import save_upload
+from app.schemas.routing import RouteBatchPathsRequest
+from app.service.llm_routing_service import RoutingContentMode, get_llm_routing_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+NDJSON = "application/x-ndjson"
+
+
+async def _ndjson(results: AsyncIterator[dict]) -> AsyncIterator[str]:
+    async for result in results:
+        yield json.dumps(result, ensure_ascii=False) + "\n"
+
+
+def _path_root() -> Path:
+    if not settings.ROUTING_PATH_ROOT:
+        raise HTTPException(status_code=403, detail="path based routing is disabled")
+    return Path(settings.ROUTING_PATH_ROOT).resolve()
+
+
+def _resolve_under(root: Path, path: str | Path) -> Optional[Path]:
+    """root 기준으로 경로를 풀고(.. / symlink 포함) root 밖이면 None."""
+    resolved = (root / path).resolve()
+    return resolved if resolved.is_relative_to(root) else None
+
+
+def _iter_paths(request: RouteBatchPathsRequest, root: Path) -> Iterator[str]:
+    for path in request.paths:
+        yield str(_resolve_under(root, path))
+    if request.directory:
+        directory = _resolve_under(root, request.directory)
+        matches = directory.rglob(request.pattern) if request.recursive else directory.glob(request.pattern)
+        for path in matches:
+            # glob 패턴의 .. 나 디렉터리 안 symlink 로 root 밖을 가리키는 파일은 건너뛴다
+            resolved = _resolve_under(root, path)
+            if resolved is None:
+                logger.warning("root 밖 경로 무시: %s", path)
+                continue
+            if resolved.is_file():
+                yield str(resolved)
+
+
+@router.post("/batch")
+async def route_batch(
+    files: List[UploadFile] = File(...),
+    concurrency: Optional[int] = None,
+    content_mode: Optional[RoutingContentMode] = None,
+):
+    """
+    업로드한 파일들을 동시에 라우팅하고, 끝나는 순서대로 NDJSON 한 줄씩 응답한다.
+    """
+    service = get_llm_routing_service()
+    uploads = [await save_upload(file) for file in files]
+    names = {upload.path: upload.filename for upload in uploads}
+
+    async def results() -> AsyncIterator[dict]:
+        try:
+            async for result in service.route_documents(
+                names.keys(), concurrency=concurrency, content_mode=content_mode
+            ):
+                result["file_name"] = names[result.pop("file_path")]
+                yield result
+        finally:
+            for upload in uploads:
+                if os.path.exists(upload.path):
+                    os.unlink(upload.path)
+
+    return StreamingResponse(_ndjson(results()), media_type=NDJSON)
+
+
+@router.post("/batch/paths")
+async def route_batch_paths(request: RouteBatchPathsRequest):
+    """
+    서버 디스크의 파일 경로 / 디렉터리를 동시에 라우팅하고 NDJSON 으로 흘려보낸다.
+    ROUTING_PATH_ROOT 아래 경로만 허용한다 (상대 경로는 root 기준).
+    """
+    if not request.paths and not request.directory:
+        raise HTTPException(status_code=400, detail="paths or directory is required")
+    root = _path_root()
+    if any(_resolve_under(root, path) is None for path in request.paths):
+        raise HTTPException(status_code=403, detail="path outside of routing root")
+    if request.directory:
+        directory = _resolve_under(root, request.directory)
+        if directory is None:
+            raise HTTPException(status_code=403, detail="directory outside of routing root")
+        if not directory.is_dir():
+            raise HTTPException(status_code=404, detail="directory not found")
+
+    service = get_llm_routing_service()
+    results = service.route_documents(
+        _iter_paths(request, root),
+        concurrency=request.concurrency,
+        content_mode=request.content_mode,
+    )
+    return StreamingResponse(_ndjson(results), media_type=NDJSON)
@@ -0,0 +1,51 @@
+import logging
+
+from fastapi import APIRouter, File, HTTPException, UploadFile
+
+from app.core.config import settings
+from app.infrastructure.executor.executor import run_io
+from app.infrastructure.task_queue.task_queue_factory import TaskQueueFactory
+from app.infrastructure.upload.spooled_upload import save_upload
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.post("", status_code=202)
+async def enqueue_task(file: UploadFile = File(...), stream: bool = False):
+    """
+    업로드를 공유 spool 경로에 저장하고 ingest task 를 큐에 넣기만 한다.
+    실제 처리는 `python -m app.worker` 로 띄운 worker 가 담당.
+    """
+    upload = await save_upload(file, settings.TASK_QUEUE_SPOOL_DIR)
+    task_id = await run_io(
+        TaskQueueFactory.get_queue().enqueue,
+        {
+            "path": upload.path,
+            "filename": upload.filename,
+            "sha256": upload.sha256,
+            "stream": stream,
+        },
+    )
+    logger.info("ingest task enqueued -> %s (%s)", task_id, upload.filename)
+    return {"task_id": task_id}
+
+
+@router.get("/stats")
+async def task_stats():
+    return await run_io(TaskQueueFactory.get_queue().stats)
+
+
+@router.get("/dead-letters")
+async def dead_letters(limit: int = 100):
+    tasks = await run_io(TaskQueueFactory.get_queue().dead_letters, limit)
+    return [task.to_dict() for task in tasks]
+
+
+@router.get("/{task_id}")
+async def get_task(task_id: str):
+    task = await run_io(TaskQueueFactory.get_queue().get, task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="task not found")
+    return task.to_dict()
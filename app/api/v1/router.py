@@ -4,10 +4,16 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import health
 from app.api.pdf_controller import router as pdf_controller_router
+from app.api.job_controller import router as job_controller_router
+from app.api.task_controller import router as task_controller_router
+from app.api.routing_controller import router as routing_controller_router
 
 api_router = APIRouter()
 api_router.include_router(health.router, tags=["health"], prefix="/health")
 api_router.include_router(pdf_controller_router, tags=["pdf"], prefix="/pdf")
+api_router.include_router(job_controller_router, tags=["jobs"], prefix="/jobs")
+api_router.include_router(task_controller_router, tags=["tasks"], prefix="/tasks")
+api_router.include_router(routing_controller_router, tags=["routing"], prefix="/routing")
 
 # from fastapi import FastAPI
 # from app.api.v1.api import api_router   # 여기서 api_router import
@@ -0,0 +1,157 @@
+import hashlib
+import logging
+import uuid
+from collections import defaultdict
+from typing import Optional
+
+from langchain_core.documents import Document
+
+from app.domain.document.chunk.service.chunk_service import ChunkService
+from app.domain.document.entity.incremental_ingest_result import IncrementalIngestResult
+from app.domain.llm.embedding.openai_embeding_service import OpenAIEmbed
+from app.infrastructure.cache.ingest_cache import sha256_file
+from app.infrastructure.langchain.upsert import Upsert
+from app.infrastructure.qdrant.qdrant_langchain_repository import QdrantLangchainRepository
+from app.infrastructure.vector_store.vector_filter import VectorFilter
+from app.service.pdf_service import PdfService
+
+logger = logging.getLogger(__name__)
+
+# point id 생성용 namespace (doc_key/page/page_hash/순번 이 같으면 항상 같은 id)
+POINT_NAMESPACE = uuid.UUID("6f1c2d4e-8a7b-4c3d-9e5f-0a1b2c3d4e5f")
+
+DOC_KEY = "metadata.doc_key"
+PAGE = "metadata.page"
+PAGE_HASH = "metadata.page_hash"
+VERSION = "metadata.version"
+
+
+def page_fingerprint(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def point_id(doc_key: str, page: int, page_hash: str, seq: int) -> str:
+    return str(uuid.uuid5(POINT_NAMESPACE, f"{doc_key}:{page}:{page_hash}:{seq}"))
+
+
+class IncrementalIngestService:
+    """
+    페이지 단위 증분 재적재 (버전 ingest)
+    - 페이지 텍스트의 sha256 을 fingerprint 로 payload 에 저장
+    - 같은 doc_key 로 다시 들어오면 이전 fingerprint 와 비교해 바뀐 페이지만 청킹/임베딩/적재
+    - 바뀌었거나 사라진 페이지의 이전 point 는 payload filter 로 삭제 (새 버전 적재 후)
+
+    청크가 페이지를 넘지 않아야 페이지 단위 diff 가 성립하므로
+    분류/라우팅 없이 페이지 내부 청킹(chunk_stream)만 사용한다.
+    """
+
+    def __init__(
+        self,
+        collection: str = "test",
+        chunk_size: int = 800,
+        chunk_overlap: int = 150,
+        repository: Optional[QdrantLangchainRepository] = None,
+        upsert: Optional[Upsert] = None,
+    ):
+        self.collection = collection
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self._repository = repository
+        self._upsert = upsert
+
+    @property
+    def upsert(self) -> Upsert:
+        if self._upsert is None:
+            # 페이지 hash 로 이미 재사용 여부를 판단하고 stale point 를 지우므로 근사 중복 제거는 끈다
+            self._upsert = Upsert(OpenAIEmbed().embeddings, QdrantLangchainRepository, deduplicate=False)
+        return self._upsert
+
+    @property
+    def repository(self) -> QdrantLangchainRepository:
+        if self._repository is None:
+            self._repository = self.upsert.embed_repository
+        return self._repository
+
+    def execute_path(
+        self,
+        file_path: str,
+        filename: str,
+        doc_key: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> IncrementalIngestResult:
+        doc_key = doc_key or filename
+        version = version or sha256_file(file_path)
+
+        stream = PdfService().stream_parse(file_path, filename, doc_id=doc_key)
+        previous = self._previous_pages(doc_key, version)
+
+        docs: list[Document] = []
+        ids: list[str] = []
+        changed_pages: list[int] = []
+        reused_pages: list[int] = []
+
+        for page_index in range(stream.pages_count):
+            page = page_index + 1
+            text = stream.load_text(page_index)
+            page_hash = page_fingerprint(text)
+
+            # 이전 실행이 적재 후 삭제 전에 중단됐다면 hash 가 섞여 있으므로 변경으로 취급
+            if previous.get(page, {}).get("hashes") == {page_hash}:
+                reused_pages.append(page)
+                continue
+
+            changed_pages.append(page)
+            page_doc = stream.build_page(page_index, text)
+            page_doc.metadata.update({
+                "doc_key": doc_key,
+                "page_hash": page_hash,
+                "version": version,
+            })
+            for seq, d in enumerate(
+                ChunkService().chunk_stream([page_doc], self.chunk_size, self.chunk_overlap)
+            ):
+                docs.append(Document(page_content=d.content, metadata=d.metadata))
+                ids.append(point_id(doc_key, page, page_hash, seq))
+
+        removed_pages = [page for page in previous if page > stream.pages_count]
+        stale_pages = [page for page in changed_pages if page in previous] + removed_pages
+
+        if docs:
+            self.upsert.upsert(docs, self.collection, ids=ids)
+        if stale_pages:
+            # 이번 버전으로 새로 적재한 point 는 남기고 이전 버전만 지운다
+            self.repository.delete_by_filter(
+                self.collection,
+                [VectorFilter.match(DOC_KEY, doc_key), VectorFilter.match_any(PAGE, stale_pages)],
+                exclude=[VectorFilter.match(VERSION, version)],
+            )
+
+        result = IncrementalIngestResult(
+            doc_key=doc_key,
+            version=version,
+            pages_total=stream.pages_count,
+            pages_changed=len(changed_pages),
+            pages_reused=len(reused_pages),
+            pages_removed=len(removed_pages),
+            chunks_upserted=len(docs),
+            chunks_reused=sum(previous[page]["points"] for page in reused_pages),
+            # 중단된 이전 실행이 이미 이번 버전으로 적재한 point 는 exclude 로 남으므로 세지 않는다
+            chunks_deleted=sum(previous[page]["points"] - previous[page]["current"] for page in stale_pages),
+        )
+        logger.info("incremental ingest -> %s", result)
+        return result
+
+    def _previous_pages(self, doc_key: str, version: str) -> dict[int, dict]:
+        """이전에 적재된 doc_key 의 페이지별 fingerprint / point 수 (current: 이미 version 으로 적재된 point 수)."""
+        pages: dict[int, dict] = defaultdict(lambda: {"hashes": set(), "points": 0, "current": 0})
+        for payload in self.repository.scroll_payload(
+            self.collection,
+            [VectorFilter.match(DOC_KEY, doc_key)],
+            fields=[PAGE, PAGE_HASH, VERSION],
+        ):
+            metadata = payload.get("metadata", {})
+            page = pages[metadata.get("page")]
+            page["hashes"].add(metadata.get("page_hash"))
+            page["points"] += 1
+            page["current"] += metadata.get("version") == version
+        return dict(pages)
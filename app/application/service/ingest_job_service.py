@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+from app.application.service.parse_document_service import ParseDocumentService
+from app.core.config import settings
+from app.domain.job.entity.ingest_job import IngestJob, JobStatus
+from app.infrastructure.langchain.stage_callback import StageTimingCallback
+from app.infrastructure.upload.spooled_upload import SpooledUpload
+
+logger = logging.getLogger(__name__)
+
+# ParseDocumentService._build_chain 의 RunnableLambda name
+INGEST_STAGES = ("parse_pdf", "classify", "llama_parse", "full_chunk", "chunk", "upsert")
+
+
+class IngestJobService:
+    """
+    In-process ingest job 관리
+    - submit 은 job_id 만 돌려주고 파이프라인은 background task 로 실행
+    - 동시 실행 수는 semaphore 로 제한 (나머지는 PENDING 으로 대기)
+    - LCEL 단계별 시작/종료 시각을 job 에 기록
+    """
+
+    def __init__(
+        self,
+        parse_service: Optional[ParseDocumentService] = None,
+        concurrency: Optional[int] = None,
+        retention: Optional[int] = None,
+    ):
+        self._parse_service = parse_service
+        self._semaphore = asyncio.Semaphore(concurrency or settings.INGEST_JOB_CONCURRENCY)
+        self._retention = retention or settings.INGEST_JOB_RETENTION
+        self._jobs: "OrderedDict[str, IngestJob]" = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    @property
+    def parse_service(self) -> ParseDocumentService:
+        if self._parse_service is None:
+            self._parse_service = ParseDocumentService()
+        return self._parse_service
+
+    def submit(self, upload: SpooledUpload) -> IngestJob:
+        """upload 파일의 소유권은 job 으로 넘어간다 (종료 시 삭제)."""
+        job = IngestJob(job_id=uuid.uuid4().hex, filename=upload.filename)
+        self._jobs[job.job_id] = job
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job, upload))
+        self._evict()
+        return job
+
+    def get(self, job_id: str) -> Optional[IngestJob]:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[IngestJob]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        task = self._tasks.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+        return job
+
+    async def _run(self, job: IngestJob, upload: SpooledUpload):
+        try:
+            async with self._semaphore:
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+                job.chunk_count = await self.parse_service.aingest(
+                    upload.path,
+                    upload.filename,
+                    file_hash=upload.sha256,
+                    callbacks=[StageTimingCallback(job, INGEST_STAGES)],
+                )
+                job.status = JobStatus.SUCCEEDED
+        except asyncio.CancelledError:
+            # executor 에 이미 넘어간 작업은 중단되지 않지만 결과는 버린다
+            job.status = JobStatus.CANCELLED
+            logger.info("ingest job cancelled -> %s", job.job_id)
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            job.error = repr(e)
+            logger.exception("ingest job failed -> %s", job.job_id)
+        finally:
+            job.finished_at = time.time()
+            self._tasks.pop(job.job_id, None)
+            if os.path.exists(upload.path):
+                os.unlink(upload.path)
+
+    def _evict(self):
+        """완료된 job 중 오래된 것부터 retention 초과분을 버린다."""
+        overflow = len(self._jobs) - self._retention
+        if overflow <= 0:
+            return
+        for job_id in [j.job_id for j in self._jobs.values() if j.done][:overflow]:
+            del self._jobs[job_id]
+
+
+@lru_cache
+def get_ingest_job_service() -> IngestJobService:
+    return IngestJobService()
@@ -72,20 +72,30 @@
 
 # application/services/parse_document_service.py
 import logging
+import os
+from itertools import chain
+from typing import Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.runnables import RunnableLambda
 
 from app.infrastructure.langchain.langsmith import langsmith
 from app.infrastructure.langchain.upsert import Upsert
 from app.infrastructure.qdrant.qdrant_langchain_repository import QdrantLangchainRepository
-from app.service.pdf_service import PdfService
-from app.domain.llm.services.llm_client import LlmClient
-from app.domain.llm.prompt.prompt_registry import PromptRegistry
-from app.domain.document.rule.entity.document_classification import DocumentClassification
+from app.service.pdf_service import PdfService, PdfSource
+from app.domain.document.entity.documentinfo import DocumentInfo
 from app.domain.document.entity.document_type import DocumentType
 from app.domain.document.chunk.service.chunk_service import ChunkService
+from app.service.chunk.article_chunking_service import ArticleChunkingService
 from app.domain.document.services.llm_parse_service import LlamaParseService
+from app.domain.document.services.hybrid_parse_service import HybridParseService
+from app.domain.document.services.document_classifier_service import DocumentClassifierService
 from app.domain.llm.embedding.openai_embeding_service import OpenAIEmbed
 from app.infrastructure.qdrant.qdrant_repository import QdrantRepository
+from langchain_core.documents import Document
+from app.infrastructure.cache.ingest_cache import IngestCache, IngestCacheEntry, sha256_bytes, sha256_file
+from app.core.config import settings
+from app.infrastructure.executor.executor import run_cpu, run_io
 
 import json
 
@@ -101,22 +111,151 @@ class ParseDocumentService:
     - LCEL은 내부 구현
     """
 
-    def __init__(self):
+    def __init__(self, ingest_cache: Optional[IngestCache] = None):
         self._chain = self._build_chain()
+        self._cache = ingest_cache or IngestCache(
+            settings.INGEST_CACHE_DIR, settings.INGEST_PIPELINE_VERSION
+        )
 
     def execute(self, file_bytes: bytes, filename: str):
+        return self._execute(file_bytes, filename, sha256_bytes(file_bytes))
+
+    def execute_stream(self, file_bytes: bytes, filename: str):
+        return self._execute_stream(file_bytes, filename, sha256_bytes(file_bytes))
+
+    def execute_path(
+        self,
+        file_path: str,
+        filename: str,
+        file_hash: Optional[str] = None,
+        stream: bool = False,
+    ):
+        """
+        디스크에 spool 된 업로드 경로로 실행한다.
+        fitz / LlamaParse 모두 같은 경로를 직접 열어 bytes 를 메모리에 올리지 않는다.
+        """
+        file_hash = file_hash or sha256_file(file_path)
+        if stream:
+            return self._execute_stream(file_path, filename, file_hash)
+        return self._execute(file_path, filename, file_hash)
+
+    async def aexecute_path(
+        self,
+        file_path: str,
+        filename: str,
+        file_hash: Optional[str] = None,
+        stream: bool = False,
+    ):
+        """
+        execute_path 의 non-blocking 버전.
+        각 단계의 blocking 작업(fitz, LLM, LlamaParse, Qdrant)은 executor 레이어에서 실행된다.
+        """
+        if stream:
+            file_hash = file_hash or await run_io(sha256_file, file_path)
+            # 스트리밍 파이프라인은 generator 를 끝까지 소비해야 하므로 통째로 io 풀에서 실행
+            return await run_io(self._execute_stream, file_path, filename, file_hash)
+
+        await self.aingest(file_path, filename, file_hash)
+
+        return "ok"
+
+    async def aingest(
+        self,
+        file_path: str,
+        filename: str,
+        file_hash: Optional[str] = None,
+        callbacks: Optional[list[BaseCallbackHandler]] = None,
+    ) -> int:
+        """
+        비동기 ingest 후 upsert 된 청크 수를 반환한다.
+        callbacks 는 chain 에 그대로 전달된다 (job 의 단계별 진행 기록용).
+        """
+        file_hash = file_hash or await run_io(sha256_file, file_path)
+
+        langsmith("parse")
+        entry = await run_io(self._cache.get, file_hash)
+        if entry is not None:
+            logger.info("ingest cache hit -> %s (%s)", filename, file_hash)
+            return entry.chunk_count
+
+        result = await self._chain.ainvoke(
+            {
+                "source": file_path,
+                "filename": filename,
+                "doc_id": file_hash,
+            },
+            config={"callbacks": callbacks or []},
+        )
+        entry = self._cache_entry(result)
+        await run_io(self._cache.put, file_hash, entry)
+
+        return entry.chunk_count
+
+    def _execute(self, source: PdfSource, filename: str, file_hash: str):
         langsmith("parse")
+        # 같은 파일(같은 파이프라인 버전)이면 parse/classify/embed/upsert 전부 생략
+        if self._cache.get(file_hash) is not None:
+            logger.info("ingest cache hit -> %s (%s)", filename, file_hash)
+            return "ok"
+
         result = self._chain.invoke({
-            "file_bytes": file_bytes,
-            "filename": filename
+            "source": source,
+            "filename": filename,
+            "doc_id": file_hash,
         })
+        self._cache.put(file_hash, self._cache_entry(result))
 
         return "ok"
+
+    @staticmethod
+    def _cache_entry(result: dict) -> IngestCacheEntry:
+        return IngestCacheEntry(
+            document=result["doc"],
+            classification=result["classification"],
+            chunks=result["result"].child_documents or result["result"].documents,
+        )
+
+    def _execute_stream(self, source: PdfSource, filename: str, file_hash: str):
+        """
+        페이지 단위 스트리밍 모드.
+        parse → chunk → upsert 가 페이지가 도착하는 대로 이어져 메모리 사용량이 페이지 수와 무관하다.
+        """
+        langsmith("parse")
+        # 비스트림 / 스트림 어느 쪽으로 적재했든 같은 파일이면 생략
+        if self._cache.get(file_hash) is not None:
+            logger.info("ingest cache hit -> %s (%s)", filename, file_hash)
+            return "ok"
+
+        result = self._build_stream_chain().invoke({
+            "source": source,
+            "filename": filename,
+            "doc_id": file_hash,
+        })
+        logger.info("stream upsert count -> %s", result["upsert_count"])
+        # 청크는 모아두지 않으므로 적재 완료 marker (분류 + 적재 건수) 만 남긴다
+        self._cache.put(file_hash, IngestCacheEntry(
+            document=None,
+            classification=result["classification"],
+            upsert_count=result["upsert_count"],
+        ))
+
+        return "ok"
+
         # return self._chain.invoke({
         #     "file_bytes": file_bytes,
         #     "filename": filename
         # })
 
+    @staticmethod
+    def _llama_parse(source: PdfSource, filename: str, file_hash: Optional[str] = None) -> DocumentInfo:
+        if settings.LOCAL_PARSE_ENABLED:
+            # 품질 점검을 통과한 페이지는 로컬 markdown, 나머지 페이지만 LlamaParse
+            return HybridParseService().parse(source, filename)
+        # file_hash(업로드 sha256) 는 LlamaParse 캐시 key 로 그대로 쓴다
+        if isinstance(source, (str, os.PathLike)):
+            return LlamaParseService().parse_path(os.fspath(source), filename, file_hash)
+        return LlamaParseService().parse_bytes(source, filename, file_hash)
+
     # =================================================
     # LCEL 파이프라인은 private
     # =================================================
@@ -126,25 +265,153 @@ class ParseDocumentService:
             lambda x: {
                 **x,
                 "doc": PdfService().normal_parse(
-                    x["file_bytes"], x["filename"]
+                    x["source"], x["filename"], doc_id=x.get("doc_id")
                 )
-            }
+            },
+            afunc=self._aparse_pdf,
+            name="parse_pdf",
         )
 
         classify = RunnableLambda(
             lambda x: {
                 **x,
-                "classification": DocumentClassification(
-                    **json.loads(
-                        LlmClient().ask(
-                            PromptRegistry._first_document_classification_prompt(),
-                            x["doc"].get_route_doc()
+                # 규칙으로 확정되지 않은 문서만 LLM 분류
+                "classification": DocumentClassifierService().classify(x["doc"])
+            },
+            afunc=self._aclassify,
+            name="classify",
+        )
+
+        def router_fn(x):
+            doc_type = x["classification"].document_type
+
+            if doc_type == DocumentType.POLICY:
+                return RunnableLambda(
+                    lambda y: {
+                        **y,
+                        "result": ArticleChunkingService().chunk_with_summaries(
+                            self._llama_parse(y["source"], y["filename"], y.get("doc_id"))
                         )
-                    )
+                    },
+                    afunc=self._allama_parse,
+                    name="llama_parse",
+                )
+
+            if doc_type == DocumentType.MANUAL:
+                return RunnableLambda(
+                    lambda y: {
+                        **y,
+                        "result": ChunkService().chunk_by_type(y["doc"], doc_type, whole_document=True)
+                    },
+                    afunc=self._afull_chunk,
+                    name="full_chunk",
+                )
+
+            return RunnableLambda(
+                lambda y: {
+                    **y,
+                    "result": ChunkService().chunk_by_type(y["doc"], doc_type)
+                },
+                afunc=self._achunk,
+                name="chunk",
+            )
+
+        router = RunnableLambda(router_fn, name="route")
+
+        upsert = RunnableLambda(
+            lambda x:{
+                **x,
+                "upsert_document": Upsert(OpenAIEmbed().embeddings,QdrantLangchainRepository)
+                                        .upsert(
+                                                x["result"].get_upsert_document(),
+                                                # x["classification"].document_type,
+                                                "test",
+                                        )
+            },
+            afunc=self._aupsert,
+            name="upsert",
+        )
+
+        return (
+                parse_pdf
+                | classify
+                | router
+                | upsert
+        )
+
+    # =================================================
+    # async 단계 — blocking 작업은 executor 레이어로 dispatch
+    # (event loop 에서는 dict 조립만 한다)
+    # =================================================
+    async def _aparse_pdf(self, x):
+        return {
+            **x,
+            "doc": await run_cpu(
+                PdfService().normal_parse,
+                x["source"], x["filename"], doc_id=x.get("doc_id"),
+            )
+        }
+
+    async def _aclassify(self, x):
+        return {
+            **x,
+            "classification": await run_io(DocumentClassifierService().classify, x["doc"])
+        }
+
+    async def _allama_parse(self, y):
+        return {
+            **y,
+            "result": await ArticleChunkingService().achunk(
+                await run_io(self._llama_parse, y["source"], y["filename"], y.get("doc_id"))
+            )
+        }
+
+    async def _afull_chunk(self, y):
+        return {
+            **y,
+            "result": await run_cpu(
+                ChunkService().chunk_by_type, y["doc"], y["classification"].document_type, True
+            )
+        }
+
+    async def _achunk(self, y):
+        return {
+            **y,
+            "result": await run_cpu(
+                ChunkService().chunk_by_type, y["doc"], y["classification"].document_type
+            )
+        }
+
+    async def _aupsert(self, x):
+        return {
+            **x,
+            "upsert_document": await run_io(
+                lambda: Upsert(OpenAIEmbed().embeddings, QdrantLangchainRepository).upsert(
+                    x["result"].get_upsert_document(),
+                    "test",
+                )
+            )
+        }
+
+    def _build_stream_chain(self):
+
+        parse_pdf = RunnableLambda(
+            lambda x: {
+                **x,
+                "doc": PdfService().stream_parse(
+                    x["source"], x["filename"], doc_id=x.get("doc_id")
                 )
             }
         )
 
+        classify = RunnableLambda(
+            lambda x: {
+                **x,
+                # 규칙으로 확정되지 않은 문서만 LLM 분류
+                "classification": DocumentClassifierService().classify(x["doc"])
+            }
+        )
+
         def router_fn(x):
             doc_type = x["classification"].document_type
 
@@ -152,8 +419,13 @@ class ParseDocumentService:
                 return RunnableLambda(
                     lambda y: {
                         **y,
-                        "result": LlamaParseService().parse_bytes(
-                            y["file_bytes"], y["filename"]
+                        # 페이지 + 조(parent) / 항(child) — 비스트림 경로의 get_upsert_document 와 같은 구성
+                        "documents": (
+                            lambda info: chain(info.documents, info.child_documents)
+                        )(
+                            ArticleChunkingService().chunk_with_summaries(
+                                self._llama_parse(y["source"], y["filename"], y.get("doc_id"))
+                            )
                         )
                     }
                 )
@@ -162,15 +434,23 @@ class ParseDocumentService:
                 return RunnableLambda(
                     lambda y: {
                         **y,
-                        "result": ChunkService().full_chunk(y["doc"])
+                        "documents": ChunkService().full_chunk_stream(y["doc"])
+                    }
+                )
+
+            if settings.CHUNK_SIZE_UNIT == "token":
+                return RunnableLambda(
+                    lambda y: {
+                        **y,
+                        "documents": ChunkService().token_chunk_stream(y["doc"].iter_pages(), doc_type)
                     }
                 )
 
             return RunnableLambda(
                 lambda y: {
                     **y,
-                    "result": ChunkService().chunk(
-                        y["doc"], 800, 150
+                    "documents": ChunkService().chunk_stream(
+                        y["doc"].iter_pages(), 800, 150
                     )
                 }
             )
@@ -180,10 +460,12 @@ class ParseDocumentService:
         upsert = RunnableLambda(
             lambda x:{
                 **x,
-                "upsert_document": Upsert(OpenAIEmbed().embeddings,QdrantLangchainRepository)
-                                        .upsert(
-                                                x["result"].get_upsert_document(),
-                                                # x["classification"].document_type,
+                "upsert_count": Upsert(OpenAIEmbed().embeddings,QdrantLangchainRepository)
+                                        .upsert_stream(
+                                                (
+                                                    Document(page_content=d.content, metadata=d.metadata)
+                                                    for d in x["documents"]
+                                                ),
                                                 "test",
                                         )
             }
@@ -15,6 +15,7 @@ from langchain_core.prompts import ChatPromptTemplate
 
 from app.infrastructure.vector_store.vector_db import VectorDB
 from app.infrastructure.vector_store.vector_filter import VectorFilter
+from app.infrastructure.executor.executor import run_io
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,23 @@ class QuestionService:
             "question": question,
         })
 
+    async def aexecute(self, question:str):
+        """
+        execute 의 non-blocking 버전.
+        retriever + LLM filter 는 io executor 에서, 최종 답변은 ChatOpenAI.ainvoke 로 실행한다.
+        """
+        langsmith("question")
+        return await self._chain.ainvoke({
+            "question": question,
+        })
+
+    async def _acompress_doc(self, x):
+        docs = await run_io(self.compression.invoke, x["question"])
+        return {
+            **x,
+            "tool_outputs": self.normalize_docs(docs)
+        }
+
     def normalize_docs(self,docs):
         return [
             {
@@ -59,7 +77,8 @@ class QuestionService:
             lambda x:{
                 **x,
                 "tool_outputs" : self.normalize_docs(self.compression.invoke(x["question"]))
-            }
+            },
+            afunc=self._acompress_doc,
         )
 
         build_payload = RunnableLambda(PromptRegistry.basic_prompt)
@@ -1,7 +1,7 @@
 """Application settings and configuration."""
 
 from functools import lru_cache
-from typing import List
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings   # ✅ 최신 버전용
 from pydantic import Field
 
@@ -25,6 +25,111 @@ class Settings(BaseSettings):
     LANGCHAIN_API_KEY: str = Field(default="")
     LANGCHAIN_PROJECT: str = Field(default="")
 
+    # PDF 추출 설정
+    PDF_EXTRACT_WORKERS: int = Field(default=4, description="병렬 페이지 추출 worker 수")
+    PDF_PAGE_RANGE_SIZE: int = Field(default=50, description="worker 하나가 처리할 페이지 수")
+    IMAGE_EXTRACTION_MODE: str = Field(default="metadata", description="이미지 추출 모드 (off | metadata | persist)")
+    IMAGE_STORE_DIR: str = Field(default="data/images", description="persist 모드 이미지 저장 경로")
+
+    # 로컬 파싱 triage 설정 (통과 못 한 페이지만 LlamaParse)
+    LOCAL_PARSE_ENABLED: bool = Field(default=True, description="POLICY 문서 로컬 fast-path 사용 여부")
+    TRIAGE_MIN_TEXT_CHARS: int = Field(default=30, description="text layer 로 인정하는 최소 글자 수")
+    TRIAGE_MAX_IMAGE_RATIO: float = Field(default=0.5, description="허용 이미지 면적 비율")
+    TRIAGE_MAX_TABLE_RATIO: float = Field(default=0.6, description="허용 표 면적 비율")
+    TRIAGE_MAX_BROKEN_RATE: float = Field(default=0.7, description="허용 깨진 문장 비율")
+
+    # LlamaParse 분할 업로드 설정
+    LLAMA_PARSE_PAGE_RANGE_SIZE: int = Field(default=50, description="sub-PDF 하나의 페이지 수 (0 이면 분할 안 함)")
+    LLAMA_PARSE_CONCURRENCY: int = Field(default=4, description="동시에 업로드하는 sub-PDF 수")
+
+    # LlamaParse 결과 캐시 설정
+    LLAMA_PARSE_CACHE_ENABLED: bool = Field(default=True, description="LlamaParse 결과 캐시 사용 여부")
+    LLAMA_PARSE_CACHE_PATH: str = Field(default="data/llama_parse_cache.db", description="LlamaParse 캐시 db 경로")
+    LLAMA_PARSE_CACHE_MAX_BYTES: int = Field(default=1024 * 1024 * 1024, description="캐시 최대 크기 (LRU)")
+    LLAMA_PARSE_CACHE_TTL: float = Field(default=30 * 24 * 3600, description="캐시 유효 시간(초)")
+
+    # 문서 라우팅 설정
+    ROUTING_CONTENT_MODE: str = Field(default="sample", description="라우팅 내용 추출 방식 (sample | full_parse)")
+    ROUTING_CONCURRENCY: int = Field(default=8, description="일괄 라우팅 동시 처리 파일 수")
+    ROUTING_PATH_ROOT: Optional[str] = Field(default=None, description="/routing/batch/paths 가 읽을 수 있는 서버 디렉터리 (None 이면 비활성)")
+
+    # 임베딩 centroid 분류기 설정
+    # 정확도 평가(benchmarks/centroid_classifier_eval.py) 결과가 나오기 전까지는 끈다
+    CENTROID_CLASSIFIER_ENABLED: bool = Field(default=False, description="LLM 전에 임베딩 centroid 분류 사용 여부")
+    CENTROID_MARGIN_THRESHOLD: float = Field(default=0.03, description="top-2 유사도 차이가 이보다 작으면 LLM 호출")
+    CENTROID_MIN_SIMILARITY: float = Field(default=0.3, description="top-1 유사도가 이보다 낮으면 abstain 후 LLM 호출")
+    CENTROID_EXAMPLES_DIR: str = Field(default="data/classifier_examples", description="label 예시(JSONL) 경로")
+
+    # Ingest 캐시 설정
+    INGEST_CACHE_DIR: str = Field(default="data/ingest_cache", description="ingest 결과 캐시 경로")
+    INGEST_PIPELINE_VERSION: str = Field(default="4", description="파이프라인 변경 시 올려서 캐시 무효화")
+
+    # Executor 설정
+    IO_EXECUTOR_WORKERS: int = Field(default=16, description="blocking I/O 스레드 풀 크기")
+    CPU_EXECUTOR_WORKERS: int = Field(default=2, description="CPU-bound 프로세스 풀 크기")
+    DOC_PREPROCESS_PARALLEL_MIN_CHARS: int = Field(
+        default=1_000_000, description="Doc.from_many 가 프로세스 풀을 쓰기 시작하는 전체 텍스트 길이"
+    )
+
+    # 반복 머리글/바닥글 제거 설정
+    BOILERPLATE_STRIP_ENABLED: bool = Field(default=True, description="페이지마다 반복되는 머리/꼬리 줄 제거 여부")
+    BOILERPLATE_EDGE_LINES: int = Field(default=3, description="페이지 위/아래에서 검사하는 줄 수")
+    BOILERPLATE_MIN_PAGES: int = Field(default=3, description="boilerplate 로 판단하는 최소 반복 페이지 수")
+    BOILERPLATE_MIN_RATIO: float = Field(default=0.5, description="boilerplate 로 판단하는 최소 반복 페이지 비율")
+
+    # 근사 중복 청크 제거 설정 (MinHash LSH)
+    DEDUP_ENABLED: bool = Field(default=False, description="적재 전 근사 중복 청크 제거 여부")
+    DEDUP_MODE: str = Field(
+        default="skip", description="중복 청크 처리 방식 (skip: 버림 / alias: 출처를 원본 point 의 metadata.aliases 에 합침)"
+    )
+    DEDUP_THRESHOLD: float = Field(default=0.9, description="중복으로 판단하는 추정 Jaccard 유사도")
+    DEDUP_NUM_PERM: int = Field(default=128, description="MinHash permutation 수")
+    DEDUP_SHINGLE_SIZE: int = Field(default=5, description="문자 shingle 길이")
+    DEDUP_MIN_CHARS: int = Field(default=50, description="이보다 짧은 청크는 중복 검사 생략")
+    DEDUP_INDEX_DIR: str = Field(default="data/dedup", description="컬렉션별 dedup 인덱스 경로")
+
+    # 청크 크기 설정 (토큰 기준)
+    CHUNK_SIZE_UNIT: str = Field(default="token", description="청크 크기 단위 (token / char)")
+    TOKENIZER_ENCODING: str = Field(default="cl100k_base", description="토큰 수 계산용 tiktoken encoding")
+    CHUNK_MAX_TOKENS: int = Field(default=512, description="문서 유형별 설정이 없을 때 청크 최대 토큰 수")
+    CHUNK_OVERLAP_TOKENS: int = Field(default=64, description="청크 간 겹치는 최대 토큰 수")
+    CHUNK_TOKEN_LIMITS: Dict[str, int] = Field(
+        default_factory=lambda: {"procedure": 384, "policy": 512, "manual": 768, "report": 512},
+        description="DocumentType 별 청크 최대 토큰 수",
+    )
+
+    # 형태소 분석 설정
+    KIWI_NUM_WORKERS: int = Field(default=-1, description="Kiwi batch 분석 스레드 수 (-1 = 전체 코어)")
+
+    # 조문(POLICY) 청킹 설정
+    ARTICLE_MIN_CLAUSE_TOKENS: int = Field(default=64, description="이보다 짧은 항은 이웃 항과 합침")
+    ARTICLE_SUMMARY_ENABLED: bool = Field(default=False, description="조 단위 요약 청크 생성 여부")
+    ARTICLE_SUMMARY_CONCURRENCY: int = Field(default=8, description="조 요약 동시 LLM 호출 수")
+
+    # Semantic chunking 설정
+    SEMANTIC_CHUNK_THRESHOLD_TYPE: str = Field(default="percentile", description="breakpoint 기준 (percentile / standard_deviation / interquartile / gradient)")
+    SEMANTIC_CHUNK_THRESHOLD_AMOUNT: Optional[float] = Field(default=None, description="breakpoint 임계값 (None 이면 기준별 기본값)")
+    SEMANTIC_CHUNK_BUFFER_SIZE: int = Field(default=1, description="문장 임베딩 시 앞뒤로 붙이는 문장 수")
+    SEMANTIC_CHUNK_SENTENCE_SPLITTER: str = Field(default="kiwi", description="문장 분할 방식 (kiwi / regex)")
+    SEMANTIC_CHUNK_DERIVE_VECTORS: bool = Field(default=True, description="청크 벡터를 문장 벡터 평균으로 만들어 재임베딩 생략")
+    EMBEDDING_CACHE_ENABLED: bool = Field(default=True, description="임베딩 디스크 캐시 사용 여부")
+    EMBEDDING_CACHE_PATH: str = Field(default="data/embedding_cache.db", description="임베딩 캐시 db 경로")
+    EMBEDDING_BATCH_SIZE: int = Field(default=256, description="캐시 miss 임베딩 요청 batch 크기")
+
+    # Ingest job 설정
+    INGEST_JOB_CONCURRENCY: int = Field(default=2, description="동시에 실행되는 ingest job 수")
+    INGEST_JOB_SPOOL_DIR: str = Field(default="data/jobs", description="job 업로드 보관 경로")
+    INGEST_JOB_RETENTION: int = Field(default=1000, description="메모리에 보관하는 완료 job 수")
+
+    # Task queue 설정 (ingest worker)
+    TASK_QUEUE_TYPE: str = Field(default="sqlite", description="작업 큐 backend (sqlite)")
+    TASK_QUEUE_SQLITE_PATH: str = Field(default="data/task_queue.db", description="sqlite 작업 큐 경로")
+    TASK_QUEUE_SPOOL_DIR: str = Field(default="data/queue", description="큐에 넣은 업로드 보관 경로 (worker 와 공유)")
+    TASK_QUEUE_VISIBILITY_TIMEOUT: float = Field(default=900.0, description="ack 없이 재전달되기까지의 시간(초)")
+    TASK_QUEUE_MAX_ATTEMPTS: int = Field(default=3, description="dead-letter 로 옮기기 전 최대 시도 횟수")
+    TASK_QUEUE_RETRY_DELAY: float = Field(default=30.0, description="실패 후 재시도 지연(초), 시도마다 배수 증가")
+    TASK_QUEUE_POLL_INTERVAL: float = Field(default=1.0, description="큐가 비었을 때 worker polling 간격(초)")
+
     model_config = {
         "env_file": ".env", 
         "env_file_encoding": "utf-8",
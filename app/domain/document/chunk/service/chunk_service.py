@@ -1,5 +1,13 @@
+from typing import Iterable, Iterator, Optional
+
+from app.core.config import settings
+from app.domain.document.chunk.service.token_chunker import TokenChunker, token_limits
+from app.domain.document.entity.chunk_span import ChunkSource, ChunkSpan, split_spans
 from app.domain.document.entity.doc import Doc
 from app.domain.document.entity.documentinfo import DocumentInfo
+from app.domain.document.entity.document_stream import DocumentStream
+from app.domain.document.entity.document_type import DocumentType
+from app.service.chunk.parser.text_parseprocessor import TextParseProcessor
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 import logging
 
@@ -10,23 +18,20 @@ class ChunkService:
         pass
 
 
-    def full_chunk(self,doc:DocumentInfo)-> DocumentInfo:
+    def full_chunk(self,doc:DocumentInfo,chunk_size=1500,chunk_overlap=200)-> DocumentInfo:
         splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1500,
-            chunk_overlap=200,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
             separators=["\n\n", "\n", ".", " ", ""],
         )
-        texts = splitter.split_text(doc.content)
-        metadata = doc.metadata
-        metadata["total_chunks"] = len(texts)
-        doc_list:list[Doc] = []
-        for idx,text in enumerate(texts):
-            metadata["chunk_index"] = idx
-            metadata["role"] = "child"
-            doc_list.append(
-                Doc.from_document_pdf(text, metadata)
-            )
-        doc.set_child_document(doc_list)
+        # DocumentInfo.content 는 파서 원문이므로 문서 전체를 한 번 정규화한 뒤 그 위치로 자른다
+        # (doc.metadata 는 문서 헤더로 공유만 하고 수정하지 않음)
+        source = ChunkSource(TextParseProcessor.normalize(doc.content), doc.metadata)
+        spans = split_spans(splitter, source, chunk_overlap)
+        doc.set_child_document([
+            ChunkSpan(span_source, start, end, chunk_index=idx, total_chunks=len(spans))
+            for idx, (span_source, start, end) in enumerate(spans)
+        ])
         return doc
 
     def chunk(self,doc:DocumentInfo,chunk_size,chunk_overlap) -> DocumentInfo:
@@ -36,16 +41,111 @@ class ChunkService:
             separators=["\n\n", "\n", ".", " ", ""],
         )
 
-        chunks = splitter.split_documents(doc.get_upsert_document())
-        doc_list:list[Doc] = []
-        for idx, chunk in enumerate(chunks):
-            chunk.metadata["chunk_index"] = idx
-            chunk.metadata["role"] = "child"
-            chunk.metadata["total_chunks"] = len(chunks)
-            doc_list.append(
-                Doc.from_document_pdf(chunk.page_content, chunk.metadata)
-            )
-        doc.set_child_document(doc_list)
+        spans: list[tuple[ChunkSource, int, int]] = []
+        for d in [*doc.documents, *doc.child_documents]:
+            # 정규화되지 않은 Doc 만 여기서 전처리한다
+            content = d.content if d.normalized else TextParseProcessor.normalize(d.content)
+            spans.extend(split_spans(splitter, ChunkSource(content, d.metadata), chunk_overlap))
+
+        doc.set_child_document([
+            ChunkSpan(source, start, end, chunk_index=idx, total_chunks=len(spans))
+            for idx, (source, start, end) in enumerate(spans)
+        ])
+        return doc
+
+    # =================================================
+    # 토큰 기준 청킹
+    # =================================================
+    def chunk_by_type(self, doc: DocumentInfo, document_type: Optional[DocumentType] = None, whole_document: bool = False) -> DocumentInfo:
+        """
+        CHUNK_SIZE_UNIT 설정에 따라 토큰 기준(token_chunk) 또는 기존 글자 기준(full_chunk / chunk)으로 자른다.
+        whole_document=True 는 페이지 경계를 무시하고 문서 전체를 이어서 자른다 (full_chunk 와 같은 방식).
+        """
+        if settings.CHUNK_SIZE_UNIT == "token":
+            return self.token_chunk(doc, document_type, whole_document)
+        if whole_document:
+            return self.full_chunk(doc)
+        return self.chunk(doc, 800, 150)
+
+    def token_chunk(self, doc: DocumentInfo, document_type: Optional[DocumentType] = None, whole_document: bool = False) -> DocumentInfo:
+        max_tokens, overlap_tokens = token_limits(document_type)
+        chunker = TokenChunker(max_tokens, overlap_tokens)
+
+        if whole_document:
+            sources = [ChunkSource(TextParseProcessor.normalize(doc.content), doc.metadata)]
+        else:
+            sources = [
+                ChunkSource(d.content if d.normalized else TextParseProcessor.normalize(d.content), d.metadata)
+                for d in [*doc.documents, *doc.child_documents]
+            ]
+
+        spans = [(source, start, end, tokens) for source in sources for start, end, tokens in chunker.split(source.content)]
+        doc.set_child_document([
+            ChunkSpan(source, start, end, chunk_index=idx, total_chunks=len(spans), tokens=tokens)
+            for idx, (source, start, end, tokens) in enumerate(spans)
+        ])
         return doc
 
+    def token_chunk_stream(self, pages: Iterable[Doc], document_type: Optional[DocumentType] = None) -> Iterator[Doc]:
+        """chunk_stream() 의 토큰 기준 버전."""
+        max_tokens, overlap_tokens = token_limits(document_type)
+        chunker = TokenChunker(max_tokens, overlap_tokens)
+        idx = 0
+        for page in pages:
+            yield page
+            source = ChunkSource(page.content if page.normalized else TextParseProcessor.normalize(page.content), page.metadata)
+            for start, end, tokens in chunker.split(source.content):
+                yield ChunkSpan(source, start, end, chunk_index=idx, tokens=tokens)
+                idx += 1
+
+    # =================================================
+    # 스트리밍 청킹 — 페이지가 도착하는 대로 소비
+    # =================================================
+    def chunk_stream(self, pages: Iterable[Doc], chunk_size, chunk_overlap) -> Iterator[Doc]:
+        """
+        chunk() 의 스트리밍 버전.
+        페이지 Doc 과 그 페이지의 child 청크를 순서대로 흘려보낸다.
+        (전체 청크 수를 미리 알 수 없으므로 total_chunks 는 기록하지 않음)
+        """
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            separators=["\n\n", "\n", ".", " ", ""],
+        )
+        idx = 0
+        for page in pages:
+            yield page
+            content = page.content if page.normalized else TextParseProcessor.normalize(page.content)
+            for source, start, end in split_spans(splitter, ChunkSource(content, page.metadata), chunk_overlap):
+                yield ChunkSpan(source, start, end, chunk_index=idx)
+                idx += 1
+
+    def full_chunk_stream(self, doc: DocumentStream, chunk_size=1500, chunk_overlap=200) -> Iterator[Doc]:
+        """
+        full_chunk() 의 스트리밍 버전.
+        페이지 경계를 넘는 청크를 위해 마지막 조각만 다음 페이지로 이월한다.
+        """
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            separators=["\n\n", "\n", ".", " ", ""],
+        )
+        idx = 0
+        carry = ""
+        for page_index in range(doc.pages_count):
+            text = doc.page_text(page_index)
+            yield doc.build_page(page_index, text)
+
+            texts = splitter.split_text(carry + text + "\n")
+            carry = texts.pop() if texts else ""
+            for chunk_text in texts:
+                yield self._stream_child(chunk_text, doc.metadata, idx)
+                idx += 1
+
+        for chunk_text in splitter.split_text(carry):
+            yield self._stream_child(chunk_text, doc.metadata, idx)
+            idx += 1
+
+    def _stream_child(self, text: str, metadata: dict, idx: int) -> Doc:
+        return Doc.from_document_pdf(text, {**metadata, "chunk_index": idx, "role": "child"})
 
@@ -0,0 +1,133 @@
+import re
+from functools import lru_cache
+from typing import Callable, Iterator, Optional
+
+from app.core.config import settings
+from app.domain.document.entity.document_type import DocumentType
+
+# 문단 -> 줄 -> 문장 순서로 잘게 나눈다 (그래도 크면 글자 단위로 자름)
+_PARAGRAPH = re.compile(r"\n\s*\n")
+_LINE = re.compile(r"\n")
+_SENTENCE = re.compile(r"(?<=[.!?다요])\s+")
+_LEVELS = [_PARAGRAPH, _LINE, _SENTENCE]
+
+
+@lru_cache(maxsize=None)
+def get_encoder(encoding_name: Optional[str] = None):
+    """프로세스마다 한 번만 tiktoken encoding 을 로딩한다 (process-pool worker 포함)."""
+    import tiktoken
+
+    return tiktoken.get_encoding(encoding_name or settings.TOKENIZER_ENCODING)
+
+
+def count_tokens(text: str) -> int:
+    return len(get_encoder().encode(text, disallowed_special=()))
+
+
+def token_limits(document_type: Optional[DocumentType] = None) -> tuple[int, int]:
+    """(청크 최대 토큰, overlap 토큰). CHUNK_TOKEN_LIMITS 에 없는 유형은 CHUNK_MAX_TOKENS."""
+    key = getattr(document_type, "value", document_type)
+    max_tokens = settings.CHUNK_TOKEN_LIMITS.get(key, settings.CHUNK_MAX_TOKENS) if key else settings.CHUNK_MAX_TOKENS
+    return max_tokens, min(settings.CHUNK_OVERLAP_TOKENS, max_tokens // 4)
+
+
+def _pieces(text: str, start: int, end: int, pattern: re.Pattern) -> list[tuple[int, int]]:
+    """text[start:end] 를 pattern 기준으로 나눈 (start, end) 목록 (양끝 공백 제외, 빈 조각 제외)."""
+    pieces = []
+    pos = start
+    for match in pattern.finditer(text, start, end):
+        pieces.append((pos, match.start()))
+        pos = match.end()
+    pieces.append((pos, end))
+
+    result = []
+    for s, e in pieces:
+        while s < e and text[s].isspace():
+            s += 1
+        while e > s and text[e - 1].isspace():
+            e -= 1
+        if s < e:
+            result.append((s, e))
+    return result
+
+
+class TokenChunker:
+    """
+    토큰 수 기준 청커. 결과는 원문 위치 (start, end, tokens) 라 ChunkSpan 으로 바로 쓸 수 있다.
+    - 문단을 한 번씩만 encode 하고, 토큰 수를 더해가며 max_tokens 까지 묶는다 (커지는 buffer 를 다시 encode 하지 않음)
+    - max_tokens 보다 큰 문단만 줄 / 문장 / 글자 단위로 더 나눠 encode 한다
+    - overlap 은 직전 청크 끝의 단위(문단/문장)를 overlap_tokens 안에서 다음 청크 앞에 다시 포함
+    - 단위 사이 구분자는 sep_tokens 로 어림하므로 실제 토큰 수와 몇 토큰 차이날 수 있다
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        overlap_tokens: int = 0,
+        count: Optional[Callable[[str], int]] = None,
+        sep_tokens: int = 1,
+    ):
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.count = count or count_tokens
+        self.sep_tokens = sep_tokens
+
+    def _units(self, text: str, start: int, end: int, level: int) -> Iterator[tuple[int, int, int]]:
+        tokens = self.count(text[start:end])
+        if tokens <= self.max_tokens:
+            yield start, end, tokens
+            return
+
+        while level < len(_LEVELS):
+            pieces = _pieces(text, start, end, _LEVELS[level])
+            level += 1
+            if len(pieces) > 1:
+                for s, e in pieces:
+                    yield from self._units(text, s, e, level)
+                return
+        yield from self._hard_split(text, start, end, tokens)
+
+    def _hard_split(self, text: str, start: int, end: int, tokens: int) -> Iterator[tuple[int, int, int]]:
+        """구분자가 없는 긴 조각은 글자/토큰 비율로 자르고, 넘치면 줄여서 다시 잰다."""
+        size = max(1, int((end - start) * self.max_tokens / tokens * 0.9))
+        pos = start
+        while pos < end:
+            stop = min(pos + size, end)
+            n = self.count(text[pos:stop])
+            while n > self.max_tokens and stop - pos > 1:
+                stop = pos + max(1, int((stop - pos) * self.max_tokens / n * 0.9))
+                n = self.count(text[pos:stop])
+            yield pos, stop, n
+            pos = stop
+
+    def split(self, text: str) -> list[tuple[int, int, int]]:
+        chunks: list[tuple[int, int, int]] = []
+        window: list[tuple[int, int, int]] = []
+        window_tokens = 0
+
+        for s, e in _pieces(text, 0, len(text), _PARAGRAPH):
+            for unit in self._units(text, s, e, level=1):
+                n = unit[2]
+                if window and window_tokens + self.sep_tokens + n > self.max_tokens:
+                    chunks.append((window[0][0], window[-1][1], window_tokens))
+                    window, window_tokens = self._overlap(window, n)
+                window_tokens += n + (self.sep_tokens if window else 0)
+                window.append(unit)
+
+        if window:
+            chunks.append((window[0][0], window[-1][1], window_tokens))
+        return chunks
+
+    def _overlap(self, window: list[tuple[int, int, int]], incoming: int) -> tuple[list, int]:
+        """직전 청크 끝에서 overlap_tokens 이내이고 다음 단위가 들어갈 자리가 남는 만큼만 넘긴다."""
+        carry: list[tuple[int, int, int]] = []
+        carry_tokens = 0
+        for unit in reversed(window):
+            extra = unit[2] + (self.sep_tokens if carry else 0)
+            if carry_tokens + extra > self.overlap_tokens:
+                break
+            if carry_tokens + extra + self.sep_tokens + incoming > self.max_tokens:
+                break
+            carry.insert(0, unit)
+            carry_tokens += extra
+        return carry, carry_tokens
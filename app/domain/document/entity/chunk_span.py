@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from langchain_core.documents import Document
+
+from app.domain.document.entity.doc import Doc
+
+
+@dataclass(eq=False)
+class ChunkSource:
+    """
+    청크들이 함께 참조하는 원문 + 문서 헤더 metadata.
+    청크마다 텍스트/metadata 를 복사하지 않도록 하나만 두고, 절대 수정하지 않는다.
+    """
+    content: str
+    metadata: dict[str, Any]
+
+
+@dataclass(slots=True)
+class ChunkSpan:
+    """
+    ChunkSource.content[start:end] 를 가리키는 청크.
+    - content / metadata 는 접근할 때(임베딩, 직렬화) 만들어진다
+    - Doc 과 같은 content / metadata / normalized 를 제공하므로 Doc 자리에 그대로 쓸 수 있다
+    """
+    source: ChunkSource
+    start: int
+    end: int
+    chunk_index: int
+    total_chunks: Optional[int] = None
+    tokens: Optional[int] = None
+    normalized: bool = True
+
+    @property
+    def content(self) -> str:
+        return self.source.content[self.start:self.end]
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        metadata = {**self.source.metadata, "chunk_index": self.chunk_index, "role": "child"}
+        if self.total_chunks is not None:
+            metadata["total_chunks"] = self.total_chunks
+        if self.tokens is not None:
+            metadata["tokens"] = self.tokens
+        return metadata
+
+    def to_doc(self) -> Doc:
+        return Doc.from_normalized(self.content, self.metadata)
+
+    def to_document(self) -> Document:
+        return Document(page_content=self.content, metadata=self.metadata)
+
+
+def split_spans(splitter, source: ChunkSource, chunk_overlap: int) -> list[tuple[ChunkSource, int, int]]:
+    """
+    splitter.split_text 결과를 source.content 안의 (source, start, end) 로 바꾼다.
+    langchain create_documents(add_start_index) 와 같은 방식으로 직전 청크 뒤에서부터 찾고,
+    원문에서 찾을 수 없는 조각(splitter 가 텍스트를 바꾼 경우)만 자기 자신을 source 로 둔다.
+    """
+    text = source.content
+    spans: list[tuple[ChunkSource, int, int]] = []
+    index, previous_len = 0, 0
+    for piece in splitter.split_text(text):
+        start = text.find(piece, max(0, index + previous_len - chunk_overlap))
+        if start == -1:
+            spans.append((ChunkSource(piece, source.metadata), 0, len(piece)))
+            continue
+        spans.append((source, start, start + len(piece)))
+        index, previous_len = start, len(piece)
+    return spans
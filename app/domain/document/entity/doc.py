@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Optional
 from llama_index.core.schema import Document
 
 
+from app.core.config import settings
+from app.service.chunk.parser.boilerplate_index import BoilerplateIndex
 from app.service.chunk.parser.text_parseprocessor import TextParseProcessor
 
 
@@ -12,18 +14,52 @@ from app.service.chunk.parser.text_parseprocessor import TextParseProcessor
 class Doc:
     content:str
     metadata:dict[str, Any]
+    # content 가 이미 TextParseProcessor 로 정규화되었는지 (청킹 단계에서 중복 전처리 방지)
+    normalized: bool = False
 
 
     @classmethod
     def from_document(cls,document:Document)->Doc:
-        text_parser = TextParseProcessor()
-        # parse_content = text_parser.preprocess_text(document.text)
-        parse_content = text_parser.preprocess_text(document.text)
-        return cls(content=parse_content,metadata=document.metadata)
+        parse_content = TextParseProcessor.normalize(document.text)
+        return cls(content=parse_content,metadata=document.metadata,normalized=True)
 
     @classmethod
     def from_document_pdf(cls,content:str,metadata:dict)->Doc:
-        text_parser = TextParseProcessor()
-        parse_content = text_parser.preprocess_text(content)
-        return cls(content=parse_content,metadata=metadata)
+        parse_content = TextParseProcessor.normalize(content)
+        return cls(content=parse_content,metadata=metadata,normalized=True)
 
+    @classmethod
+    def from_normalized(cls, content: str, metadata: dict) -> Doc:
+        """이미 정규화된 텍스트(정규화된 페이지에서 잘라낸 청크 등)는 다시 전처리하지 않는다."""
+        return cls(content=content, metadata=metadata, normalized=True)
+
+    @classmethod
+    def from_many(
+        cls,
+        items: Iterable[tuple[str, dict]],
+        parallel: bool = False,
+        chunksize: int = 8,
+        boilerplate: Optional[BoilerplateIndex] = None,
+    ) -> list[Doc]:
+        """
+        (text, metadata) 목록을 한 번에 전처리한다.
+        parallel=True 이고 전체 길이가 DOC_PREPROCESS_PARALLEL_MIN_CHARS 이상이면
+        CPU 프로세스 풀에서 나눠 처리한다 (짧은 배치는 pickle 비용이 더 커서 직렬 처리).
+        boilerplate 가 있으면 items 를 한 문서의 페이지 순서로 보고 반복 머리/꼬리 줄을 먼저 지운다.
+        """
+        items = list(items)
+        texts = [text for text, _ in items]
+        if boilerplate is not None:
+            texts = boilerplate.strip_pages(texts)
+
+        if parallel and len(texts) > 1 and sum(map(len, texts)) >= settings.DOC_PREPROCESS_PARALLEL_MIN_CHARS:
+            from app.infrastructure.executor.executor import ExecutorRegistry
+
+            contents = list(ExecutorRegistry.cpu().map(TextParseProcessor.normalize, texts, chunksize=chunksize))
+        else:
+            contents = [TextParseProcessor.normalize(text) for text in texts]
+
+        return [
+            cls(content=content, metadata=metadata, normalized=True)
+            for content, (_, metadata) in zip(contents, items)
+        ]
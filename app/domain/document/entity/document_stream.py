@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+from app.domain.document.entity.doc import Doc
+from app.domain.document.entity.documentinfo import DocumentInfo
+from app.service.chunk.parser.boilerplate_index import BoilerplateIndex
+
+
+@dataclass
+class DocumentStream:
+    """
+    페이지 단위로 Doc 을 흘려보내는 스트리밍 문서.
+    - 페이지는 iter_pages() 호출 시점에 하나씩 로딩된다
+    - content 는 접근할 때만 조립된다 (평소에는 메모리에 올리지 않음)
+    - boilerplate 가 있으면 페이지를 읽는 동안 반복 머리/꼬리 줄을 세고 지운다
+    """
+    metadata: dict[str, Any]
+    pages_count: int
+    load_text: Callable[[int], str]
+    build_page: Callable[[int, str], Doc]
+    boilerplate: Optional[BoilerplateIndex] = None
+
+    def page_text(self, page_index: int) -> str:
+        """반복 머리/꼬리 줄을 지운 페이지 텍스트 (load_text 는 원문 그대로)."""
+        text = self.load_text(page_index)
+        if self.boilerplate is None:
+            return text
+        return self.boilerplate.observe_and_strip(page_index, text)
+
+    def load_page(self, page_index: int) -> Doc:
+        return self.build_page(page_index, self.page_text(page_index))
+
+    def iter_pages(self) -> Iterator[Doc]:
+        for page_index in range(self.pages_count):
+            yield self.load_page(page_index)
+
+    def iter_texts(self) -> Iterator[str]:
+        for page_index in range(self.pages_count):
+            yield self.page_text(page_index)
+
+    @property
+    def content(self) -> str:
+        return "".join(f"{text}\n" for text in self.iter_texts())
+
+    def get_route_doc(self) -> str:
+        """
+        DocumentInfo.get_route_doc 와 같은 규칙으로 샘플 페이지만 로딩한다.
+        """
+        total = self.pages_count
+
+        if total < 4:
+            indexes = list(range(total))
+        elif total < 8:
+            indexes = [0, 1, 2, total - 1]
+        else:
+            indexes = [0, 1, 2, total // 2]
+
+        return "\n\n".join(self.load_page(i).content for i in indexes)
+
+    def to_document_info(self) -> DocumentInfo:
+        """
+        전체 페이지를 한 번에 materialize 한다 (기존 normal_parse 결과와 동일).
+        모든 페이지를 센 뒤 지우므로 스트리밍과 달리 앞쪽 페이지도 같은 기준으로 정리된다.
+        """
+        texts = [self.load_text(page_index) for page_index in range(self.pages_count)]
+        metadata = self.metadata
+        if self.boilerplate is not None:
+            texts = self.boilerplate.strip_pages(texts)
+            metadata = {**metadata, **self.boilerplate.stats()}
+
+        doc_list = [self.build_page(page_index, text) for page_index, text in enumerate(texts)]
+        content = "".join(f"{text}\n" for text in texts)
+        return DocumentInfo.from_doc_info(content, metadata, doc_list)
@@ -4,4 +4,24 @@ class DocumentType(str,Enum):
     POLICY = "policy",
     MANUAL = "manual",
     REPORT = "report",
-    UNKNOWN = "unknown"
\ No newline at end of file
+    UNKNOWN = "unknown"
+
+# 분류 프롬프트(_first_document_classification_prompt)의 유형 정의와 같은 내용
+# (임베딩 centroid 분류기의 label 설명으로 사용, UNKNOWN 은 제외)
+DOCUMENT_TYPE_DESCRIPTIONS: dict[DocumentType, str] = {
+    DocumentType.PROCEDURE: (
+        "절차/운영 문서. Step 1, 2, 3 형태의 단계 기반 설명, 설치/실행/빌드/등록/적용 같은 동사 중심 절차, "
+        "UI 화면, 버튼, 경로, 메뉴 구조 설명. 예: 개발 배포 매뉴얼, 운영 절차서, 설치 가이드"
+    ),
+    DocumentType.POLICY: (
+        "정책/내규/규정/안내 문서. 법적/내부 규정 설명, 조건, 조항(제N조), 절차 정의, 문어체와 정책적 표현. "
+        "예: 인사 규정, 대출 지침, 보안 정책"
+    ),
+    DocumentType.MANUAL: (
+        "기술 매뉴얼/개발 가이드. 개발자용 설명, 코드 예시, 설정 값, 옵션 설명, 소스코드/스크립트/명령어 포함. "
+        "예: API 문서, 개발자 매뉴얼, 설정 가이드"
+    ),
+    DocumentType.REPORT: (
+        "보고서/분석/결과 문서. 분석, 결과, 보고 중심, 표와 구조화된 섹션, 정책이나 절차보다 분석/요약 성격"
+    ),
+}
@@ -5,6 +5,7 @@ from typing import Any
 
 from pymupdf.extra import make_table_dict
 import logging
+from app.domain.document.entity.chunk_span import ChunkSpan
 from app.domain.document.entity.doc import Doc
 from app.domain.document.entity.document_type import DocumentType
 from app.domain.llm.prompt.prompt_registry import PromptRegistry
@@ -16,7 +17,8 @@ class DocumentInfo:
     content:str
     metadata:dict[str, Any]
     documents:list[Doc]
-    child_documents:list[Doc]
+    # ChunkService 결과는 content 위치만 가진 ChunkSpan (Doc 과 같은 content / metadata 제공)
+    child_documents:list[Doc | ChunkSpan]
 
     @classmethod
     def from_doc_info(cls, content:str, metadata:dict[str,Any],documents:list[Doc]) -> DocumentInfo:
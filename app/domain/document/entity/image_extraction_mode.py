@@ -0,0 +1,5 @@
+from enum import Enum
+class ImageExtractionMode(str,Enum):
+    OFF = "off"              # 이미지 정보 수집 안 함
+    METADATA = "metadata"    # xref / 크기 정보만 기록 (디코딩 없음)
+    PERSIST = "persist"      # 원본 이미지를 content-hash 저장소에 1회만 저장, 메타데이터엔 hash 만
@@ -0,0 +1,19 @@
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class IncrementalIngestResult:
+    """버전 ingest 한 번의 페이지/청크 재사용 통계."""
+    doc_key: str
+    version: str
+    pages_total: int
+    pages_changed: int
+    pages_reused: int
+    pages_removed: int
+    chunks_upserted: int
+    chunks_reused: int
+    chunks_deleted: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
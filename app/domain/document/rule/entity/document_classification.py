@@ -6,4 +6,4 @@ class DocumentClassification:
     document_type:str
     confidence:float
     reason:str
-
+    method:str = "llm"
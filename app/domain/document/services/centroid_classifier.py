@@ -0,0 +1,138 @@
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# 임베딩 모델 입력 한도를 넘지 않도록 문서 샘플 길이 제한
+MAX_EMBED_CHARS = 4000
+
+
+@dataclass
+class CentroidPrediction:
+    label: str
+    score: float
+    second_label: Optional[str]
+    margin: float
+    scores: dict[str, float]
+
+    def confident(self, margin_threshold: float, min_score: float = 0.0) -> bool:
+        """
+        top-2 margin 이 충분하고 top-1 유사도가 min_score 이상일 때만 확정.
+        어느 centroid 와도 가깝지 않은 문서(일반 문서 등)는 margin 과 상관없이 abstain 한다.
+        """
+        return self.margin >= margin_threshold and self.score >= min_score
+
+    def confidence_level(self, margin_threshold: float) -> str:
+        """margin 이 임계값의 2배 이상이면 high, 아니면 medium (확정되지 않은 예측은 low)."""
+        if self.margin >= 2 * margin_threshold:
+            return "high"
+        return "medium" if self.margin >= margin_threshold else "low"
+
+
+class CentroidClassifier:
+    """
+    임베딩 centroid 기반 zero-shot 분류기.
+    - label 설명을 한 번만 임베딩해 centroid 로 사용 (같은 설정이면 프로세스 안에서 재사용)
+    - examples_path(JSONL: {"label", "text"}) 가 있으면 label 별 예시 임베딩을 설명과 함께 평균
+    - 문서는 centroid 와의 cosine similarity 로 분류, top-2 margin + 최소 유사도로 확신도 판단
+    """
+
+    _centroid_cache: dict[str, tuple[list[str], np.ndarray]] = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        descriptions: dict[str, str],
+        examples_path: Optional[str] = None,
+    ):
+        self.embeddings = embeddings
+        self.descriptions = {str(getattr(k, "value", k)): v for k, v in descriptions.items()}
+        self.examples_path = examples_path
+        self._centroids: Optional[tuple[list[str], np.ndarray]] = None
+
+    def _examples(self) -> dict[str, list[str]]:
+        examples: dict[str, list[str]] = {label: [] for label in self.descriptions}
+        if not self.examples_path or not Path(self.examples_path).exists():
+            return examples
+        with open(self.examples_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if row["label"] in examples:
+                    examples[row["label"]].append(row["text"][:MAX_EMBED_CHARS])
+        return examples
+
+    def _cache_key(self, examples: dict[str, list[str]]) -> str:
+        model = getattr(self.embeddings, "model", type(self.embeddings).__name__)
+        payload = json.dumps([model, self.descriptions, examples], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def centroids(self) -> tuple[list[str], np.ndarray]:
+        # 예시 파일은 인스턴스마다 한 번만 읽는다 (predict 마다 JSONL 을 다시 읽고 hash 하지 않음)
+        if self._centroids is not None:
+            return self._centroids
+        examples = self._examples()
+        key = self._cache_key(examples)
+        with self._lock:
+            cached = self._centroid_cache.get(key)
+        if cached is not None:
+            self._centroids = cached
+            return cached
+
+        labels = list(self.descriptions)
+        texts: list[str] = []
+        owners: list[int] = []
+        for i, label in enumerate(labels):
+            for text in [self.descriptions[label], *examples[label]]:
+                texts.append(text)
+                owners.append(i)
+
+        vectors = _normalize(np.asarray(self.embeddings.embed_documents(texts), dtype=np.float32))
+        owners_arr = np.asarray(owners)
+        centroids = _normalize(np.stack([vectors[owners_arr == i].mean(axis=0) for i in range(len(labels))]))
+        logger.info(
+            "centroids built -> %s (%d texts)", ", ".join(labels), len(texts)
+        )
+
+        with self._lock:
+            self._centroid_cache[key] = (labels, centroids)
+        self._centroids = (labels, centroids)
+        return self._centroids
+
+    def predict(self, text: str) -> CentroidPrediction:
+        return self.predict_many([text])[0]
+
+    def predict_many(self, texts: list[str]) -> list[CentroidPrediction]:
+        labels, centroids = self.centroids()
+        vectors = _normalize(np.asarray(
+            self.embeddings.embed_documents([t[:MAX_EMBED_CHARS] for t in texts]), dtype=np.float32
+        ))
+        sims = vectors @ centroids.T                      # (texts, labels)
+        order = np.argsort(-sims, axis=1)
+
+        predictions = []
+        for row, ranks in zip(sims, order):
+            second = ranks[1] if len(ranks) > 1 else None
+            predictions.append(CentroidPrediction(
+                label=labels[ranks[0]],
+                score=round(float(row[ranks[0]]), 4),
+                second_label=labels[second] if second is not None else None,
+                margin=round(float(row[ranks[0]] - row[second]), 4) if second is not None else 1.0,
+                scores={label: round(float(s), 4) for label, s in zip(labels, row)},
+            ))
+        return predictions
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
@@ -0,0 +1,148 @@
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+from app.core.config import settings
+from app.domain.document.entity.document_stream import DocumentStream
+from app.domain.document.entity.document_type import DOCUMENT_TYPE_DESCRIPTIONS
+from app.domain.document.entity.documentinfo import DocumentInfo
+from app.domain.document.rule.entity.document_classification import DocumentClassification
+from app.domain.document.services.centroid_classifier import CentroidClassifier
+from app.domain.llm.embedding.openai_embeding_service import OpenAIEmbed
+from app.domain.llm.prompt.prompt_registry import PromptRegistry
+from app.domain.llm.services.llm_client import LlmClient
+from app.service.chunk.rule.document_type_rule import DocumentTypeRule
+
+logger = logging.getLogger(__name__)
+
+METHODS = ("rule", "centroid", "llm")
+
+
+class ClassificationStats:
+    """규칙 / centroid / LLM 판정 건수 (프로세스 단위 누적)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {method: 0 for method in METHODS}
+
+    def record(self, method: str):
+        with self._lock:
+            self.counts[method] += 1
+
+    @property
+    def rule(self) -> int:
+        return self.counts["rule"]
+
+    @property
+    def llm(self) -> int:
+        return self.counts["llm"]
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def rule_resolution_rate(self) -> float:
+        return self.rule / self.total if self.total else 0.0
+
+    @property
+    def llm_calls_saved_rate(self) -> float:
+        return (self.total - self.llm) / self.total if self.total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            **self.counts,
+            "rule_resolution_rate": round(self.rule_resolution_rate, 4),
+            "llm_calls_saved_rate": round(self.llm_calls_saved_rate, 4),
+        }
+
+
+classification_stats = ClassificationStats()
+
+
+def document_type_centroid_classifier(embeddings=None) -> CentroidClassifier:
+    return CentroidClassifier(
+        embeddings or OpenAIEmbed().embeddings,
+        DOCUMENT_TYPE_DESCRIPTIONS,
+        examples_path=str(Path(settings.CENTROID_EXAMPLES_DIR) / "document_type.jsonl"),
+    )
+
+
+class DocumentClassifierService:
+    """
+    단계형 문서 분류
+    1) 전체 페이지 규칙 판정 (DocumentTypeRule) — 조항 구조, 코드 블록 등 명확한 경우 확정
+    2) 규칙이 AMBIGUOUS 로 남긴 문서는 유형 설명 임베딩 centroid 와 비교, top-2 margin 과 최소 유사도를 넘으면 확정
+    3) 그래도 애매한 문서만 샘플 페이지로 LLM 분류
+    """
+
+    def __init__(
+        self,
+        rule: DocumentTypeRule = None,
+        stats: ClassificationStats = None,
+        centroid: Optional[CentroidClassifier] = None,
+        margin_threshold: Optional[float] = None,
+        min_similarity: Optional[float] = None,
+    ):
+        self.rule = rule or DocumentTypeRule()
+        self.stats = stats or classification_stats
+        self._centroid = centroid
+        self.margin_threshold = settings.CENTROID_MARGIN_THRESHOLD if margin_threshold is None else margin_threshold
+        self.min_similarity = settings.CENTROID_MIN_SIMILARITY if min_similarity is None else min_similarity
+
+    @property
+    def centroid(self) -> Optional[CentroidClassifier]:
+        if self._centroid is None and settings.CENTROID_CLASSIFIER_ENABLED:
+            self._centroid = document_type_centroid_classifier()
+        return self._centroid
+
+    def classify(self, doc: Union[DocumentInfo, DocumentStream]) -> DocumentClassification:
+        decision = self.rule.decide(self._page_texts(doc))
+        if decision.resolved:
+            logger.info("rule classification -> %s (%s)", decision.document_type, decision.reason)
+            self.stats.record("rule")
+            return DocumentClassification(
+                document_type=decision.document_type,
+                confidence=decision.confidence,
+                reason=decision.reason,
+                method="rule",
+            )
+
+        route_doc = doc.get_route_doc()
+        if self.centroid is not None:
+            prediction = self.centroid.predict(route_doc)
+            if prediction.confident(self.margin_threshold, self.min_similarity):
+                logger.info(
+                    "centroid classification -> %s (margin=%.4f)", prediction.label, prediction.margin
+                )
+                self.stats.record("centroid")
+                return DocumentClassification(
+                    document_type=prediction.label,
+                    confidence=prediction.score,
+                    reason=f"centroid similarity (margin={prediction.margin} over {prediction.second_label})",
+                    method="centroid",
+                )
+            logger.info(
+                "centroid abstained (score=%.4f, margin=%.4f), falling back to llm", prediction.score, prediction.margin
+            )
+
+        logger.info("rule ambiguous, falling back to llm (%s)", decision.reason)
+        classification = DocumentClassification(
+            **json.loads(
+                LlmClient().ask(
+                    PromptRegistry._first_document_classification_prompt(),
+                    route_doc
+                )
+            )
+        )
+        self.stats.record("llm")
+        return classification
+
+    @staticmethod
+    def _page_texts(doc: Union[DocumentInfo, DocumentStream]):
+        if isinstance(doc, DocumentStream):
+            return doc.iter_texts()
+        return (page.content for page in doc.documents)
@@ -0,0 +1,111 @@
+"""fitz 로컬 파싱 + 품질이 낮은 페이지만 LlamaParse 로 보내는 혼합 파싱."""
+
+import logging
+import os
+import tempfile
+from typing import Optional
+
+import fitz
+
+from app.domain.document.entity.doc import Doc
+from app.domain.document.entity.documentinfo import DocumentInfo
+from app.domain.document.services.llm_parse_service import LlamaParseService, page_of
+from app.service.chunk.parser.boilerplate_index import BoilerplateIndex
+from app.service.pdf_service import PdfSource, open_pdf, write_sub_pdf
+from app.service.pdf_triage_service import PdfTriageService, page_markdown
+
+logger = logging.getLogger(__name__)
+
+
+class HybridParseService:
+    """
+    1) PdfTriageService 로 페이지별 fitz 추출 품질 점검
+    2) 통과 페이지는 로컬에서 markdown 변환
+    3) 나머지 페이지만 sub-PDF 로 묶어 LlamaParse 에 한 번 업로드
+    4) 결과를 원래 페이지 순서대로 합친다
+    """
+
+    def __init__(
+        self,
+        triage_service: Optional[PdfTriageService] = None,
+        llama_parse_service: Optional[LlamaParseService] = None,
+    ):
+        self.triage_service = triage_service or PdfTriageService()
+        self._llama_parse_service = llama_parse_service
+
+    @property
+    def llama_parse_service(self) -> LlamaParseService:
+        # 모든 페이지가 로컬로 처리되면 LlamaParse 클라이언트를 만들지 않는다
+        if self._llama_parse_service is None:
+            self._llama_parse_service = LlamaParseService()
+        return self._llama_parse_service
+
+    def parse(self, source: PdfSource, file_name: str, filetype: str = "pdf") -> DocumentInfo:
+        with open_pdf(source, filetype) as doc:
+            triages = self.triage_service.triage(doc)
+            remote_pages = [t.page for t in triages if not t.local]
+
+            pages: dict[int, tuple[str, str]] = {
+                t.page: (page_markdown(doc.load_page(t.page - 1), tables=t.tables), "local")
+                for t in triages if t.local
+            }
+            if remote_pages:
+                pages.update(self._parse_remote(doc, remote_pages, file_name))
+
+        logger.info(
+            "hybrid parse -> %s: local=%d, llama_parse=%d",
+            file_name, len(triages) - len(remote_pages), len(remote_pages),
+        )
+
+        items = []
+        for triage in triages:
+            text, parser = pages.get(triage.page, ("", "local"))
+            items.append((text, {
+                "page": triage.page,
+                "file_name": file_name,
+                "parser": parser,
+                "triage_reasons": triage.reasons,
+            }))
+        boilerplate = BoilerplateIndex.from_settings()
+        doc_list: list[Doc] = Doc.from_many(items, parallel=True, boilerplate=boilerplate)
+
+        content = "\n\n".join(d.content for d in doc_list)
+        metadata = {
+            "pages_count": len(triages),
+            "local_pages": len(triages) - len(remote_pages),
+            "llama_parse_pages": len(remote_pages),
+            **(boilerplate.stats() if boilerplate else {}),
+        }
+        return DocumentInfo.from_doc_info(content, metadata, doc_list)
+
+    def _parse_remote(self, doc: fitz.Document, pages: list[int], file_name: str) -> dict[int, tuple[str, str]]:
+        """
+        pages(1-based) 만 담은 sub-PDF 를 LlamaParse 로 파싱하고 원래 페이지 번호로 되돌린다.
+        결과 수가 페이지 수와 다르면 metadata 의 페이지 번호로 맞추고,
+        맞출 수 없는 페이지는 로컬 fitz markdown 으로 채운다. 반환값은 page -> (text, parser).
+        """
+        fd, sub_path = tempfile.mkstemp(suffix=".pdf")
+        os.close(fd)
+        try:
+            write_sub_pdf(doc, [page - 1 for page in pages], sub_path)
+            parsed = self.llama_parse_service.parse_path(sub_path, file_name)
+        finally:
+            os.remove(sub_path)
+
+        if len(parsed.documents) == len(pages):
+            return {page: (d.content, "llama_parse") for page, d in zip(pages, parsed.documents)}
+
+        matched: dict[int, list[str]] = {}
+        for d in parsed.documents:
+            sub_page = page_of(d.metadata)
+            if sub_page is not None and 1 <= sub_page <= len(pages):
+                matched.setdefault(pages[sub_page - 1], []).append(d.content)
+        missing = [page for page in pages if page not in matched]
+        logger.warning(
+            "llama parse returned %d docs for %d pages (%s): matched=%d, local fallback=%s",
+            len(parsed.documents), len(pages), file_name, len(matched), missing,
+        )
+
+        result = {page: ("\n\n".join(texts), "llama_parse") for page, texts in matched.items()}
+        result.update({page: (page_markdown(doc.load_page(page - 1)), "local") for page in missing})
+        return result
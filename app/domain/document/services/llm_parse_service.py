@@ -5,27 +5,50 @@ import logging
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+import fitz
 from llama_parse import LlamaParse
 from app.core.config import settings
+import shutil
 import tempfile
 import os
 
 from app.domain.document.entity.documentinfo import DocumentInfo
+from app.infrastructure.cache.ingest_cache import sha256_bytes, sha256_file
+from app.infrastructure.cache.llama_parse_cache import LlamaParseCache, llama_parse_cache_key
+from app.service.chunk.parser.boilerplate_index import BoilerplateIndex
+from app.service.pdf_service import write_sub_pdf
+from app.service.pdf_triage_service import page_markdown
+from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
 from dotenv import load_dotenv
 from app.domain.document.entity.doc import Doc
 load_dotenv() 
+
+# LlamaParse 결과 metadata 에서 페이지 번호로 쓰는 key (있는 것만)
+_PAGE_KEYS = ("page", "page_number", "page_label")
+
+
+def page_of(metadata: Dict[str, Any]) -> Optional[int]:
+    """LlamaParse 결과 metadata 의 페이지 번호 (업로드한 파일 기준, 1-based). 없으면 None."""
+    for key in _PAGE_KEYS:
+        value = metadata.get(key)
+        if value is not None and str(value).strip().isdigit():
+            return int(value)
+    return None
+
+
 class LlamaParseService:
     """LlamaParse API를 사용한 문서 파싱 서비스."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[LlamaParseCache] = None):
         """
         LlamaParse 서비스 초기화.
 
         Args:
             api_key: LlamaParse API 키. None인 경우 설정에서 가져옴.
+            cache: LlamaParse 결과 캐시. None인 경우 설정(LLAMA_PARSE_CACHE_ENABLED)에 따라 생성.
         """
         # self.api_key = os.getenv("LLAMA_CLOUD_API_KEY")
         self.api_key = api_key or getattr(settings, "LLAMA_PARSE_API_KEY", None)
@@ -37,6 +60,52 @@ class LlamaParseService:
             result_type="markdown",  # 또는 "text"
             verbose=True,
         )
+        self.cache = cache or (LlamaParseCache() if settings.LLAMA_PARSE_CACHE_ENABLED else None)
+
+    def _cache_key(self, file_path: str, file_hash: Optional[str] = None) -> str:
+        # 업로드 시 이미 계산한 sha256 이 있으면 파일을 다시 읽지 않는다
+        result_type = getattr(self.parser.result_type, "value", self.parser.result_type)
+        return llama_parse_cache_key(file_hash or sha256_file(file_path), str(result_type), self.parser.language)
+
+    @staticmethod
+    def _to_documents(cached: list[Dict[str, Any]]) -> list[Document]:
+        return [Document(text=d["text"], metadata=d["metadata"]) for d in cached]
+
+    @staticmethod
+    def _to_cached(documents: list[Document]) -> list[Dict[str, Any]]:
+        return [{"text": doc.text, "metadata": doc.metadata} for doc in documents]
+
+    def load_data(self, file_path: str, file_hash: Optional[str] = None) -> list[Document]:
+        """
+        캐시를 거치는 LlamaParse.load_data.
+        같은 파일 내용 + 같은 파서 옵션이면 원격 파싱을 생략합니다.
+        file_hash 는 file_path 내용의 sha256 (이미 알고 있으면 전달).
+        """
+        if self.cache is None:
+            return self.parser.load_data(file_path)
+
+        key = self._cache_key(file_path, file_hash)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._to_documents(cached)
+
+        documents = self.parser.load_data(file_path)
+        self.cache.put(key, self._to_cached(documents))
+        return documents
+
+    async def aload_data(self, file_path: str, file_hash: Optional[str] = None) -> list[Document]:
+        """캐시를 거치는 LlamaParse.aload_data."""
+        if self.cache is None:
+            return await self.parser.aload_data(file_path)
+
+        key = self._cache_key(file_path, file_hash)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._to_documents(cached)
+
+        documents = await self.parser.aload_data(file_path)
+        self.cache.put(key, self._to_cached(documents))
+        return documents
 
     async def parse_file_async(
         self,
@@ -70,7 +139,7 @@ class LlamaParseService:
             loop = asyncio.get_event_loop()
             documents = await loop.run_in_executor(
                 None,
-                lambda: self.parser.load_data(file_path)
+                lambda: self.load_data(file_path)
             )
 
             # 결과 처리
@@ -123,7 +192,7 @@ class LlamaParseService:
         try:
             logger.info(f"파일 파싱 시작: {file_path}")
             
-            documents = self.parser.load_data(file_path)
+            documents = self.load_data(file_path)
 
             # 결과 처리
             parsed_content = "\n\n".join([doc.text for doc in documents])
@@ -184,39 +253,177 @@ class LlamaParseService:
                 if os.path.exists(tmp_file_path):
                     os.unlink(tmp_file_path)
 
-    def parse_bytes(self, file_bytes: bytes, file_name: str) -> DocumentInfo:
+    def parse_bytes(self, file_bytes: bytes, file_name: str, file_hash: Optional[str] = None) -> DocumentInfo:
     
+        file_hash = file_hash or sha256_bytes(file_bytes)
         with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_name.split('.')[-1]}") as tmp:
             tmp.write(file_bytes)
             tmp_path = tmp.name
 
         try:
-            documents = self.parser.load_data(tmp_path)
-            # 결과 처리
-            parsed_content = "\n\n".join([doc.text for doc in documents])
-            metadata = {
-                # "file_path": str(tmp_path),
-                # "file_name": file_name,
-                # "file_size": os.path.getsize(tmp_path),
-                "pages_count": len(documents),
-                # "result_type": result_type,
-            }
+            return self.parse_path(tmp_path, file_name, file_hash)
+        finally:
+            os.remove(tmp_path)
+
+    def parse_path(self, file_path: str, file_name: str, file_hash: Optional[str] = None) -> DocumentInfo:
+        """
+        디스크에 이미 있는 파일을 임시 파일 복사 없이 그대로 파싱합니다.
+        페이지 수가 LLAMA_PARSE_PAGE_RANGE_SIZE 를 넘는 PDF 는 page range 로 나눠 동시에 파싱합니다.
+
+        Args:
+            file_path: 파싱할 파일 경로 (업로드 spool 경로 등)
+            file_name: 원본 파일 이름
+            file_hash: 파일 내용의 sha256 (업로드 시 계산한 값, 캐시 key 로 사용)
+
+        Returns:
+            DocumentInfo
+        """
+        range_size = settings.LLAMA_PARSE_PAGE_RANGE_SIZE
+        if range_size and Path(file_path).suffix.lower() == ".pdf":
+            with fitz.open(file_path) as doc:
+                pages_count = len(doc)
+            if pages_count > range_size:
+                return self.parse_path_split(file_path, file_name)
+
+        documents = self.load_data(file_path, file_hash)
+        # 결과 처리
+        boilerplate = BoilerplateIndex.from_settings()
+        doc_list : list[Doc] = Doc.from_many(
+            ((doc.text, doc.metadata) for doc in documents), parallel=True, boilerplate=boilerplate
+        )
+        parsed_content = "\n\n".join(d.content for d in doc_list)
+        metadata = {
+            # "file_path": str(tmp_path),
+            # "file_name": file_name,
+            # "file_size": os.path.getsize(tmp_path),
+            "pages_count": len(documents),
+            # "result_type": result_type,
+            **(boilerplate.stats() if boilerplate else {}),
+        }
 
-            logger.info(f"파싱 완료: {tmp_path}, 페이지 수: {len(documents)}")
+        logger.info(f"파싱 완료: {file_path}, 페이지 수: {len(documents)}")
 
-            doc_list : list[Doc] =  [Doc.from_document(doc) for doc in documents]
-            doc_info : DocumentInfo= DocumentInfo.from_doc_info(parsed_content,metadata,doc_list)
+        doc_info : DocumentInfo= DocumentInfo.from_doc_info(parsed_content,metadata,doc_list)
 
-            return doc_info
+        return doc_info
+
+    def parse_path_split(
+        self,
+        file_path: str,
+        file_name: str,
+        page_range_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> DocumentInfo:
+        """
+        aparse_path_split 의 동기 버전 (io 스레드 등 event loop 밖에서 호출).
+        """
+        return asyncio.run(
+            self.aparse_path_split(file_path, file_name, page_range_size, concurrency)
+        )
+
+    async def aparse_path_split(
+        self,
+        file_path: str,
+        file_name: str,
+        page_range_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> DocumentInfo:
+        """
+        PDF 를 page range 단위 sub-PDF 로 나눠 LlamaParse async API 로 동시에 파싱합니다.
+
+        Args:
+            file_path: 파싱할 PDF 경로
+            file_name: 원본 파일 이름
+            page_range_size: sub-PDF 하나의 페이지 수 (기본값: LLAMA_PARSE_PAGE_RANGE_SIZE)
+            concurrency: 동시에 업로드할 sub-PDF 수 (기본값: LLAMA_PARSE_CONCURRENCY)
+
+        Returns:
+            원본 페이지 번호(page)가 붙은 Doc 들을 페이지 순서대로 합친 DocumentInfo
+        """
+        range_size = page_range_size or settings.LLAMA_PARSE_PAGE_RANGE_SIZE
+        semaphore = asyncio.Semaphore(concurrency or settings.LLAMA_PARSE_CONCURRENCY)
+
+        tmp_dir = tempfile.mkdtemp(prefix="llama_split_")
+        try:
+            ranges: list[tuple[int, int, str]] = []
+            with fitz.open(file_path) as doc:
+                pages_count = len(doc)
+                for start in range(0, pages_count, range_size):
+                    end = min(start + range_size, pages_count)
+                    sub_path = os.path.join(tmp_dir, f"{start + 1}-{end}.pdf")
+                    write_sub_pdf(doc, range(start, end), sub_path)
+                    ranges.append((start, end, sub_path))
+
+            async def parse_range(start: int, end: int, sub_path: str) -> list[tuple[str, dict]]:
+                async with semaphore:
+                    logger.info(f"page range 파싱 시작: {file_name} {start + 1}-{end}")
+                    documents = await self.aload_data(sub_path)
+                return self._stitch_range(documents, start, end, file_name, sub_path)
+
+            results = await asyncio.gather(*(parse_range(*r) for r in ranges))
         finally:
-            os.remove(tmp_path)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
-    # def get_llama_parse_service() -> LlamaParseService:
-    #     """
-    #     LlamaParseService 인스턴스를 생성하고 반환합니다.
-        
-    #     Returns:
-    #         LlamaParseService 인스턴스
-    #     """
-    #     return LlamaParseService()
+        # 반복 머리/꼬리 줄은 range 단위가 아니라 문서 전체 페이지를 기준으로 지운다
+        boilerplate = BoilerplateIndex.from_settings()
+        doc_list: list[Doc] = Doc.from_many(
+            (item for items in results for item in items), parallel=True, boilerplate=boilerplate
+        )
+        parsed_content = "\n\n".join(d.content for d in doc_list)
+        metadata = {
+            "pages_count": pages_count,
+            "page_ranges": len(ranges),
+            **(boilerplate.stats() if boilerplate else {}),
+        }
+
+        logger.info(f"분할 파싱 완료: {file_path}, 페이지 수: {pages_count}, range 수: {len(ranges)}")
 
+        return DocumentInfo.from_doc_info(parsed_content, metadata, doc_list)
+
+    @staticmethod
+    def _stitch_range(
+        documents: list, start: int, end: int, file_name: str, sub_path: str
+    ) -> list[tuple[str, dict]]:
+        """
+        sub-PDF 기준 결과에 원본 페이지 번호를 되돌려 붙여 페이지 순서대로 (text, metadata) 로 돌려줍니다.
+        결과 수가 페이지 수와 다르면 metadata 의 페이지 번호로 맞추고,
+        맞출 수 없는 페이지는 sub-PDF 의 로컬 fitz markdown 으로 채웁니다 (page 는 항상 붙음).
+        """
+        count = end - start
+        base = {"file_name": file_name, "page_range": f"{start + 1}-{end}"}
+        matched: dict[int, list] = {}
+        if len(documents) == count:
+            matched = {i + 1: [document] for i, document in enumerate(documents)}
+        else:
+            for document in documents:
+                sub_page = page_of(document.metadata)
+                if sub_page is not None and 1 <= sub_page <= count:
+                    matched.setdefault(sub_page, []).append(document)
+            logger.warning(
+                f"page range {start + 1}-{end}: 페이지 {count}개에 결과 {len(documents)}개 "
+                f"(metadata 로 {len(matched)}개 페이지 매칭, 나머지는 로컬 파싱)"
+            )
+
+        items: list[tuple[str, dict]] = []
+        sub = fitz.open(sub_path) if len(matched) < count else None
+        try:
+            for sub_page in range(1, count + 1):
+                page = {**base, "page": start + sub_page}
+                if sub_page in matched:
+                    parts = matched[sub_page]
+                    items.append(("\n\n".join(d.text for d in parts), {**parts[0].metadata, **page}))
+                else:
+                    items.append((page_markdown(sub.load_page(sub_page - 1)), {**page, "parser": "local"}))
+        finally:
+            if sub is not None:
+                sub.close()
+        return items
+
+def get_llama_parse_service() -> LlamaParseService:
+    """
+    LlamaParseService 인스턴스를 생성하고 반환합니다.
+
+    Returns:
+        LlamaParseService 인스턴스
+    """
+    return LlamaParseService()
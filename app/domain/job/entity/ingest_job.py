@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Optional
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class StageTiming:
+    name: str
+    started_at: float
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def elapsed_ms(self) -> Optional[float]:
+        if self.finished_at is None:
+            return None
+        return round((self.finished_at - self.started_at) * 1000, 2)
+
+
+@dataclass
+class IngestJob:
+    job_id: str
+    filename: str
+    status: JobStatus = JobStatus.PENDING
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    stages: list[StageTiming] = field(default_factory=list)
+    chunk_count: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+    @property
+    def current_stage(self) -> Optional[str]:
+        running = [s.name for s in self.stages if s.finished_at is None]
+        return running[-1] if running else None
+
+    def start_stage(self, name: str) -> StageTiming:
+        stage = StageTiming(name=name, started_at=time.time())
+        self.stages.append(stage)
+        return stage
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "filename": self.filename,
+            "status": self.status.value,
+            "current_stage": self.current_stage,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "stages": [
+                {
+                    "name": s.name,
+                    "elapsed_ms": s.elapsed_ms,
+                    "error": s.error,
+                }
+                for s in self.stages
+            ],
+            "chunk_count": self.chunk_count,
+            "error": self.error,
+        }
@@ -19,6 +19,7 @@ class PromptRegistry:
             PromptType.SUMMARIZATION: cls._summarization_prompt(),
             PromptType.CHUNK_STRATEGY: cls._chunk_strategy_prompt(),
             PromptType.METADATA_EXTRACTION: cls._metadata_extraction_prompt(),
+            PromptType.ARTICLE_SUMMARIZATION: cls._article_summarization_prompt(),
         }
 
     @classmethod
@@ -123,6 +124,14 @@ class PromptRegistry:
             Summarize the following document in a concise and factual way...
         """
 
+    @staticmethod
+    def _article_summarization_prompt() -> str:
+        return """
+            다음은 사내 규정의 한 조(제N조) 전체 내용입니다.
+            조의 목적, 적용 대상, 핵심 의무/기준을 150토큰 이내의 한국어로 요약하세요.
+            원문에 없는 내용은 추가하지 마세요.
+        """
+
     @staticmethod
     def _chunk_strategy_prompt() -> str:
         return """
@@ -5,4 +5,5 @@ class PromptType(Enum):
     SUMMARIZATION = "summarization"
     CHUNK_STRATEGY = "chunk_strategy"
     METADATA_EXTRACTION = "metadata_extraction"
+    ARTICLE_SUMMARIZATION = "article_summarization"
     # 필요한 만큼 계속 확장
@@ -138,6 +138,14 @@ class LlmClient:
 
         return self.llm.invoke(messages).content
 
+    async def aask(self, system_prompt: str, user_prompt: str) -> str:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+        return (await self.llm.ainvoke(messages)).content
+
     def ask_json(self, system_prompt: str, user_prompt: str) -> dict:
         # messages = [
         #     SystemMessage(content=system_prompt),
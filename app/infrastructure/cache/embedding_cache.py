@@ -0,0 +1,112 @@
+import hashlib
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key        TEXT PRIMARY KEY,
+    vector     BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def embedding_cache_key(namespace: str, text: str) -> str:
+    return hashlib.sha256(f"{namespace}\x00{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    텍스트 임베딩 디스크 캐시.
+    - key: sha256(모델 이름 + 텍스트) — 모델이 바뀌면 자연히 miss
+    - value: float32 벡터 bytes
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or settings.EMBEDDING_CACHE_PATH
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        with self._connect() as conn:
+            # sqlite 변수 개수 제한(기본 999)을 넘지 않도록 나눠 조회
+            for i in range(0, len(keys), 500):
+                part = keys[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(part))})", part
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put_many(self, items: dict[str, list[float]]):
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, created_at) VALUES (?, ?, ?)",
+                ((key, np.asarray(vector, dtype=np.float32).tobytes(), now) for key, vector in items.items()),
+            )
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    embed_documents 를 캐시 + batch 로 감싼 Embeddings.
+    - 같은 호출 안의 중복 텍스트는 한 번만, 캐시에 있는 텍스트는 호출하지 않음
+    - 남은 텍스트만 batch_size 단위로 원래 embeddings 에 보낸다
+    - embed_query 는 캐시하지 않는다 (질문은 재사용이 드묾)
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        cache: Optional[EmbeddingCache] = None,
+        batch_size: Optional[int] = None,
+        namespace: Optional[str] = None,
+    ):
+        self.embeddings = embeddings
+        self.cache = cache or EmbeddingCache()
+        self.batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        self.namespace = namespace or getattr(embeddings, "model", type(embeddings).__name__)
+        self.hits = 0
+        self.misses = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys = [embedding_cache_key(self.namespace, text) for text in texts]
+        unique = dict(zip(keys, texts))
+        vectors = self.cache.get_many(list(unique))
+
+        missing = [key for key in unique if key not in vectors]
+        self.hits += len(unique) - len(missing)
+        self.misses += len(missing)
+        for i in range(0, len(missing), self.batch_size):
+            batch = missing[i:i + self.batch_size]
+            embedded = dict(zip(batch, self.embeddings.embed_documents([unique[key] for key in batch])))
+            self.cache.put_many(embedded)
+            vectors.update(embedded)
+
+        return [vectors[key] for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embeddings.embed_query(text)
@@ -0,0 +1,77 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from app.domain.document.entity.doc import Doc
+from app.domain.document.entity.documentinfo import DocumentInfo
+from app.domain.document.rule.entity.document_classification import DocumentClassification
+
+logger = logging.getLogger(__name__)
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class IngestCacheEntry:
+    # 스트리밍 적재는 문서 / 청크를 모아두지 않으므로 document=None, chunks=[] 에 적재 건수만 기록
+    document: Optional[DocumentInfo]
+    classification: DocumentClassification
+    chunks: list[Doc] = field(default_factory=list)
+    upsert_count: Optional[int] = None
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self.chunks) if self.upsert_count is None else self.upsert_count
+
+
+class IngestCache:
+    """
+    업로드 파일 content-hash 기반 ingest 결과 캐시.
+    - key: (sha256, pipeline version) — 파이프라인이 바뀌면 version 만 올리면 전부 무효화
+    - 경로: {root}/{version}/{hash}.pkl
+    """
+
+    def __init__(self, root_dir: str, pipeline_version: str):
+        self.root = Path(root_dir) / pipeline_version
+
+    def _path(self, file_hash: str) -> Path:
+        return self.root / f"{file_hash}.pkl"
+
+    def get(self, file_hash: str) -> Optional[IngestCacheEntry]:
+        path = self._path(file_hash)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            # 깨진 캐시는 miss 로 취급하고 다시 만든다
+            logger.warning("ingest cache load failed: %s (%s)", path, e)
+            return None
+
+    def put(self, file_hash: str, entry: IngestCacheEntry):
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(file_hash))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
@@ -0,0 +1,185 @@
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+from uuid import uuid4
+
+import numpy as np
+from langchain_core.documents import Document
+
+from app.core.config import settings
+from app.infrastructure.dedup.minhash_index import MinHashLshIndex, jaccard
+
+logger = logging.getLogger(__name__)
+
+# 조 번호, 금액, 비율, 날짜 등
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+
+
+class DedupMode(str, Enum):
+    SKIP = "skip"      # 중복 청크는 버린다
+    ALIAS = "alias"    # 중복 청크는 적재하지 않고 출처(metadata)를 원본 point 의 metadata.aliases 에 합친다
+
+
+@dataclass
+class DedupResult:
+    docs: list[Document]
+    ids: list[str]
+    duplicates: list[dict] = field(default_factory=list)
+    # 적재가 끝난 뒤 인덱스에 기록할 (point_id, namespace, signature)
+    entries: list[tuple[str, str, np.ndarray]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {"kept": len(self.docs), "duplicates": len(self.duplicates)}
+
+    def aliases_by_canonical(self) -> dict[str, list[dict]]:
+        """원본 point id -> 그 point 에 합칠 중복 청크들의 metadata."""
+        aliases: dict[str, list[dict]] = {}
+        for duplicate in self.duplicates:
+            aliases.setdefault(duplicate["canonical_id"], []).append(duplicate["metadata"])
+        return aliases
+
+
+class ChunkDeduplicator:
+    """
+    청크 -> Upsert 사이의 근사 중복 제거 단계.
+    - 컬렉션별 MinHash LSH 인덱스(이미 적재된 청크)와 같은 batch 안의 앞선 청크를 함께 비교
+    - role(page / child) 이 다른 청크끼리는 비교하지 않는다 (한 청크짜리 페이지가 child 를 지우지 않도록)
+    - 숫자(조 번호, 금액, 비율 등)가 하나라도 다른 청크끼리도 비교하지 않는다
+      (70퍼센트 -> 60퍼센트 같은 개정 조항은 문자열이 거의 같아도 다른 내용)
+    - min_chars 보다 짧은 청크는 shingle 이 적어 오판이 많으므로 그대로 둔다
+    - 인덱스 기록은 commit() 에서 — 적재가 실패하면 기록하지 않아 다음 재시도에서 중복으로 오판하지 않음
+    - alive 를 주면 인덱스가 가리키는 원본 point 가 아직 있는지 확인하고, 없는 point 는 인덱스에서 지운다
+    """
+
+    def __init__(self, index: MinHashLshIndex, mode: DedupMode = DedupMode.SKIP, min_chars: int = 50):
+        self.index = index
+        self.mode = DedupMode(mode)
+        self.min_chars = min_chars
+
+    @classmethod
+    def for_collection(cls, collection: str) -> "ChunkDeduplicator":
+        index = MinHashLshIndex(
+            str(Path(settings.DEDUP_INDEX_DIR) / f"{collection}.db"),
+            threshold=settings.DEDUP_THRESHOLD,
+            num_perm=settings.DEDUP_NUM_PERM,
+            shingle_size=settings.DEDUP_SHINGLE_SIZE,
+        )
+        return cls(index, settings.DEDUP_MODE, settings.DEDUP_MIN_CHARS)
+
+    def filter(
+        self,
+        docs: list[Document],
+        ids: Optional[list[str]] = None,
+        alive: Optional[Callable[[list[str]], set[str]]] = None,
+    ) -> DedupResult:
+        ids = list(ids) if ids is not None else [str(uuid4()) for _ in docs]
+        result = DedupResult(docs=[], ids=[])
+        # 같은 batch 안의 중복: bucket -> 먼저 나온 (point_id, signature)
+        batch_buckets: dict[int, list[tuple[str, np.ndarray]]] = {}
+
+        # 1) 이미 적재된 청크와의 비교 (짧은 청크는 None)
+        checked: list[Optional[tuple[str, np.ndarray, Optional[tuple[str, float]]]]] = []
+        for doc, point_id in zip(docs, ids):
+            if len(doc.page_content) < self.min_chars:
+                checked.append(None)
+                continue
+            namespace = self.namespace(doc)
+            signature = self.index.signature(doc.page_content)
+            checked.append((namespace, signature, self.index.query(signature, namespace, exclude=point_id)))
+
+        # 2) 원본 point 가 Qdrant 에서 지워졌으면 그 match 는 버린다
+        stale = self._stale({c[2][0] for c in checked if c is not None and c[2] is not None}, alive)
+
+        for doc, point_id, check in zip(docs, ids, checked):
+            if check is None:
+                result.docs.append(doc)
+                result.ids.append(point_id)
+                continue
+
+            namespace, signature, match = check
+            if match is not None and match[0] in stale:
+                match = None
+            buckets = self.index.buckets(signature, namespace)
+            for bucket in buckets:
+                for other_id, other_signature in batch_buckets.get(bucket, ()):
+                    similarity = jaccard(signature, other_signature)
+                    if similarity >= self.index.threshold and (match is None or similarity > match[1]):
+                        match = (other_id, similarity)
+
+            if match is not None:
+                result.duplicates.append({
+                    "point_id": point_id,
+                    "canonical_id": match[0],
+                    "similarity": round(match[1], 4),
+                    "metadata": {
+                        k: doc.metadata.get(k)
+                        for k in ("file_name", "doc_uuid", "page", "chunk_index", "role")
+                        if k in doc.metadata
+                    },
+                })
+                continue
+
+            result.docs.append(doc)
+            result.ids.append(point_id)
+            result.entries.append((point_id, namespace, signature))
+            for bucket in buckets:
+                batch_buckets.setdefault(bucket, []).append((point_id, signature))
+
+        if result.duplicates:
+            logger.info(
+                "dedup -> kept=%d, %s=%d", len(result.docs), self.mode.value, len(result.duplicates)
+            )
+        return result
+
+    def _stale(self, canonical_ids: set[str], alive: Optional[Callable[[list[str]], set[str]]]) -> set[str]:
+        if alive is None or not canonical_ids:
+            return set()
+        stale = canonical_ids - set(alive(sorted(canonical_ids)))
+        if stale:
+            logger.info("dedup -> %d canonical points no longer exist, removing from index", len(stale))
+            self.index.remove(stale)
+        return stale
+
+    @staticmethod
+    def namespace(doc: Document) -> str:
+        """role + 숫자 token 열의 해시. 같은 namespace 안에서만 중복을 찾는다."""
+        numbers = " ".join(_NUMBER.findall(doc.page_content))
+        digest = hashlib.blake2b(numbers.encode("utf-8"), digest_size=8).hexdigest()
+        return f"{doc.metadata.get('role') or ''}:{digest}"
+
+    def commit(self, result: DedupResult):
+        self.index.add(result.entries)
+        if self.mode == DedupMode.ALIAS and result.duplicates:
+            self.index.add_aliases(
+                (d["point_id"], d["canonical_id"], d["similarity"], json.dumps(d["metadata"], ensure_ascii=False))
+                for d in result.duplicates
+            )
+
+
+@lru_cache
+def get_chunk_deduplicator(collection: str) -> ChunkDeduplicator:
+    return ChunkDeduplicator.for_collection(collection)
+
+
+def has_dedup_index(collection: str) -> bool:
+    # dedup 을 한 번도 쓰지 않은 컬렉션은 인덱스 파일을 만들지 않는다
+    return (Path(settings.DEDUP_INDEX_DIR) / f"{collection}.db").exists()
+
+
+def forget_points(collection: str, point_ids: Iterable[str]) -> int:
+    """Qdrant 에서 지운 point 를 dedup 인덱스에서도 지운다."""
+    if not has_dedup_index(collection):
+        return 0
+    return get_chunk_deduplicator(collection).index.remove(point_ids)
+
+
+def forget_collection(collection: str):
+    """Qdrant 컬렉션을 지우면 그 컬렉션의 dedup 인덱스도 비운다."""
+    if has_dedup_index(collection):
+        get_chunk_deduplicator(collection).index.drop()
@@ -0,0 +1,264 @@
+import hashlib
+import logging
+import sqlite3
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    point_id   TEXT PRIMARY KEY,
+    namespace  TEXT NOT NULL,
+    signature  BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    bucket   INTEGER NOT NULL,
+    point_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_buckets_bucket ON buckets (bucket);
+CREATE TABLE IF NOT EXISTS aliases (
+    point_id     TEXT PRIMARY KEY,
+    canonical_id TEXT NOT NULL,
+    similarity   REAL NOT NULL,
+    metadata     TEXT NOT NULL,
+    created_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_aliases_canonical ON aliases (canonical_id);
+"""
+
+
+def lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """
+    threshold 에서 false positive / false negative 면적 합이 가장 작은 (bands, rows).
+    band 하나라도 통째로 같으면 후보가 되므로 후보 확률은 1 - (1 - s^rows)^bands.
+    """
+    grid = np.linspace(0.0, 1.0, 201)
+    best, best_error = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        probability = 1 - (1 - grid ** rows) ** bands
+        false_positive = probability[grid < threshold].mean() * threshold
+        false_negative = (1 - probability[grid >= threshold]).mean() * (1 - threshold)
+        if false_positive + false_negative < best_error:
+            best, best_error = (bands, rows), false_positive + false_negative
+    return best
+
+
+class MinHasher:
+    """
+    문자 shingle(공백 정리 후 k-gram) MinHash.
+    - shingle 은 crc32, permutation 은 (a*x + b) mod (2^61 - 1) 로 프로세스/실행과 무관하게 같은 값
+    - num_perm 개의 permutation 을 numpy 로 한 번에 계산
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        text = " ".join(text.split())
+        k = self.shingle_size
+        grams = {text} if len(text) <= k else {text[i:i + k] for i in range(len(text) - k + 1)}
+        return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+    def signature(self, text: str) -> np.ndarray:
+        shingles = self.shingles(text)[:, None]
+        # uint64 곱셈 overflow 는 의도된 동작 (mod 2^64 후 mod p)
+        hashed = ((shingles * self.a + self.b) % _MERSENNE_PRIME) & _MAX_HASH
+        return hashed.min(axis=0).astype(np.uint32)
+
+
+def jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """두 signature 가 같은 자리 비율 = Jaccard 유사도 추정치."""
+    return float(np.mean(a == b))
+
+
+class MinHashLshIndex:
+    """
+    컬렉션 하나의 청크 MinHash signature 를 sqlite 에 보관하는 LSH 인덱스.
+    - signature 를 bands 개로 나눠 (namespace, band, 값) 해시를 bucket 으로 저장
+    - 조회는 bucket 이 하나라도 겹치는 후보만 읽어 signature 로 유사도를 다시 확인
+    - 파라미터(num_perm, shingle_size, seed)는 db 에 기록되어, 다른 설정으로 열면 ValueError
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        threshold: float = 0.9,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        self.db_path = db_path
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size, seed)
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._check_params(conn, {
+                "num_perm": str(num_perm),
+                "shingle_size": str(shingle_size),
+                "seed": str(seed),
+            })
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _check_params(self, conn: sqlite3.Connection, params: dict[str, str]):
+        stored = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        if not stored:
+            conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", params.items())
+            return
+        if stored != params:
+            raise ValueError(
+                f"dedup index {self.db_path} 는 다른 MinHash 설정으로 만들어졌습니다: {stored} != {params}"
+            )
+
+    def signature(self, text: str) -> np.ndarray:
+        return self.hasher.signature(text)
+
+    def buckets(self, signature: np.ndarray, namespace: str = "") -> list[int]:
+        prefix = namespace.encode("utf-8") + b"\x00"
+        result = []
+        for band in range(self.bands):
+            part = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                prefix + band.to_bytes(2, "big") + part.tobytes(), digest_size=8
+            ).digest()
+            result.append(int.from_bytes(digest, "big", signed=True))
+        return result
+
+    def query(
+        self,
+        signature: np.ndarray,
+        namespace: str = "",
+        exclude: Optional[str] = None,
+    ) -> Optional[tuple[str, float]]:
+        """threshold 이상으로 가장 비슷한 (point_id, similarity). exclude 는 자기 자신(같은 id 재적재)."""
+        buckets = self.buckets(signature, namespace)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT DISTINCT c.point_id, c.signature FROM buckets b "
+                f"JOIN chunks c ON c.point_id = b.point_id "
+                f"WHERE b.bucket IN ({','.join('?' * len(buckets))}) AND c.namespace = ?",
+                (*buckets, namespace),
+            ).fetchall()
+
+        best: Optional[tuple[str, float]] = None
+        for point_id, blob in rows:
+            if point_id == exclude:
+                continue
+            similarity = jaccard(signature, np.frombuffer(blob, dtype=np.uint32))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (point_id, similarity)
+        return best
+
+    def add(self, entries: Iterable[tuple[str, str, np.ndarray]]):
+        """(point_id, namespace, signature) 를 한 트랜잭션으로 기록한다."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for point_id, namespace, signature in entries:
+                    conn.execute("DELETE FROM buckets WHERE point_id = ?", (point_id,))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO chunks (point_id, namespace, signature, created_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (point_id, namespace, signature.astype(np.uint32).tobytes(), now),
+                    )
+                    conn.executemany(
+                        "INSERT INTO buckets (bucket, point_id) VALUES (?, ?)",
+                        ((bucket, point_id) for bucket in self.buckets(signature, namespace)),
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def remove(self, point_ids: Iterable[str]) -> int:
+        """
+        Qdrant 에서 지워진 point 를 인덱스에서도 지운다 (원본으로 가리키던 alias 포함).
+        남겨두면 같은 내용을 다시 적재할 때 없는 point 와 중복으로 판정된다.
+        """
+        point_ids = list(dict.fromkeys(point_ids))
+        removed = 0
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # sqlite 변수 개수 제한 안쪽으로 나눠 지운다
+                for i in range(0, len(point_ids), 500):
+                    part = point_ids[i:i + 500]
+                    marks = ",".join("?" * len(part))
+                    removed += conn.execute(f"DELETE FROM chunks WHERE point_id IN ({marks})", part).rowcount
+                    conn.execute(f"DELETE FROM buckets WHERE point_id IN ({marks})", part)
+                    conn.execute(
+                        f"DELETE FROM aliases WHERE point_id IN ({marks}) OR canonical_id IN ({marks})",
+                        (*part, *part),
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    def drop(self):
+        """컬렉션이 삭제되면 signature / bucket / alias 를 모두 비운다 (MinHash 설정(meta)은 유지)."""
+        with self._connect() as conn:
+            conn.executescript(
+                "BEGIN IMMEDIATE; DELETE FROM buckets; DELETE FROM chunks; DELETE FROM aliases; COMMIT;"
+            )
+
+    def add_aliases(self, aliases: Iterable[tuple[str, str, float, str]]):
+        """(point_id, canonical_id, similarity, metadata_json) — 적재하지 않은 중복 청크의 원본 연결."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO aliases (point_id, canonical_id, similarity, metadata, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((*alias, now) for alias in aliases),
+            )
+
+    def aliases_of(self, canonical_id: str) -> list[dict]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT point_id, similarity, metadata FROM aliases WHERE canonical_id = ?",
+                (canonical_id,),
+            ).fetchall()
+        return [{"point_id": p, "similarity": s, "metadata": m} for p, s, m in rows]
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            chunks = conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            aliases = conn.execute("SELECT COUNT(*) FROM aliases").fetchone()[0]
+        return {
+            "chunks": chunks,
+            "aliases": aliases,
+            "threshold": self.threshold,
+            "bands": self.bands,
+            "rows": self.rows,
+        }
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ExecutorRegistry:
+    """
+    블로킹 작업 전용 executor 모음.
+    - io  : ThreadPool  — LlamaParse / OpenAI / Qdrant 같은 blocking I/O
+    - cpu : ProcessPool — fitz 파싱, 청킹 같은 CPU-bound 작업 (함수/인자는 pickle 가능해야 함)
+    두 풀 모두 크기가 고정되어 있어 ingest 가 몰려도 event loop 는 막히지 않는다.
+    """
+
+    _io: Optional[ThreadPoolExecutor] = None
+    _cpu: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def io(cls) -> ThreadPoolExecutor:
+        if cls._io is None:
+            cls._io = ThreadPoolExecutor(
+                max_workers=settings.IO_EXECUTOR_WORKERS,
+                thread_name_prefix="io-executor",
+            )
+        return cls._io
+
+    @classmethod
+    def cpu(cls) -> ProcessPoolExecutor:
+        if cls._cpu is None:
+            # uvicorn 스레드가 떠 있는 상태에서 fork 하지 않도록 spawn 사용
+            cls._cpu = ProcessPoolExecutor(
+                max_workers=settings.CPU_EXECUTOR_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return cls._cpu
+
+    @classmethod
+    def shutdown(cls):
+        if cls._io is not None:
+            cls._io.shutdown(wait=False, cancel_futures=True)
+            cls._io = None
+        if cls._cpu is not None:
+            cls._cpu.shutdown(wait=False, cancel_futures=True)
+            cls._cpu = None
+        logger.info("executors shut down")
+
+
+async def _run(executor: Executor, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+
+
+async def run_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """blocking I/O 함수를 io 스레드 풀에서 실행."""
+    return await _run(ExecutorRegistry.io(), fn, *args, **kwargs)
+
+
+async def run_cpu(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """CPU-bound 함수를 프로세스 풀에서 실행."""
+    return await _run(ExecutorRegistry.cpu(), fn, *args, **kwargs)
@@ -0,0 +1,42 @@
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ImageStore:
+    """
+    content-hash 기반 이미지 저장소.
+    - 같은 이미지는 페이지/문서가 달라도 한 번만 디스크에 기록된다
+    - 경로: {root}/{hash[:2]}/{hash}.{ext}
+    """
+
+    def __init__(self, root_dir: str):
+        self.root = Path(root_dir)
+
+    def path_for(self, image_hash: str, ext: str) -> Path:
+        return self.root / image_hash[:2] / f"{image_hash}.{ext}"
+
+    def put(self, data: bytes, ext: str) -> str:
+        image_hash = hashlib.sha256(data).hexdigest()
+        path = self.path_for(image_hash, ext)
+        if path.exists():
+            return image_hash
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 동시 저장 대비: 임시 파일에 쓰고 rename
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        logger.debug("image stored -> %s", path)
+        return image_hash
@@ -0,0 +1,38 @@
+import time
+from typing import Any, Iterable
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from app.domain.job.entity.ingest_job import IngestJob, StageTiming
+
+
+class StageTimingCallback(BaseCallbackHandler):
+    """
+    LCEL 단계(RunnableLambda name) 별 시작/종료 시각을 IngestJob 에 기록하는 callback.
+    stage_names 에 포함된 이름만 기록한다.
+    """
+
+    # event loop 에서 바로 실행 (별도 스레드로 넘기지 않음)
+    run_inline = True
+
+    def __init__(self, job: IngestJob, stage_names: Iterable[str]):
+        self.job = job
+        self.stage_names = set(stage_names)
+        self._runs: dict[UUID, StageTiming] = {}
+
+    def on_chain_start(self, serialized: dict[str, Any], inputs: dict[str, Any], *, run_id: UUID, **kwargs: Any):
+        name = kwargs.get("name")
+        if name in self.stage_names:
+            self._runs[run_id] = self.job.start_stage(name)
+
+    def on_chain_end(self, outputs: dict[str, Any], *, run_id: UUID, **kwargs: Any):
+        stage = self._runs.pop(run_id, None)
+        if stage is not None:
+            stage.finished_at = time.time()
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        stage = self._runs.pop(run_id, None)
+        if stage is not None:
+            stage.finished_at = time.time()
+            stage.error = repr(error)
@@ -1,14 +1,103 @@
+from typing import Iterable, Optional
+from uuid import uuid4
+
 from openai import vector_stores
 
 from langchain_core.documents import Document
 
+from app.core.config import settings
+from app.infrastructure.dedup.chunk_deduplicator import ChunkDeduplicator, DedupMode, DedupResult, get_chunk_deduplicator
+
 class Upsert():
-    def __init__(self, embed_model,embed_repository):
+    def __init__(self, embed_model,embed_repository, deduplicate: Optional[bool] = None):
         self.embed_model = embed_model
         self.embed_repository = embed_repository(self.embed_model)
+        # None 이면 DEDUP_ENABLED 설정을 따른다
+        self.deduplicate = settings.DEDUP_ENABLED if deduplicate is None else deduplicate
+
+    def _deduplicator(self, collection: str) -> Optional[ChunkDeduplicator]:
+        return get_chunk_deduplicator(collection) if self.deduplicate else None
+
+    def _alive(self, collection: str):
+        # 인덱스가 가리키는 원본 point 가 Qdrant 에 아직 있는지 확인 (지워진 point 와 중복 판정 방지)
+        return lambda ids: self.embed_repository.existing_ids(collection, ids)
+
+    def _commit(self, dedup: ChunkDeduplicator, result: DedupResult, collection: str):
+        # 적재가 끝난 뒤 인덱스에 기록, alias 모드면 중복 청크의 출처를 원본 point 에 합친다
+        dedup.commit(result)
+        if dedup.mode == DedupMode.ALIAS:
+            self.embed_repository.append_aliases(collection, result.aliases_by_canonical())
+
+    def upsert(self,docs:list[Document],collection:str = "document",ids:Optional[list[str]] = None):
+        vector_stores = self.embed_repository.get_vectorstore(collection)
+        dedup = self._deduplicator(collection)
+        result = None
+        if dedup is not None:
+            # 이미 적재된 청크와 거의 같은 청크는 임베딩/적재하지 않는다
+            result = dedup.filter(docs, ids, alive=self._alive(collection))
+            docs, ids = result.docs, result.ids
+        # ids 를 주면 같은 id 의 point 를 덮어쓴다 (재적재 시 중복 방지)
+        if docs:
+            vector_stores.add_documents(docs, ids=ids)
+        if result is not None:
+            self._commit(dedup, result, collection)
+
+    def upsert_vectors(
+            self,
+            docs: list[Document],
+            vectors: list[list[float]],
+            collection: str = "document",
+            ids: Optional[list[str]] = None,
+    ) -> int:
+        """
+        청크 벡터를 이미 가진 문서(semantic chunk 의 문장 벡터 평균 등)를 임베딩 없이 적재한다.
+        반환값은 (중복 제거 후) 적재한 문서 수.
+        """
+        ids = list(ids) if ids is not None else [str(uuid4()) for _ in docs]
+        dedup = self._deduplicator(collection)
+        result = None
+        if dedup is not None:
+            result = dedup.filter(docs, ids, alive=self._alive(collection))
+            kept = set(result.ids)
+            vectors = [v for v, point_id in zip(vectors, ids) if point_id in kept]
+            docs, ids = result.docs, result.ids
+        if docs:
+            self.embed_repository.upsert_vectors(
+                collection,
+                [doc.page_content for doc in docs],
+                [doc.metadata for doc in docs],
+                vectors,
+                ids,
+            )
+        if result is not None:
+            self._commit(dedup, result, collection)
+        return len(docs)
 
-    def upsert(self,docs:list[Document],collection:str = "document"):
+    def upsert_stream(self, docs: Iterable[Document], collection: str = "document", batch_size: int = 64) -> int:
+        """
+        문서가 도착하는 대로 batch_size 단위로 임베딩/적재한다.
+        반환값은 (중복 제거 후) 적재한 문서 수.
+        """
         vector_stores = self.embed_repository.get_vectorstore(collection)
-        vector_stores.add_documents(docs)
+        dedup = self._deduplicator(collection)
 
+        def flush(batch: list[Document]) -> int:
+            if dedup is None:
+                vector_stores.add_documents(batch)
+                return len(batch)
+            result = dedup.filter(batch, alive=self._alive(collection))
+            if result.docs:
+                vector_stores.add_documents(result.docs, ids=result.ids)
+            self._commit(dedup, result, collection)
+            return len(result.docs)
 
+        batch: list[Document] = []
+        total = 0
+        for doc in docs:
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                total += flush(batch)
+                batch = []
+        if batch:
+            total += flush(batch)
+        return total
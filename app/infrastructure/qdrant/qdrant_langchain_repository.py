@@ -32,13 +32,16 @@
 #         return vectorstore.as_retriever(
 #             search_kwargs={"k": k}
 #         )
-from qdrant_client.http.models import Filter, FieldCondition, MatchValue,Range
-from qdrant_client.models import VectorParams, Distance
+from typing import Iterator, Optional
+
+from qdrant_client.http.models import Filter, FieldCondition, FilterSelector, MatchAny, MatchValue, Range
+from qdrant_client.models import VectorParams, Distance, PointStruct
 from langchain_qdrant import Qdrant
 from app.infrastructure.qdrant.qdrant_client_factory import QdrantClientFactory
 from langchain_core.embeddings import Embeddings
 from qdrant_client import QdrantClient
 
+from app.infrastructure.dedup.chunk_deduplicator import forget_collection, forget_points, has_dedup_index
 from app.infrastructure.vector_store.vector_filter import VectorFilter
 
 from app.infrastructure.vector_store.vector_db import VectorDB
@@ -83,9 +86,137 @@ class QdrantLangchainRepository(VectorDB):
             embeddings=self.embed_model,
         )
 
+    def upsert_vectors(
+            self,
+            collection: str,
+            texts: list[str],
+            metadatas: list[dict],
+            vectors: list[list[float]],
+            ids: list[str],
+            batch_size: int = 256,
+    ):
+        """
+        이미 계산된 벡터로 바로 적재한다 (임베딩 호출 없음).
+        payload 는 langchain Qdrant 와 같은 형태라 get_retriever 로 그대로 검색된다.
+        """
+        self._ensure_collection(collection)
+        points = [
+            PointStruct(
+                id=point_id,
+                vector=list(vector),
+                payload={Qdrant.CONTENT_KEY: text, Qdrant.METADATA_KEY: metadata},
+            )
+            for text, metadata, vector, point_id in zip(texts, metadatas, vectors, ids)
+        ]
+        for i in range(0, len(points), batch_size):
+            self.client.upsert(collection_name=collection, points=points[i:i + batch_size], wait=True)
+
     def delete_collection(self, collection: str):
         if self.client.collection_exists(collection):
             self.client.delete_collection(collection)
+        forget_collection(collection)
+
+    def _build_filter(
+            self,
+            filters: list[VectorFilter],
+            exclude: Optional[list[VectorFilter]] = None,
+    ) -> Filter:
+        return Filter(
+            must=[self.filter_adapter(f) for f in filters],
+            must_not=[self.filter_adapter(f) for f in exclude or []] or None,
+        )
+
+    def scroll_payload(
+            self,
+            collection: str,
+            filters: list[VectorFilter],
+            fields: list[str],
+            batch_size: int = 256,
+    ) -> Iterator[dict]:
+        """
+        filter 에 맞는 point 의 payload 일부(fields)만 페이지 단위로 훑는다 (벡터는 가져오지 않음).
+        """
+        if not self.client.collection_exists(collection):
+            return
+
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=collection,
+                scroll_filter=self._build_filter(filters),
+                limit=batch_size,
+                offset=offset,
+                with_payload=fields,
+                with_vectors=False,
+            )
+            for point in points:
+                yield {"id": point.id, **(point.payload or {})}
+            if offset is None:
+                return
+
+    def delete_by_filter(
+            self,
+            collection: str,
+            filters: list[VectorFilter],
+            exclude: Optional[list[VectorFilter]] = None,
+    ):
+        if not self.client.collection_exists(collection):
+            return
+        qdrant_filter = self._build_filter(filters, exclude)
+        # dedup 인덱스가 있으면 지울 point id 를 먼저 모아 인덱스에서도 지운다
+        point_ids = self._scroll_ids(collection, qdrant_filter) if has_dedup_index(collection) else []
+        self.client.delete(
+            collection_name=collection,
+            points_selector=FilterSelector(filter=qdrant_filter),
+            wait=True,
+        )
+        if point_ids:
+            forget_points(collection, point_ids)
+
+    def _scroll_ids(self, collection: str, qdrant_filter: Filter, batch_size: int = 1024) -> list[str]:
+        ids, offset = [], None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=collection,
+                scroll_filter=qdrant_filter,
+                limit=batch_size,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
+            )
+            ids.extend(str(point.id) for point in points)
+            if offset is None:
+                return ids
+
+    def existing_ids(self, collection: str, ids: list[str]) -> set[str]:
+        """ids 중 컬렉션에 아직 있는 point id."""
+        if not ids or not self.client.collection_exists(collection):
+            return set()
+        points = self.client.retrieve(collection_name=collection, ids=ids, with_payload=False, with_vectors=False)
+        return {str(point.id) for point in points}
+
+    def append_aliases(self, collection: str, aliases: dict[str, list[dict]]):
+        """
+        중복으로 적재하지 않은 청크의 출처(metadata)를 원본 point 의 metadata.aliases 에 추가한다.
+        (metadata.aliases[].file_name 등으로 중복 문서 쪽에서도 원본 청크를 찾을 수 있다)
+        """
+        if not aliases or not self.client.collection_exists(collection):
+            return
+        points = self.client.retrieve(
+            collection_name=collection,
+            ids=list(aliases),
+            with_payload=[f"{Qdrant.METADATA_KEY}.aliases"],
+            with_vectors=False,
+        )
+        for point in points:
+            existing = ((point.payload or {}).get(Qdrant.METADATA_KEY) or {}).get("aliases") or []
+            self.client.set_payload(
+                collection_name=collection,
+                payload={"aliases": [*existing, *aliases[str(point.id)]]},
+                points=[point.id],
+                key=Qdrant.METADATA_KEY,
+                wait=True,
+            )
 
     def get_retriever(self, collection: str, filters:list[VectorFilter], k: int = 10):
         search_kwargs = {"k":k}
@@ -114,6 +245,11 @@ class QdrantLangchainRepository(VectorDB):
                 key = vector_filter.key,
                 match = MatchValue(value = vector_filter.value)
             )
+        if vector_filter.filter_type == 'match_any':
+            return FieldCondition(
+                key = vector_filter.key,
+                match = MatchAny(any = vector_filter.value)
+            )
         if vector_filter.filter_type == 'range':
             return FieldCondition(
                 key = vector_filter.key,
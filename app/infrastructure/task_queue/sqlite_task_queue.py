@@ -0,0 +1,206 @@
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from app.core.config import settings
+from app.infrastructure.task_queue.task_queue import Task, TaskQueue, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id      TEXT PRIMARY KEY,
+    queue        TEXT NOT NULL,
+    payload      TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_token  TEXT,
+    error        TEXT,
+    created_at   REAL NOT NULL,
+    updated_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks (queue, status, available_at);
+"""
+
+_COLUMNS = (
+    "task_id, payload, status, attempts, max_attempts, lease_token, error, created_at, updated_at"
+)
+
+
+class SqliteTaskQueue(TaskQueue):
+    """
+    SQLite 기반 작업 큐 (한 호스트의 여러 worker 프로세스가 같은 db 파일을 공유)
+    - WAL + BEGIN IMMEDIATE 로 dequeue 를 직렬화해 같은 task 를 두 worker 가 가져가지 않는다
+    - lease 상태의 task 는 available_at(= lease 만료 시각) 이 지나면 다시 dequeue 대상이 된다
+    - ack / nack / extend 는 lease_token 이 일치할 때만 반영 (만료 후 재전달된 task 보호)
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        queue: str = "ingest",
+        visibility_timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        self.db_path = db_path or settings.TASK_QUEUE_SQLITE_PATH
+        self.queue = queue
+        self.visibility_timeout = visibility_timeout or settings.TASK_QUEUE_VISIBILITY_TIMEOUT
+        self.max_attempts = max_attempts or settings.TASK_QUEUE_MAX_ATTEMPTS
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # 프로세스/스레드 간 공유하지 않도록 호출마다 연결한다
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA busy_timeout=30000")
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_task(row: tuple) -> Task:
+        task_id, payload, status, attempts, max_attempts, lease_token, error, created_at, updated_at = row
+        return Task(
+            task_id=task_id,
+            payload=json.loads(payload),
+            status=TaskStatus(status),
+            attempts=attempts,
+            max_attempts=max_attempts,
+            lease_token=lease_token,
+            error=error,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    def enqueue(self, payload: dict[str, Any], max_attempts: Optional[int] = None) -> str:
+        task_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO tasks (task_id, queue, payload, status, attempts, max_attempts, "
+                "available_at, created_at, updated_at) VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                (
+                    task_id, self.queue, json.dumps(payload, ensure_ascii=False),
+                    TaskStatus.QUEUED.value, max_attempts or self.max_attempts, now, now, now,
+                ),
+            )
+        return task_id
+
+    def dequeue(self, visibility_timeout: Optional[float] = None) -> Optional[Task]:
+        now = time.time()
+        lease_token = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # lease 가 만료됐는데 더 이상 시도할 수 없는 task 는 dead-letter
+                conn.execute(
+                    "UPDATE tasks SET status = ?, error = COALESCE(error, 'visibility timeout'), "
+                    "lease_token = NULL, updated_at = ? "
+                    "WHERE queue = ? AND status = ? AND available_at <= ? AND attempts >= max_attempts",
+                    (TaskStatus.DEAD.value, now, self.queue, TaskStatus.LEASED.value, now),
+                )
+                row = conn.execute(
+                    "SELECT task_id FROM tasks "
+                    "WHERE queue = ? AND status IN (?, ?) AND available_at <= ? "
+                    "ORDER BY available_at LIMIT 1",
+                    (self.queue, TaskStatus.QUEUED.value, TaskStatus.LEASED.value, now),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                conn.execute(
+                    "UPDATE tasks SET status = ?, attempts = attempts + 1, lease_token = ?, "
+                    "available_at = ?, updated_at = ? WHERE task_id = ?",
+                    (
+                        TaskStatus.LEASED.value, lease_token,
+                        now + (visibility_timeout or self.visibility_timeout), now, row[0],
+                    ),
+                )
+                task = conn.execute(
+                    f"SELECT {_COLUMNS} FROM tasks WHERE task_id = ?", (row[0],)
+                ).fetchone()
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return self._to_task(task)
+
+    def ack(self, task: Task) -> bool:
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE tasks SET status = ?, lease_token = NULL, error = NULL, updated_at = ? "
+                "WHERE task_id = ? AND status = ? AND lease_token = ?",
+                (TaskStatus.DONE.value, time.time(), task.task_id, TaskStatus.LEASED.value, task.lease_token),
+            )
+        if cur.rowcount == 0:
+            logger.warning("ack ignored (lease lost) -> %s", task.task_id)
+        return cur.rowcount == 1
+
+    def nack(self, task: Task, error: str, retry_delay: float = 0.0) -> TaskStatus:
+        now = time.time()
+        status = TaskStatus.DEAD if task.attempts >= task.max_attempts else TaskStatus.QUEUED
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE tasks SET status = ?, lease_token = NULL, error = ?, available_at = ?, updated_at = ? "
+                "WHERE task_id = ? AND status = ? AND lease_token = ?",
+                (
+                    status.value, error, now + retry_delay, now,
+                    task.task_id, TaskStatus.LEASED.value, task.lease_token,
+                ),
+            )
+        if cur.rowcount == 0:
+            logger.warning("nack ignored (lease lost) -> %s", task.task_id)
+            return TaskStatus.LEASED
+        return status
+
+    def extend(self, task: Task, visibility_timeout: Optional[float] = None) -> bool:
+        now = time.time()
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE tasks SET available_at = ?, updated_at = ? "
+                "WHERE task_id = ? AND status = ? AND lease_token = ?",
+                (
+                    now + (visibility_timeout or self.visibility_timeout), now,
+                    task.task_id, TaskStatus.LEASED.value, task.lease_token,
+                ),
+            )
+        return cur.rowcount == 1
+
+    def get(self, task_id: str) -> Optional[Task]:
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM tasks WHERE task_id = ?", (task_id,)
+            ).fetchone()
+        return self._to_task(row) if row else None
+
+    def stats(self) -> dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM tasks WHERE queue = ? GROUP BY status",
+                (self.queue,),
+            ).fetchall()
+        counts = {status.value: 0 for status in TaskStatus}
+        counts.update(dict(rows))
+        return counts
+
+    def dead_letters(self, limit: int = 100) -> list[Task]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM tasks WHERE queue = ? AND status = ? "
+                "ORDER BY updated_at DESC LIMIT ?",
+                (self.queue, TaskStatus.DEAD.value, limit),
+            ).fetchall()
+        return [self._to_task(row) for row in rows]
@@ -0,0 +1,77 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+
+class TaskStatus(str, Enum):
+    QUEUED = "queued"
+    LEASED = "leased"
+    DONE = "done"
+    DEAD = "dead"
+
+
+@dataclass
+class Task:
+    task_id: str
+    payload: dict[str, Any]
+    status: TaskStatus = TaskStatus.QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    lease_token: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "status": self.status.value,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "payload": self.payload,
+        }
+
+
+class TaskQueue(ABC):
+    """
+    at-least-once 작업 큐
+    - dequeue 된 task 는 visibility_timeout 동안 다른 worker 에게 보이지 않는다
+    - 그 안에 ack 되지 않으면 다시 전달된다 (worker 가 죽은 경우)
+    - nack / 재전달이 max_attempts 를 넘으면 DEAD (dead-letter) 로 옮긴다
+    """
+
+    @abstractmethod
+    def enqueue(self, payload: dict[str, Any], max_attempts: Optional[int] = None) -> str:
+        pass
+
+    @abstractmethod
+    def dequeue(self, visibility_timeout: Optional[float] = None) -> Optional[Task]:
+        pass
+
+    @abstractmethod
+    def ack(self, task: Task) -> bool:
+        pass
+
+    @abstractmethod
+    def nack(self, task: Task, error: str, retry_delay: float = 0.0) -> TaskStatus:
+        pass
+
+    @abstractmethod
+    def extend(self, task: Task, visibility_timeout: Optional[float] = None) -> bool:
+        pass
+
+    @abstractmethod
+    def get(self, task_id: str) -> Optional[Task]:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        pass
+
+    @abstractmethod
+    def dead_letters(self, limit: int = 100) -> list[Task]:
+        pass
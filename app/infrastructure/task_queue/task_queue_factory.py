@@ -0,0 +1,23 @@
+from enum import Enum
+from typing import Optional
+
+from app.core.config import settings
+from app.infrastructure.task_queue.sqlite_task_queue import SqliteTaskQueue
+from app.infrastructure.task_queue.task_queue import TaskQueue
+
+
+class TaskQueueType(str, Enum):
+    SQLITE = "sqlite"
+
+
+class TaskQueueFactory:
+
+    @staticmethod
+    def get_queue(
+            queue_type: Optional[TaskQueueType] = None,
+            queue: str = "ingest",
+    ) -> TaskQueue:
+        queue_type = TaskQueueType(queue_type or settings.TASK_QUEUE_TYPE)
+        if queue_type == TaskQueueType.SQLITE:
+            return SqliteTaskQueue(queue=queue)
+        raise ValueError(f"unsupported task queue type: {queue_type}")
@@ -0,0 +1,77 @@
+import hashlib
+import logging
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from fastapi import UploadFile
+
+logger = logging.getLogger(__name__)
+
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class SpooledUpload:
+    """디스크에 한 번 spool 된 업로드 파일."""
+    path: str
+    filename: str
+    size: int
+    sha256: str
+
+
+async def save_upload(
+    file: UploadFile,
+    spool_dir: Optional[str] = None,
+    chunk_size: int = SPOOL_CHUNK_SIZE,
+) -> SpooledUpload:
+    """
+    업로드를 chunk 단위로 디스크에 기록하고 sha256 을 같이 계산한다.
+    파일 삭제는 호출자 책임 (요청 이후에도 살아있어야 하는 job 업로드용).
+    """
+    if spool_dir:
+        Path(spool_dir).mkdir(parents=True, exist_ok=True)
+
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(suffix=Path(file.filename or "").suffix, dir=spool_dir)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := await file.read(chunk_size):
+                out.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    logger.info("upload spooled -> %s (%d bytes)", tmp_path, size)
+    return SpooledUpload(
+        path=tmp_path,
+        filename=file.filename,
+        size=size,
+        sha256=digest.hexdigest(),
+    )
+
+
+@asynccontextmanager
+async def spool_upload(
+    file: UploadFile,
+    spool_dir: Optional[str] = None,
+    chunk_size: int = SPOOL_CHUNK_SIZE,
+) -> AsyncIterator[SpooledUpload]:
+    """
+    업로드를 chunk 단위로 임시 파일에 한 번만 기록하고 경로를 넘긴다.
+    - 전체 업로드를 메모리에 올리지 않음 (await file.read() 대체)
+    - 기록하면서 sha256 도 같이 계산해 캐시 조회에 다시 읽지 않도록 함
+    - context 종료 시 임시 파일 삭제
+    """
+    upload = await save_upload(file, spool_dir, chunk_size)
+    try:
+        yield upload
+    finally:
+        if os.path.exists(upload.path):
+            os.unlink(upload.path)
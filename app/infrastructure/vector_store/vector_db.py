@@ -15,4 +15,19 @@ class VectorDB(ABC):
         pass
     @abstractmethod
     def get_retriever(self,collection:str,filters:list[VectorFilter], k:int):
-        pass
\ No newline at end of file
+        pass
+    @abstractmethod
+    def scroll_payload(self,collection:str,filters:list[VectorFilter],fields:list[str]):
+        pass
+    @abstractmethod
+    def delete_by_filter(self,collection:str,filters:list[VectorFilter],exclude:list[VectorFilter]=None):
+        pass
+    @abstractmethod
+    def upsert_vectors(self,collection:str,texts:list[str],metadatas:list[dict],vectors:list[list[float]],ids:list[str]):
+        pass
+    @abstractmethod
+    def append_aliases(self,collection:str,aliases:dict[str,list[dict]]):
+        pass
+    @abstractmethod
+    def existing_ids(self,collection:str,ids:list[str]) -> set[str]:
+        pass
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Literal, Optional
 
-FilterType = Literal["match", "range"]
+FilterType = Literal["match", "match_any", "range"]
 
 @dataclass
 class VectorFilter:
@@ -21,6 +21,14 @@ class VectorFilter:
             value=value
         )
 
+    @classmethod
+    def match_any(cls, key: str, values: list[Any]) -> "VectorFilter":
+        return cls(
+            key=key,
+            filter_type="match_any",
+            value=list(values)
+        )
+
     @classmethod
     def range(
             cls,
@@ -47,6 +55,12 @@ class VectorFilter:
                 "match_text": self.value
             }
 
+        if self.filter_type == "match_any":
+            return {
+                "key": self.key,
+                "match": {"any": self.value}
+            }
+
         if self.filter_type == "range":
             range_body = {
                 k: v
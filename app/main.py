@@ -6,7 +6,9 @@ import sys
 
 from app.api.v1.router import api_router
 from app.core.config import settings
-from kiwipiepy import Kiwi
+from app.service.chunk.nlp.nlp_service import get_kiwi
+
+from app.infrastructure.executor.executor import ExecutorRegistry
 
 def create_application() -> FastAPI:
     """Create and configure the FastAPI application instance."""
@@ -36,4 +38,10 @@ app = create_application()
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting up...")
-    app.state.kiwi = Kiwi()  # 앱 상태에 저장
+    app.state.kiwi = get_kiwi()  # 서비스와 같은 프로세스 단위 Kiwi 를 앱 상태에도 저장
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    logger.info("Shutting down...")
+    ExecutorRegistry.shutdown()
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.service.llm_routing_service import RoutingContentMode
+
+
+class RouteBatchPathsRequest(BaseModel):
+    """서버 디스크에 있는 파일들을 일괄 라우팅할 때의 요청."""
+    paths: list[str] = Field(default_factory=list, description="라우팅할 파일 경로 목록 (ROUTING_PATH_ROOT 기준)")
+    directory: Optional[str] = Field(default=None, description="ROUTING_PATH_ROOT 안 이 디렉터리 아래 pattern 에 맞는 파일 전체")
+    pattern: str = Field(default="*.pdf", description="directory 검색 glob 패턴")
+    recursive: bool = Field(default=True, description="하위 디렉터리 포함 여부")
+    concurrency: Optional[int] = Field(default=None, ge=1, description="동시 처리 파일 수")
+    content_mode: Optional[RoutingContentMode] = None
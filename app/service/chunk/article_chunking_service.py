@@ -1,104 +1,344 @@
+import asyncio
+import bisect
+import logging
 import re
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from app.core.config import settings
+from app.domain.document.chunk.service.token_chunker import TokenChunker, count_tokens, token_limits
+from app.domain.document.entity.chunk_span import ChunkSource, ChunkSpan
+from app.domain.document.entity.doc import Doc
+from app.domain.document.entity.documentinfo import DocumentInfo
+from app.domain.document.entity.document_type import DocumentType
+
+logger = logging.getLogger(__name__)
+
+_CIRCLED = "①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳"
+
+# 장 / 부칙 / 조 / 항 / 호 를 한 번의 finditer 로 훑는 패턴.
+# - 조/장 뒤에 한글이 바로 붙으면(제3조에, 제1장의) 본문 속 참조로 보고 제외
+# - 항은 ①② 와, 정규화(NFKC + 줄 합치기)로 숫자가 된 "\n2 ..." 형태를 함께 인식
+_STRUCTURE = re.compile(
+    r"(?<![^\s#*>])(?:"
+    r"(?P<chapter>제\s*\d+\s*[장절관])(?![가-힣])[ \t]*(?P<chapter_title>[^\n]*?)(?=[ \t]*제\s*\d+\s*조|\n|$)"
+    r"|(?P<addenda>부\s*칙)(?![가-힣])"
+    r"|(?P<article>제\s*(?P<article_no>\d+)\s*조(?:\s*의\s*(?P<article_sub>\d+))?)(?![가-힣])"
+    r"(?:[ \t*]*\((?P<article_title>[^)\n]*)\)(?![가-힣]))?"
+    r"|(?P<clause>[①-⑳])"
+    r"|(?P<item_no>\d{1,2})\.(?=[ \t])"
+    r"|(?P<plain_clause_no>\d{1,2})(?=[ \t])"
+    r")",
+    re.M,
+)
+
+
+@dataclass(slots=True)
+class Clause:
+    number: int                 # 0 = 항 번호 없이 시작하는 조 본문
+    start: int
+    end: int = -1
+    items: list[int] = field(default_factory=list)   # 호 시작 위치
+
+
+@dataclass(slots=True)
+class Article:
+    label: str                  # "제3조", "제3조의2"
+    title: Optional[str]
+    start: int
+    end: int = -1
+    chapter: Optional[str] = None
+    addenda: int = 0            # 0 = 본칙, n = n번째 부칙
+    clauses: list[Clause] = field(default_factory=list)
+
+
+def _line_start(text: str, pos: int) -> bool:
+    line = text[text.rfind("\n", 0, pos) + 1:pos]
+    return not line.strip(" \t#*>")
+
+
+# 조 번호 뒤에 이어지면 제목이 아니라 본문 속 참조 ("제10조 제1항에 따른", "제5조 에 따라")
+_REFERENCE_TAIL = re.compile(r"[ \t]*(?:제\s*\d+\s*[항호]|에|의|부터)")
+
+
+def scan_articles(text: str) -> list[Article]:
+    """
+    규정 텍스트를 한 번 훑어 조 / 항 / 호 구조를 만든다.
+    - 조는 제목 형태(줄 첫머리 또는 "(제목)")이고 참조 꼬리(제N항, 에/의/부터)가 없을 때만 인정
+    - 조 번호는 증가해야만 새 조로 인정, 부칙에서 다시 시작
+    - 항/호 번호도 직전 번호 + 1 일 때만 인정
+    """
+    articles: list[Article] = []
+    article: Optional[Article] = None
+    chapter: Optional[str] = None
+    addenda = 0
+    last_key = (0, 0)
+    heading_end = -1            # 직전 조 제목이 끝난 위치 (제목 바로 뒤 "1 ..." 은 첫 항)
+    last_item = 0
+
+    def close(pos: int):
+        nonlocal article
+        if article is None:
+            return
+        article.end = pos
+        if article.clauses:
+            article.clauses[-1].end = pos
+        articles.append(article)
+        article = None
+
+    for m in _STRUCTURE.finditer(text):
+        if m["chapter"]:
+            close(m.start())
+            title = m["chapter_title"].strip(" \t*#")
+            chapter = re.sub(r"\s+", "", m["chapter"]) + (f" {title}" if title else "")
+        elif m["addenda"]:
+            close(m.start())
+            addenda += 1
+            chapter = None
+            last_key = (0, 0)
+        elif m["article"]:
+            # 제목으로 쓰인 조만 인정: 줄 첫머리이거나 (제목) 이 붙어 있고, 참조 꼬리가 없어야 한다
+            if not (m["article_title"] is not None or _line_start(text, m.start())):
+                continue
+            if _REFERENCE_TAIL.match(text, m.end()):
+                continue
+            key = (int(m["article_no"]), int(m["article_sub"] or 0))
+            if key <= last_key:
+                continue
+            close(m.start())
+            last_key = key
+            label = f"제{key[0]}조" + (f"의{key[1]}" if key[1] else "")
+            article = Article(label, m["article_title"], m.start(), chapter=chapter, addenda=addenda)
+            heading_end = m.end()
+            last_item = 0
+        elif article is not None:
+            if m["clause"]:
+                number = _CIRCLED.index(m["clause"]) + 1
+            elif m["plain_clause_no"]:
+                number = int(m["plain_clause_no"])
+                if not (_line_start(text, m.start()) or not text[heading_end:m.start()].strip()):
+                    continue
+            else:
+                number = 0
+
+            if number:
+                if number != (article.clauses[-1].number if article.clauses else 0) + 1:
+                    continue
+                if article.clauses:
+                    article.clauses[-1].end = m.start()
+                article.clauses.append(Clause(number, m.start()))
+                last_item = 0
+            elif int(m["item_no"]) == last_item + 1:
+                last_item += 1
+                if not article.clauses:
+                    article.clauses.append(Clause(0, heading_end))
+                article.clauses[-1].items.append(m.start())
+
+    close(len(text))
+    return articles
 
-ARTICLE_PATTERN = re.compile(r"제\s*\d+\s*조")
-CLAUSE_PATTERN = re.compile(r"(\d+)\s*항")
 
 class ArticleChunkingService:
+    """
+    조(parent) / 항(child) 계층 청킹 (POLICY 문서).
+    - parent: 조 전체, metadata.chunk_id 로 식별
+    - child: 항 단위 ChunkSpan (원문 공유), metadata.parent_id 로 parent 와 연결
+    - min_tokens 보다 짧은 항은 이웃 항과 합치고, max_tokens 를 넘는 항은 호 경계 -> 토큰 기준으로 나눈다
+    - 첫 조 앞(제목, 개정 이력 등)은 parent 없이 토큰 기준 child 로 만든다
+    - asummarize: 조 요약을 semaphore 로 동시 호출 수를 제한해 만든다
+    """
+
     def __init__(
         self,
-        doc:string
+        max_tokens: Optional[int] = None,
+        min_tokens: Optional[int] = None,
+        count: Optional[Callable[[str], int]] = None,
     ):
+        self.max_tokens = max_tokens or token_limits(DocumentType.POLICY)[0]
+        self.min_tokens = settings.ARTICLE_MIN_CLAUSE_TOKENS if min_tokens is None else min_tokens
+        self.count = count or count_tokens
+        self.chunker = TokenChunker(self.max_tokens, 0, count=self.count)
+
+    # =================================================
+    # 청킹
+    # =================================================
+    def chunk(self, doc: DocumentInfo) -> DocumentInfo:
+        """doc.content 를 조/항 단위로 나눠 parent + child 를 child_documents 에 넣는다."""
+        parents, children = self.split(doc.content, doc.metadata, self._page_starts(doc))
+        doc.set_child_document([*parents, *children])
+        return doc
 
-    def split_by_articles(text):
-        parts = ARTICLE_PATTERN.split(text)
-        articles = ARTICLE_PATTERN.findall(text)
-
-        result = []
-        for i, title in enumerate(articles):
-            body = parts[i+1].strip()
-            result.append((title, body))
-        return result
-    def tokenize_len(text):
-    return len(tokenizer(text)["input_ids"])
-
-
-    def split_article_into_clauses(article_title, article_body):
-    # 항 split
-    parts = CLAUSE_PATTERN.split(article_body)
-    # CLAUSE_PATTERN.split → [before, 항번호1, 내용1, 항번호2, 내용2, ...]
-    
-    clauses = []
-    i = 1
-    while i < len(parts):
-        clause_no = parts[i].strip()
-        clause_body = parts[i+1].strip()
-        clauses.append((clause_no, clause_body))
-        i += 2
-    
-    # 항이 없는 문서 → 조 전체 처리
-    if len(clauses) == 0:
-        return [ (article_title, None, article_body) ]
-
-    final_chunks = []
-
-    for clause_no, body in clauses:
-        t_len = tokenize_len(body)
-
-        # 항이 너무 짧으면 조합해둘 용도로 표시
-        if t_len < MIN_CLAUSE_TOKENS:
-            final_chunks.append((article_title, clause_no, body, "short"))
-        else:
-            # 항이 너무 길면 내부 문단 기반 나누기
-            paragraphs = body.split("\n\n")
-            buffer = []
-            for p in paragraphs:
-                if tokenize_len("\n\n".join(buffer + [p])) > MAX_CHUNK_TOKENS:
-                    final_chunks.append((article_title, clause_no, "\n\n".join(buffer), "normal"))
-                    buffer = [p]
-                else:
-                    buffer.append(p)
-            if buffer:
-                final_chunks.append((article_title, clause_no, "\n\n".join(buffer), "normal"))
-
-    return final_chunks
-    
-    def merge_short_clauses(clause_chunks):
-        full_body = []
-        final = []
-
-        for title, clause_no, body, ctype in clause_chunks:
-            full_body.append(f"{clause_no}항\n{body}\n")
-
-            # short이면 조 전체 chunk로 merge 대상
-        full_chunk = (title, None, "\n".join(full_body), "full")
-
-        # normal chunk만 유지하고 short는 버리고 full chunk로 대체
-        normal_chunks = [c for c in clause_chunks if c[3] == "normal"]
-
-        return [full_chunk] + normal_chunks
-    def create_summary(text, article_title):
-        prompt = f"""
-            다음은 {article_title}의 전체 내용입니다.
-            핵심 내용을 150토큰 이내로 요약해주세요.
-
-            내용:
-            {text}
+    def split(
+        self,
+        text: str,
+        metadata: Optional[dict] = None,
+        page_starts: Optional[list[tuple[int, int]]] = None,
+    ) -> tuple[list[Doc], list[ChunkSpan]]:
+        metadata = metadata or {}
+        articles = scan_articles(text)
+        doc_key = str(metadata.get("doc_uuid") or metadata.get("file_name") or uuid.uuid4())
+
+        parents: list[Doc] = []
+        children: list[tuple[ChunkSource, int, int, int]] = []
+
+        preamble_end = articles[0].start if articles else len(text)
+        if text[:preamble_end].strip():
+            source = ChunkSource(text, {**metadata, "article": None})
+            children.extend((source, s, e, n) for s, e, n in self._token_split(text, 0, preamble_end))
+
+        for article in articles:
+            parent_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{doc_key}:{article.addenda}:{article.label}"))
+            header = {
+                "article": article.label,
+                "article_title": article.title,
+                "chapter": article.chapter,
+                "addenda": article.addenda,
+            }
+            if page_starts:
+                header["page"] = page_starts[bisect.bisect_right(page_starts, (article.start, float("inf"))) - 1][1]
+
+            end = article.end
+            while end > article.start and text[end - 1].isspace():
+                end -= 1
+            parents.append(Doc.from_normalized(
+                text[article.start:end],
+                {**metadata, **header, "role": "parent", "chunk_id": parent_id},
+            ))
+            source = ChunkSource(text, {**metadata, **header, "parent_id": parent_id})
+            children.extend((source, s, e, n) for s, e, n in self._article_units(text, article, end))
+
+        spans = [
+            ChunkSpan(source, s, e, chunk_index=i, total_chunks=len(children), tokens=n)
+            for i, (source, s, e, n) in enumerate(children)
+        ]
+        logger.info("article chunk -> articles=%d, children=%d", len(parents), len(spans))
+        return parents, spans
+
+    def _article_units(self, text: str, article: Article, end: int) -> list[tuple[int, int, int]]:
+        # 조 제목 ~ 첫 항 사이는 첫 항에 붙여 조 전체를 빈틈없이 나눈다
+        bounds = [article.start, *(c.start for c in article.clauses[1:]), end]
+        items = [c.items for c in article.clauses] or [[]]
+
+        units: list[tuple[int, int, int]] = []
+        for (s, e), clause_items in zip(zip(bounds, bounds[1:]), items):
+            s, e = self._strip(text, s, e)
+            if s >= e:
+                continue
+            n = self.count(text[s:e])
+            if n <= self.max_tokens:
+                units.append((s, e, n))
+            else:
+                units.extend(self._split_long(text, s, e, clause_items))
+        return self._merge(units)
+
+    def _split_long(self, text: str, start: int, end: int, items: list[int]) -> list[tuple[int, int, int]]:
+        """긴 항은 호 경계로 나눈 뒤 max_tokens 까지 묶고, 그래도 큰 호는 토큰 기준으로 자른다."""
+        pieces: list[tuple[int, int, int]] = []
+        edges = [start, *(i for i in items if start < i < end), end]
+        for s, e in zip(edges, edges[1:]):
+            s, e = self._strip(text, s, e)
+            if s >= e:
+                continue
+            n = self.count(text[s:e])
+            pieces.extend([(s, e, n)] if n <= self.max_tokens else self._token_split(text, s, e))
+
+        grouped: list[tuple[int, int, int]] = []
+        for s, e, n in pieces:
+            if grouped and grouped[-1][2] + n + 1 <= self.max_tokens:
+                grouped[-1] = (grouped[-1][0], e, grouped[-1][2] + n + 1)
+            else:
+                grouped.append((s, e, n))
+        return grouped
+
+    def _merge(self, units: list[tuple[int, int, int]]) -> list[tuple[int, int, int]]:
+        """min_tokens 보다 짧은 항은 다음 항과 합친다 (마지막 짧은 항은 앞 청크에 붙임)."""
+        merged: list[tuple[int, int, int]] = []
+        for s, e, n in units:
+            if merged and merged[-1][2] < self.min_tokens and merged[-1][2] + n + 1 <= self.max_tokens:
+                merged[-1] = (merged[-1][0], e, merged[-1][2] + n + 1)
+            else:
+                merged.append((s, e, n))
+        if len(merged) > 1 and merged[-1][2] < self.min_tokens and merged[-2][2] + merged[-1][2] + 1 <= self.max_tokens:
+            last = merged.pop()
+            merged[-1] = (merged[-1][0], last[1], merged[-1][2] + last[2] + 1)
+        return merged
+
+    def _token_split(self, text: str, start: int, end: int) -> list[tuple[int, int, int]]:
+        return [(start + s, start + e, n) for s, e, n in self.chunker.split(text[start:end])]
+
+    @staticmethod
+    def _strip(text: str, start: int, end: int) -> tuple[int, int]:
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    @staticmethod
+    def _page_starts(doc: DocumentInfo) -> Optional[list[tuple[int, int]]]:
+        """content 가 페이지 Doc 들을 "\\n\\n" 으로 이은 것이면 (페이지 시작 위치, page) 목록."""
+        pages = [d for d in doc.documents if "page" in d.metadata]
+        if not pages or len(pages) != len(doc.documents):
+            return None
+        starts, pos = [], 0
+        for d in pages:
+            starts.append((pos, d.metadata["page"]))
+            pos += len(d.content) + 2
+        return starts if pos - 2 == len(doc.content) else None
+
+    # =================================================
+    # 조 요약
+    # =================================================
+    async def asummarize(self, parents: list[Doc], concurrency: Optional[int] = None) -> list[Doc]:
         """
-        res = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=200
-        )
-        return res.choices[0].message.content
-    def build_chunks_for_article(article_title, article_body):
-        clause_chunks = split_article_into_clauses(article_title, article_body)
-        merged = merge_short_clauses(clause_chunks)
+        parent(조) 마다 요약 Doc 을 만든다. 동시 LLM 호출은 concurrency 개로 제한하고,
+        실패한 조는 건너뛴다 (요약은 검색 보조용이라 적재 전체를 실패시키지 않음).
+        """
+        from app.domain.llm.prompt.prompt_registry import PromptRegistry
+        from app.domain.llm.prompt.prompt_type import PromptType
+        from app.domain.llm.services.llm_client import LlmClient
+
+        client = LlmClient(model=settings.OPENAI_MODEL)
+        system_prompt = PromptRegistry.get(PromptType.ARTICLE_SUMMARIZATION)
+        semaphore = asyncio.Semaphore(concurrency or settings.ARTICLE_SUMMARY_CONCURRENCY)
+
+        async def summarize(parent: Doc) -> Optional[Doc]:
+            async with semaphore:
+                try:
+                    summary = await client.aask(system_prompt, parent.content)
+                except Exception:
+                    logger.exception("조 요약 실패: %s", parent.metadata.get("article"))
+                    return None
+            return Doc.from_normalized(summary.strip(), {
+                **{k: v for k, v in parent.metadata.items() if k != "chunk_id"},
+                "role": "summary",
+                "parent_id": parent.metadata["chunk_id"],
+            })
+
+        results = await asyncio.gather(*(summarize(parent) for parent in parents))
+        return [doc for doc in results if doc is not None]
+
+    def chunk_with_summaries(self, doc: DocumentInfo, summarize: Optional[bool] = None) -> DocumentInfo:
+        """achunk 의 동기 버전 (sync / stream 경로용, event loop 밖의 스레드에서 호출)."""
+        doc = self.chunk(doc)
+        if settings.ARTICLE_SUMMARY_ENABLED if summarize is None else summarize:
+            self._append_summaries(doc, asyncio.run(self.asummarize(self._parents(doc))))
+        return doc
 
-        # full chunk는 title=None로 들어 있음
-        full_chunk_text = [x for x in merged if x[3] == "full"][0][2]
-        summary = create_summary(full_chunk_text, article_title)
+    async def achunk(self, doc: DocumentInfo, summarize: Optional[bool] = None) -> DocumentInfo:
+        """chunk 는 CPU 풀에서, 요약(ARTICLE_SUMMARY_ENABLED)은 event loop 에서 동시에."""
+        from app.infrastructure.executor.executor import run_cpu
 
-        summary_chunk = (article_title, "summary", summary, "summary")
+        doc = await run_cpu(self.chunk, doc)
+        if settings.ARTICLE_SUMMARY_ENABLED if summarize is None else summarize:
+            self._append_summaries(doc, await self.asummarize(self._parents(doc)))
+        return doc
 
-        return merged + [summary_chunk]
+    @staticmethod
+    def _parents(doc: DocumentInfo) -> list[Doc]:
+        return [d for d in doc.child_documents if d.metadata.get("role") == "parent"]
 
+    @staticmethod
+    def _append_summaries(doc: DocumentInfo, summaries: list[Doc]) -> None:
+        doc.set_child_document([*doc.child_documents, *summaries])
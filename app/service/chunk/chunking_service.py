@@ -1,55 +1,126 @@
-from langchain_experimental.text_splitter import SemanticChunker
-from langchain_openai.embeddings import OpenAIEmbeddings
-from dotenv import load_dotenv
+import bisect
 import logging
-import json
+from typing import Optional
+
+from dotenv import load_dotenv
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import settings
+from app.infrastructure.cache.embedding_cache import CachedEmbeddings
+from app.service.chunk.semantic_chunker import SemanticChunk, SemanticChunker, sentence_spans
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+
+def default_embeddings() -> Embeddings:
+    """적재에 쓰는 것과 같은 임베딩 모델 (EMBEDDING_CACHE_ENABLED 면 캐시로 감쌈)."""
+    from app.domain.llm.embedding.openai_embeding_service import OpenAIEmbed
+
+    embeddings = OpenAIEmbed().embeddings
+    return CachedEmbeddings(embeddings) if settings.EMBEDDING_CACHE_ENABLED else embeddings
+
+
 class ChunkingService:
+    """
+    SemanticChunker 기반 의미 단위 청킹.
+    - embeddings 를 주지 않으면 적재용 모델(OpenAIEmbed)을 캐시로 감싸 사용
+    - derive_vectors=True 면 청크 벡터를 문장 벡터에서 만들어 chunk_and_upsert 가 재임베딩 없이 적재
+      (청킹 모델과 컬렉션 모델이 같을 때만 의미가 있으므로 기본 모델일 때만 켠다)
+    """
+
     def __init__(
-        self, 
-        threshold_type: str = "percentile", 
-        threshold_amount: int = 90,
-        embeddings: OpenAIEmbeddings = OpenAIEmbeddings(),
+        self,
+        threshold_type: Optional[str] = None,
+        threshold_amount: Optional[float] = None,
+        embeddings: Optional[Embeddings] = None,
+        derive_vectors: Optional[bool] = None,
     ):
-        self.threshold_type = threshold_type
-        self.threshold_amount = threshold_amount
-        self.embeddings = embeddings
-
-    def split_text(self, text: str) -> list[str]:
-        text_splitter = SemanticChunker(
-            embeddings=self.embeddings,
-            breakpoint_threshold_type=self.threshold_type,
-            breakpoint_threshold_amount=self.threshold_amount
+        self.threshold_type = threshold_type or settings.SEMANTIC_CHUNK_THRESHOLD_TYPE
+        self.threshold_amount = (
+            settings.SEMANTIC_CHUNK_THRESHOLD_AMOUNT if threshold_amount is None else threshold_amount
         )
-        return text_splitter.split_text(text)
-    
-
-    def split_text_with_metadata(self, docs:list[dict]) ->list[str]:
-        text_splitter = SemanticChunker(
-            embeddings=self.embeddings,
-            breakpoint_threshold_type=self.threshold_type,
-            breakpoint_threshold_amount=self.threshold_amount
+        self._embeddings = embeddings
+        self.derive_vectors = (
+            (settings.SEMANTIC_CHUNK_DERIVE_VECTORS and embeddings is None)
+            if derive_vectors is None else derive_vectors
         )
 
-        full_text = "\n".join([doc["text"] for doc in docs])
+    @property
+    def embeddings(self) -> Embeddings:
+        # import 시점이 아니라 실제 청킹할 때 OpenAI 클라이언트를 만든다
+        if self._embeddings is None:
+            self._embeddings = default_embeddings()
+        return self._embeddings
 
-        # logger.info("Full Text:\n" + json.dumps(full_text, ensure_ascii=False, indent=2))
+    def _chunker(self) -> SemanticChunker:
+        return SemanticChunker(
+            self.embeddings,
+            threshold_type=self.threshold_type,
+            threshold_amount=self.threshold_amount,
+            buffer_size=settings.SEMANTIC_CHUNK_BUFFER_SIZE,
+            derive_vectors=self.derive_vectors,
+            sentence_splitter=self._sentence_splitter(),
+        )
+
+    @staticmethod
+    def _sentence_splitter():
+        # Kiwi 는 문장부호 없이 끝나는 한국어 문장(…한다 / …함)도 나눈다
+        if settings.SEMANTIC_CHUNK_SENTENCE_SPLITTER == "kiwi":
+            from app.service.chunk.nlp.nlp_service import NLPService
 
-        cuhnk_result = text_splitter.split_text(full_text)
+            return NLPService().split_sentences
+        return sentence_spans
 
-        logger.info("chunkResult:\n" + json.dumps(cuhnk_result, ensure_ascii=False, indent=2))
+    def split(self, text: str) -> list[SemanticChunk]:
+        return self._chunker().split(text)
 
-        return "test"
-        # chunkResult = text_splitter.split_text()
+    def split_text(self, text: str) -> list[str]:
+        return [chunk.text for chunk in self.split(text)]
 
+    def split_text_with_metadata(self, docs: list[dict]) -> list[dict]:
+        """
+        페이지 단위 결과([{"page", "text", ...}])를 이어 붙여 청킹하고,
+        각 청크가 걸친 페이지 번호를 함께 돌려준다.
+        """
+        starts, parts, pos = [], [], 0
+        for doc in docs:
+            starts.append(pos)
+            parts.append(doc["text"])
+            pos += len(doc["text"]) + 1
+        full_text = "\n".join(parts)
 
+        result = []
+        for index, chunk in enumerate(self.split(full_text)):
+            first = bisect.bisect_right(starts, chunk.start) - 1
+            last = bisect.bisect_right(starts, max(chunk.start, chunk.end - 1)) - 1
+            result.append({
+                "text": chunk.text,
+                "chunk_index": index,
+                "pages": [docs[i].get("page", i + 1) for i in range(first, last + 1)],
+            })
+        return result
 
-        
-        # return text_splitter.split_text_with_metadata(text)
-    
-    
+    def chunk_and_upsert(self, text: str, collection: str, metadata: Optional[dict] = None) -> dict:
+        """청킹 후 바로 적재. 청크 벡터가 있으면 임베딩 없이, 없으면 일반 upsert."""
+        from app.domain.llm.embedding.openai_embeding_service import OpenAIEmbed
+        from app.infrastructure.langchain.upsert import Upsert
+        from app.infrastructure.qdrant.qdrant_langchain_repository import QdrantLangchainRepository
 
+        chunks = self.split(text)
+        docs = [
+            Document(
+                page_content=chunk.text,
+                metadata={**(metadata or {}), "chunk_index": i, "total_chunks": len(chunks), "role": "child"},
+            )
+            for i, chunk in enumerate(chunks)
+        ]
+        upsert = Upsert(OpenAIEmbed().embeddings, QdrantLangchainRepository)
+        if chunks and all(chunk.vector is not None for chunk in chunks):
+            count = upsert.upsert_vectors(docs, [chunk.vector for chunk in chunks], collection)
+        else:
+            upsert.upsert(docs, collection)
+            count = len(docs)
+        return {"chunks": [chunk.text for chunk in chunks], "upsert_count": count}
@@ -1,89 +1,154 @@
-from fastapi import Request
+import logging
+import re
 import time
-class NLPService:
-    def test(self, request: Request, text: str):
-        kiwi = request.app.state.kiwi   # 앱에 로딩된 Kiwi 사용
+from functools import lru_cache
+from typing import Iterable, Optional
 
-        # 시작 시간
-        start = time.perf_counter()
-        tokens = kiwi.tokenize(text)
+import numpy as np
+from kiwipiepy import Kiwi
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# is_broken 규칙 6: 허용하지 않는 특수문자 (isalnum 이 아니고 " .,-()" 도 아닌 문자)
+_SPECIAL = re.compile(r"[^\w .,\-()]|_")
+# 문장 분할을 여러 스레드에 나누기 위한 블록 경계 (빈 줄)
+_BLOCK = re.compile(r"\n\s*\n")
+_SUBJECT_OBJECT = ("JKS", "JKO")
 
-        result = [
-            {
-                "form": tok.form,
-                "tag": tok.tag,
-                "start": tok.start,
-                "len": tok.len
-            }
-            for tok in tokens
-        ]
 
-      # 종료 시간
-        end = time.perf_counter()
+@lru_cache(maxsize=None)
+def get_kiwi(num_workers: Optional[int] = None) -> Kiwi:
+    """
+    프로세스 단위 Kiwi (앱 / 서비스 / worker 프로세스 공용).
+    list 입력은 num_workers 개 스레드로 나눠 분석한다.
+    """
+    num_workers = settings.KIWI_NUM_WORKERS if num_workers is None else num_workers
+    # num_workers=0 (단일 스레드) 은 list 입력(batch)을 지원하지 않으므로 최소 1개 worker
+    return Kiwi(num_workers=num_workers or 1)
 
-        # 경과 시간 계산
-        elapsed = end - start
-        print(f"[NLPService.test] 실행 시간: {elapsed:.6f}초 ({elapsed*1000:.3f}ms)")
 
+class NLPService:
+    """
+    Kiwi 형태소 분석 서비스 (FastAPI Request 와 무관).
+    - tokenize_many / is_broken_many / split_sentences_many: list 입력을 Kiwi batch API 한 번으로 처리
+    - is_broken 규칙은 batch 전체의 POS tag 를 하나의 배열로 펼쳐 numpy 로 한 번에 계산
+    """
+
+    def __init__(self, kiwi: Optional[Kiwi] = None):
+        self.kiwi = kiwi or get_kiwi()
+
+    def test(self, text: str):
+        start = time.perf_counter()
+        result = [
+            {"form": tok.form, "tag": tok.tag, "start": tok.start, "len": tok.len}
+            for tok in self.kiwi.tokenize(text)
+        ]
+        elapsed = time.perf_counter() - start
+        logger.info("[NLPService.test] 실행 시간: %.3fms", elapsed * 1000)
+        return result
 
+    def tokenize_many(self, texts: Iterable[str]) -> list[list]:
+        texts = list(texts)
+        if not texts:
+            return []
+        return list(self.kiwi.tokenize(texts))
+
+    # =================================================
+    # 깨진 문장 판별
+    # =================================================
+    def is_broken(self, text: str) -> bool:
+        return self.is_broken_many([text])[0]
+
+    def is_broken_many(self, texts: Iterable[str]) -> list[bool]:
+        """
+        문장마다 아래 규칙 중 하나라도 맞으면 깨진 문장으로 본다.
+          1. 동사(V*) 없음
+          2. 명사(N*) 3개 이상 연속
+          3. 명사 + 명사 + 조사(J*)
+          4. 마지막 주격/목적격 조사(JKS/JKO) 뒤에 동사 없음
+          5. 토큰 3개 이하이고 모두 명사
+          6. 허용하지 않는 특수문자 3개 초과
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        token_lists = self.tokenize_many(texts)
+
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(texts))
+        tags = [token.tag for tokens in token_lists for token in tokens]
+        first = np.array([tag[0] for tag in tags], dtype="U1") if tags else np.empty(0, dtype="U1")
+        is_verb = first == "V"
+        is_noun = first == "N"
+        is_josa = first == "J"
+        is_subject_object = np.fromiter((tag in _SUBJECT_OBJECT for tag in tags), dtype=bool, count=len(tags))
+
+        # 토큰 -> 문장 번호, 문장 안 위치
+        sentence = np.repeat(np.arange(len(texts)), lengths)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        position = np.arange(len(tags)) - np.repeat(offsets, lengths)
+
+        def per_sentence_any(mask: np.ndarray) -> np.ndarray:
+            return np.bincount(sentence[mask], minlength=len(texts)) > 0
+
+        def per_sentence_max(values: np.ndarray) -> np.ndarray:
+            result = np.full(len(texts), -1, dtype=np.int64)
+            np.maximum.at(result, sentence, values)
+            return result
+
+        # 같은 문장 안에서 i, i+1, i+2 번째 토큰
+        same = np.zeros(len(tags), dtype=bool)
+        if len(tags) > 2:
+            same[:-2] = sentence[:-2] == sentence[2:]
+        noun_run = np.zeros(len(tags), dtype=bool)
+        noun_josa = np.zeros(len(tags), dtype=bool)
+        if len(tags) > 2:
+            noun_run[:-2] = same[:-2] & is_noun[:-2] & is_noun[1:-1] & is_noun[2:]
+            noun_josa[:-2] = same[:-2] & is_noun[:-2] & is_noun[1:-1] & is_josa[2:]
+
+        last_subject_object = per_sentence_max(np.where(is_subject_object, position, -1))
+        last_verb = per_sentence_max(np.where(is_verb, position, -1))
+        noun_count = np.bincount(sentence[is_noun], minlength=len(texts))
+        special = np.fromiter((len(_SPECIAL.findall(text)) for text in texts), dtype=np.int64, count=len(texts))
+
+        broken = (
+            ~per_sentence_any(is_verb)                                          # 1
+            | per_sentence_any(noun_run)                                        # 2
+            | per_sentence_any(noun_josa)                                       # 3
+            | ((last_subject_object >= 0) & (last_verb < last_subject_object))  # 4
+            | ((lengths <= 3) & (noun_count == lengths))                        # 5
+            | (special > 3)                                                     # 6
+        )
+        return broken.tolist()
+
+    # =================================================
+    # 문장 분할
+    # =================================================
+    def split_sentences(self, text: str) -> list[tuple[int, int]]:
+        """text 안 문장의 (start, end). SemanticChunker 의 sentence_splitter 로 바로 쓸 수 있다."""
+        return self.split_sentences_many([text])[0]
+
+    def split_sentences_many(self, texts: Iterable[str]) -> list[list[tuple[int, int]]]:
+        """
+        문서를 빈 줄 기준 블록으로 나눠 모든 문서의 블록을 한 번의 split_into_sents 로 분석한다
+        (긴 페이지 하나도 여러 스레드에 나뉘어 처리됨). 반환 위치는 각 원문 기준.
+        """
+        texts = list(texts)
+        blocks: list[tuple[int, int]] = []      # (문서 번호, 블록 시작 위치)
+        block_texts: list[str] = []
+        for doc_index, text in enumerate(texts):
+            pos = 0
+            for match in [*_BLOCK.finditer(text), None]:
+                end = match.start() if match else len(text)
+                if text[pos:end].strip():
+                    blocks.append((doc_index, pos))
+                    block_texts.append(text[pos:end])
+                pos = match.end() if match else pos
+
+        result: list[list[tuple[int, int]]] = [[] for _ in texts]
+        if not block_texts:
+            return result
+        for (doc_index, base), sentences in zip(blocks, self.kiwi.split_into_sents(block_texts)):
+            result[doc_index].extend((base + s.start, base + s.end) for s in sentences)
         return result
-    
-
-    def is_broken(self, request: Request, text: str) -> bool:
-        kiwi = request.app.state.kiwi   # 앱에 로딩된 Kiwi 사용
-        tokens = kiwi.tokenize(text)
-        pos = [t.tag for t in tokens]
-
-        # 규칙 1: 동사 없음
-        if not any(p.startswith("V") for p in pos):
-            return True
-
-        # 규칙 2: 명사 연속 3개 이상
-        streak = 0
-        for p in pos:
-            if p.startswith("N"):
-                streak += 1
-                if streak >= 3:
-                    return True
-            else:
-                streak = 0
-
-        # 규칙 3: NN + NN + 조사 패턴
-        for i in range(len(pos)-2):
-            if pos[i].startswith("N") and pos[i+1].startswith("N") and pos[i+2].startswith("J"):
-                return True
-
-        # 규칙 4: 조사 이후 동사 없음
-        if "JKS" in pos or "JKO" in pos:
-            last_j = max(i for i, p in enumerate(pos) if p in ("JKS","JKO"))
-            if not any(p.startswith("V") for p in pos[last_j:]):
-                return True
-
-        # 규칙 5: 너무 짧고 명사만 있는 문장
-        if len(tokens) <= 3 and all(p.startswith("N") for p in pos):
-            return True
-
-        # 규칙 6: 특수문자 비정상 많음
-        special = sum(1 for ch in text if not ch.isalnum() and ch not in " .,-()")
-        if special > 3:
-            return True
-
-        return False
-
-
-
-    # def analyze(self, text, llama_type):
-    #     tokens = self.kiwi.tokenize(text)
-
-    #     # 1) LlamaParse 타입을 우선 사용
-    #     if llama_type in ["heading", "title", "list-item", "table-header"]:
-    #         return { "broken": False, "type": llama_type }
-
-    #     # 2) LlamaParse가 normal이라면 → 형태소 분석으로 품질 검사
-    #     broken = self.is_broken_sentence(text, tokens, "sentence")
-
-    #     return {
-    #         "type": llama_type,
-    #         "broken": broken,
-    #         "tokens": [...]
-    #     }
\ No newline at end of file
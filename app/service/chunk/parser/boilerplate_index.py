@@ -0,0 +1,128 @@
+import math
+import re
+from collections import Counter
+from typing import Iterable, List, Optional
+
+from app.core.config import settings
+
+_DIGITS = re.compile(r"\d+")
+
+
+def boilerplate_key(line: str) -> str:
+    """
+    페이지마다 달라지는 숫자(쪽 번호, 날짜)를 # 로 바꾼 비교용 키.
+    "- 3 -", "- 12 -" -> "- # -" / "3 / 10", "4 / 10" -> "# / #"
+    """
+    return _DIGITS.sub("#", " ".join(line.split()))
+
+
+class BoilerplateIndex:
+    """
+    한 문서 안에서 페이지 머리/꼬리에 반복되는 줄(러닝 타이틀, 쪽 번호, 대외비 문구 등) 빈도 인덱스.
+    - observe(page_index, text) 로 페이지를 파싱하는 동안 위/아래 edge_lines 줄의 키를 센다
+    - min_pages 이상, 그리고 지금까지 본 페이지의 min_ratio 이상에서 나온 줄을 boilerplate 로 판단
+    - 키는 (위/아래에서 몇 번째 줄인지, 숫자를 # 로 바꾼 줄) 이라 같은 자리에 반복되는 줄만 잡는다
+      ("제#조" 처럼 숫자만 다른 본문 제목이 우연히 페이지 맨 위에 오는 경우를 줄이기 위함)
+    - strip(text) 는 페이지 위/아래 구간에서만 boilerplate 줄을 지운다 (본문 중간은 건드리지 않음)
+    스트리밍으로 쓰면 임계값에 도달하기 전 앞쪽 페이지는 지워지지 않을 수 있다.
+    """
+
+    def __init__(
+        self,
+        edge_lines: int = 3,
+        min_pages: int = 3,
+        min_ratio: float = 0.5,
+        max_line_length: int = 200,
+    ):
+        self.edge_lines = edge_lines
+        self.min_pages = min_pages
+        self.min_ratio = min_ratio
+        self.max_line_length = max_line_length
+        self.counts: Counter[tuple[str, str]] = Counter()
+        self.seen_pages: set[int] = set()
+        self.removed_lines = 0
+        self.removed_chars = 0
+
+    @classmethod
+    def from_settings(cls) -> Optional["BoilerplateIndex"]:
+        if not settings.BOILERPLATE_STRIP_ENABLED:
+            return None
+        return cls(
+            edge_lines=settings.BOILERPLATE_EDGE_LINES,
+            min_pages=settings.BOILERPLATE_MIN_PAGES,
+            min_ratio=settings.BOILERPLATE_MIN_RATIO,
+        )
+
+    def _edge_slots(self, lines: List[str]) -> dict[int, List[str]]:
+        """
+        위/아래에서 각각 edge_lines 개의 비어있지 않은 줄 위치 -> 슬롯 ("h0", "t0" ...).
+        짧은 페이지에서는 한 줄이 머리/꼬리 슬롯을 모두 가질 수 있다.
+        """
+        non_blank = [i for i, line in enumerate(lines) if line.strip()]
+        slots: dict[int, List[str]] = {}
+        for n, i in enumerate(non_blank[:self.edge_lines]):
+            slots.setdefault(i, []).append(f"h{n}")
+        for n, i in enumerate(reversed(non_blank[-self.edge_lines:] if self.edge_lines else [])):
+            slots.setdefault(i, []).append(f"t{n}")
+        return slots
+
+    def observe(self, page_index: int, text: str) -> None:
+        # route 샘플링 등으로 같은 페이지를 다시 읽어도 한 번만 센다
+        if page_index in self.seen_pages:
+            return
+        self.seen_pages.add(page_index)
+
+        lines = text.splitlines()
+        keys = {
+            (slot, boilerplate_key(lines[i]))
+            for i, slots in self._edge_slots(lines).items()
+            if len(lines[i]) <= self.max_line_length
+            for slot in slots
+        }
+        self.counts.update(keys)
+
+    def threshold(self) -> int:
+        return max(self.min_pages, math.ceil(self.min_ratio * len(self.seen_pages)))
+
+    def is_boilerplate(self, line: str, slots: Iterable[str]) -> bool:
+        if len(self.seen_pages) < self.min_pages or len(line) > self.max_line_length:
+            return False
+        key = boilerplate_key(line)
+        threshold = self.threshold()
+        return bool(key) and any(self.counts[(slot, key)] >= threshold for slot in slots)
+
+    def boilerplate_lines(self) -> List[str]:
+        threshold = self.threshold()
+        lines = [key for (_, key), count in self.counts.most_common() if count >= threshold]
+        return list(dict.fromkeys(lines))
+
+    def strip(self, text: str) -> str:
+        if len(self.seen_pages) < self.min_pages:
+            return text
+
+        lines = text.splitlines()
+        drop = {i for i, slots in self._edge_slots(lines).items() if self.is_boilerplate(lines[i], slots)}
+        if not drop:
+            return text
+
+        self.removed_lines += len(drop)
+        self.removed_chars += sum(len(lines[i]) for i in drop)
+        return "\n".join(line for i, line in enumerate(lines) if i not in drop)
+
+    def observe_and_strip(self, page_index: int, text: str) -> str:
+        self.observe(page_index, text)
+        return self.strip(text)
+
+    def strip_pages(self, texts: Iterable[str]) -> List[str]:
+        """전체 페이지를 먼저 센 뒤 지운다 (모든 페이지가 같은 기준으로 정리됨)."""
+        texts = list(texts)
+        for page_index, text in enumerate(texts):
+            self.observe(page_index, text)
+        return [self.strip(text) for text in texts]
+
+    def stats(self) -> dict:
+        return {
+            "boilerplate_lines": self.boilerplate_lines(),
+            "boilerplate_removed_lines": self.removed_lines,
+            "boilerplate_removed_chars": self.removed_chars,
+        }
@@ -5,6 +5,56 @@ from dotenv import load_dotenv
 import logging
 load_dotenv()
 logger = logging.getLogger(__name__)
+
+# 따옴표/대시/특수 공백 문자 매핑 (normalize_punctuation 의 re.sub 3번 + replace 2번을 한 번의 translate 로)
+_PUNCTUATION_TABLE = str.maketrans({
+    **dict.fromkeys("“”«»‟", '"'),
+    **dict.fromkeys("‘’‚‛", "'"),
+    **dict.fromkeys("\u2010\u2011\u2012–—─", "-"),
+    "\u00A0": " ",
+    "\u200B": None,
+})
+_HYPHENATED_LINEBREAK = re.compile(r"(\w+)-\n(\w+)")
+_SENTENCE_END = re.compile(r"[.!?…]$|[다요죠]\s*$")  # 단순 한국어 종결 어미 포함
+# 줄 끝/앞 공백이 이미 제거된 줄의 마지막 글자로 _SENTENCE_END 를 판단할 때 사용
+_SENTENCE_END_CHARS = frozenset(".!?…다요죠")
+
+
+def _is_word_char(ch: str) -> bool:
+    """정규식 \\w 와 같은 판정 (유니코드 문자/숫자 또는 _)."""
+    return ch.isalnum() or ch == "_"
+
+
+def _join_hyphenated_linebreaks(text: str) -> str:
+    """
+    _HYPHENATED_LINEBREAK.sub(r"\\1\\2", text) 와 같은 결과를 정규식 없이 만든다.
+    - "-\\n" 위치만 str.find 로 찾는다 (모든 위치에서 \\w+ 를 시도하지 않음)
+    - 매칭이 다음 줄의 단어 전체를 소비하는 규칙도 그대로 따른다: "a-\\nb-\\nc" -> "ab-\\nc"
+    """
+    i = text.find("-\n")
+    if i == -1:
+        return text
+
+    n = len(text)
+    parts: List[str] = []
+    start = 0       # 아직 parts 에 넣지 않은 구간 시작
+    consumed = 0    # 직전 매칭이 끝난 위치 (정규식의 다음 탐색 시작점)
+    while i != -1:
+        j = i + 2
+        if i - 1 >= consumed and j < n and _is_word_char(text[i - 1]) and _is_word_char(text[j]):
+            parts.append(text[start:i])
+            start = j
+            j += 1
+            while j < n and _is_word_char(text[j]):
+                j += 1
+            consumed = j
+            i = text.find("-\n", j)
+        else:
+            i = text.find("-\n", i + 1)
+    parts.append(text[start:])
+    return "".join(parts)
+
+
 class TextParseProcessor:
     def __init__(self):
         pass
@@ -50,17 +100,7 @@ class TextParseProcessor:
         - 다양한 따옴표를 " 로 통일
         - 긴 대시(—, –)를 보통 하이픈(-)으로 통일
         """
-        # 따옴표
-        text = re.sub(r"[“”«»‟]", '"', text)
-        text = re.sub(r"[‘’‚‛]", "'", text)
-
-        # 대시류
-        text = re.sub(r"[‐-‒–—─]", "-", text)
-
-        # 특수 공백 제거
-        text = text.replace("\u00A0", " ").replace("\u200B", "")
-
-        return text
+        return text.translate(_PUNCTUATION_TABLE)
 
 
     # 4) 줄바꿈+하이픈으로 쪼개진 단어 붙이기
@@ -72,7 +112,7 @@ class TextParseProcessor:
         처럼 줄 끝 하이픈 + 줄바꿈으로 쪼개진 단어 복원
         """
         # 단어중간 하이픈 + 개행 제거
-        return re.sub(r"(\w+)-\n(\w+)", r"\1\2", text)
+        return _HYPHENATED_LINEBREAK.sub(r"\1\2", text)
 
 
     # 5) 한 문장인데 줄바꿈으로 쪼개진 경우 합치기
@@ -86,8 +126,6 @@ class TextParseProcessor:
         merged_lines: List[str] = []
         buffer = ""
 
-        sentence_end_pattern = re.compile(r"[.!?…]$|[다요죠]\s*$")  # 단순 한국어 종결 어미 포함
-
         for line in lines:
             if not line:
                 if buffer:
@@ -100,7 +138,7 @@ class TextParseProcessor:
                 buffer = line
             else:
                 # 이전 줄이 문장 끝이 아니면 이어붙임
-                if not sentence_end_pattern.search(buffer):
+                if not _SENTENCE_END.search(buffer):
                     buffer += " " + line.lstrip()
                 else:
                     merged_lines.append(buffer.strip())
@@ -110,7 +148,85 @@ class TextParseProcessor:
             merged_lines.append(buffer.strip())
 
         return "\n".join(merged_lines)
-    
+
+
+    # 6) 지정한 머리글/바닥글/상용 문구 제거
+    @staticmethod
+    def strip_boilerplate(
+        text: str,
+        header_patterns: Optional[Iterable[str]] = None,
+        footer_patterns: Optional[Iterable[str]] = None,
+        boilerplate_phrases: Optional[Iterable[str]] = None,
+    ) -> str:
+        """
+        - header_patterns: 텍스트 맨 위에서부터 연속으로 일치(fullmatch)하는 줄 제거
+        - footer_patterns: 텍스트 맨 아래에서부터 연속으로 일치하는 줄 제거
+        - boilerplate_phrases: 위치와 상관없이 문구 자체를 제거
+        (문서 전체에서 반복되는 줄 자동 감지는 BoilerplateIndex 참고)
+        """
+        for phrase in boilerplate_phrases or ():
+            text = text.replace(phrase, "")
+
+        headers = [re.compile(p) for p in header_patterns or ()]
+        footers = [re.compile(p) for p in footer_patterns or ()]
+        if not headers and not footers:
+            return text
+
+        lines = text.splitlines()
+        start, end = 0, len(lines)
+
+        def matches(patterns, line: str) -> bool:
+            return any(p.fullmatch(line.strip()) for p in patterns)
+
+        while start < end and (not lines[start].strip() or matches(headers, lines[start])):
+            start += 1
+        while end > start and (not lines[end - 1].strip() or matches(footers, lines[end - 1])):
+            end -= 1
+        return "\n".join(lines[start:end])
+
+
+    # 7) 1~5 단계를 합친 단일 패스 정규화
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        normalize_unicode -> normalize_punctuation -> fix_hyphenated_linebreaks
+        -> normalize_whitespace -> merge_broken_lines 와 같은 결과를 한 번의 줄 순회로 만든다.
+        - 문자 치환은 translate 한 번, 하이픈 줄바꿈은 "-\\n" 위치만 검사
+        - 공백 축소/빈 줄 정리/문장 병합은 같은 줄 루프에서 처리
+        """
+        text = unicodedata.normalize("NFKC", text).translate(_PUNCTUATION_TABLE)
+        text = _join_hyphenated_linebreaks(text)
+
+        paragraphs: List[str] = []
+        buffer = ""
+        pending_blank = False
+        for raw in text.splitlines():
+            # re.sub(r"\s+", " ", line).strip() 와 동일 (\s 와 str.split 은 같은 공백 판정)
+            line = " ".join(raw.split())
+            if not line:
+                # 앞쪽 빈 줄은 버리고, 연속 빈 줄은 하나로 (뒤쪽 빈 줄은 추가하지 않음)
+                if buffer:
+                    paragraphs.append(buffer)
+                    buffer = ""
+                    pending_blank = True
+                continue
+
+            if pending_blank:
+                paragraphs.append("")
+                pending_blank = False
+
+            if not buffer:
+                buffer = line
+            elif buffer[-1] in _SENTENCE_END_CHARS:
+                paragraphs.append(buffer)
+                buffer = line
+            else:
+                buffer += " " + line
+
+        if buffer:
+            paragraphs.append(buffer)
+        return "\n".join(paragraphs)
+
         # 12) 전체 파이프라인
     def preprocess_text(
         self,
@@ -126,10 +242,6 @@ class TextParseProcessor:
 
         do_sentence_split=True 이면 문장 리스트 반환.
         """
-        text = self.normalize_unicode(text)
-        text = self.normalize_punctuation(text)
-        text = self.fix_hyphenated_linebreaks(text)
-        text = self.normalize_whitespace(text)
-        text = self.merge_broken_lines(text)
-
-        return text
\ No newline at end of file
+        if header_patterns or footer_patterns or boilerplate_phrases:
+            text = self.strip_boilerplate(text, header_patterns, footer_patterns, boilerplate_phrases)
+        return self.normalize(text)
\ No newline at end of file
@@ -0,0 +1,121 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+from app.domain.document.entity.document_type import DocumentType
+from app.service.chunk.rule.form_detector import FormDetector
+
+logger = logging.getLogger(__name__)
+
+AMBIGUOUS = "AMBIGUOUS"
+
+# 규칙으로 판정하는 유형 (열 순서 = 점수 행렬의 열 순서)
+RULE_TYPES = (DocumentType.POLICY, DocumentType.MANUAL, DocumentType.PROCEDURE, DocumentType.REPORT)
+
+# 페이지별로 세는 feature (행 순서 = 가중치 행렬의 행 순서)
+_FEATURES: tuple[tuple[str, re.Pattern], ...] = (
+    # 제N조 / 제N장 / ①② 조항 구조 → POLICY
+    ("article", re.compile(r"^\s*제\s*\d+\s*조(?:\s*의\s*\d+)?", re.M)),
+    ("chapter", re.compile(r"^\s*제\s*\d+\s*[장절관]", re.M)),
+    ("clause", re.compile(r"[①-⑳]")),
+    # 코드 / 명령어 → MANUAL
+    ("code", re.compile(
+        r"^\s*(?:```|def |class |import |from \S+ import |public |private |function |const |let |var "
+        r"|#include|SELECT |INSERT |\$ |>>> )|[;{}]\s*$",
+        re.M,
+    )),
+    ("cli", re.compile(r"(?:\s--[a-z][\w-]+|\b(?:npm|pip|git|docker|kubectl|curl|java|python)\s+\w)")),
+    # 단계 / 화면 조작 → PROCEDURE
+    ("step", re.compile(r"^\s*(?:step\s*\d+|\d+\s*단계|\[\s*\d+\s*\]|\d+\)\s)", re.M | re.I)),
+    ("ui", re.compile(r"(?:클릭|버튼|메뉴|화면|선택하|입력하)")),
+    # 분석 / 결과 → REPORT
+    ("report", re.compile(r"(?:분석|결과|현황|요약|전년|대비|증감|\d+(?:\.\d+)?\s*%)")),
+)
+
+# feature x 유형 가중치
+_WEIGHTS = np.array(
+    [
+        # POLICY MANUAL PROCEDURE REPORT
+        [3.0, 0.0, 0.0, 0.0],  # article
+        [1.5, 0.0, 0.0, 0.0],  # chapter
+        [1.0, 0.0, 0.0, 0.0],  # clause
+        [0.0, 2.0, 0.0, 0.0],  # code
+        [0.0, 1.5, 0.5, 0.0],  # cli
+        [0.0, 0.0, 2.0, 0.0],  # step
+        [0.0, 0.0, 1.0, 0.0],  # ui
+        [0.0, 0.0, 0.0, 1.0],  # report
+    ]
+)
+
+
+@dataclass
+class RuleDecision:
+    document_type: str
+    confidence: float
+    reason: str
+
+    @property
+    def resolved(self) -> bool:
+        return self.document_type != AMBIGUOUS
+
+
+class DocumentTypeRule:
+    """
+    전체 페이지에 대한 규칙 기반 문서 유형 판정.
+    - 페이지 x feature 개수 행렬을 만들고 가중치 행렬을 곱해 페이지 x 유형 점수를 구한다
+    - 페이지마다 최고 점수 유형에 투표, 서식 페이지(FormDetector)는 투표에서 제외
+    - 한 유형의 득표율과 2위와의 차이가 충분할 때만 확정, 나머지는 AMBIGUOUS (LLM 으로)
+    """
+
+    def __init__(
+        self,
+        min_page_score: float = 3.0,
+        min_share: float = 0.6,
+        min_margin: float = 0.3,
+        form_score: int = 5,
+    ):
+        self.min_page_score = min_page_score
+        self.min_share = min_share
+        self.min_margin = min_margin
+        self.form_score = form_score
+        self.form_detector = FormDetector()
+
+    @staticmethod
+    def feature_matrix(pages: list[str]) -> np.ndarray:
+        counts = np.array(
+            [[len(pattern.findall(page)) for _, pattern in _FEATURES] for page in pages],
+            dtype=float,
+        ).reshape(len(pages), len(_FEATURES))
+        # 한 페이지에 같은 패턴이 많아도 점수가 폭주하지 않도록 log 스케일
+        return np.log1p(counts)
+
+    def decide(self, pages: Iterable[str]) -> RuleDecision:
+        pages = [page for page in pages if page.strip()]
+        if not pages:
+            return RuleDecision(AMBIGUOUS, 0.0, "empty document")
+
+        body = [
+            page for page in pages
+            if self.form_detector.rule_based_form_score(page) < self.form_score
+        ] or pages
+
+        scores = self.feature_matrix(body) @ _WEIGHTS            # (pages, types)
+        best = scores.argmax(axis=1)
+        voted = scores.max(axis=1) >= self.min_page_score
+        votes = np.bincount(best[voted], minlength=len(RULE_TYPES))
+        shares = votes / len(body)
+
+        order = np.argsort(shares)[::-1]
+        top, second = shares[order[0]], shares[order[1]]
+        summary = ", ".join(f"{t.value}={s:.2f}" for t, s in zip(RULE_TYPES, shares))
+
+        if top >= self.min_share and top - second >= self.min_margin:
+            return RuleDecision(
+                RULE_TYPES[order[0]].value,
+                round(float(top), 2),
+                f"rule page share ({summary})",
+            )
+        return RuleDecision(AMBIGUOUS, round(float(top), 2), f"rule undecided ({summary})")
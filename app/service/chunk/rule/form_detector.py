@@ -7,7 +7,7 @@ class FormDetector:
     def __init__(self):
         pass
     
-    def rule_based_form_score(text:str)->int:
+    def rule_based_form_score(self, text:str)->int:
         text_lower = text.lower()
         score = 0
 
@@ -37,8 +37,8 @@ class FormDetector:
             score += 1
 
         return score
-    def rule_based_document_type(text: str) -> dict:
-        score = rule_based_form_score(text)
+    def rule_based_document_type(self, text: str) -> dict:
+        score = self.rule_based_form_score(text)
 
         if score >= 5:
             return {"type": "FORM", "reason": f"Rule score={score} (high certainty)"}
@@ -47,4 +47,4 @@ class FormDetector:
             return {"type": "NORMAL", "reason": f"Rule score={score} (likely natural language)"}
 
         # score 2~4: ambiguous → LLM에게 넘겨라
-        return {"type": "AMBIGUOUS", "reason": f"Rule score={score} (needs LLM checking)"}
\ No newline at end of file
+        return {"type": "AMBIGUOUS", "reason": f"Rule score={score} (needs LLM checking)"}
@@ -0,0 +1,133 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+_SENTENCE_END = re.compile(r"(?<=[.?!])\s+")
+
+# langchain SemanticChunker 와 같은 기본 임계값
+DEFAULT_THRESHOLD_AMOUNTS = {
+    "percentile": 95,
+    "standard_deviation": 3,
+    "interquartile": 1.5,
+    "gradient": 95,
+}
+
+
+def sentence_spans(text: str) -> list[tuple[int, int]]:
+    """문장 끝(.?!) 뒤 공백 기준으로 나눈 문장의 (start, end)."""
+    spans = []
+    pos = 0
+    for match in _SENTENCE_END.finditer(text):
+        if match.start() > pos:
+            spans.append((pos, match.start()))
+        pos = match.end()
+    if pos < len(text) and text[pos:].strip():
+        spans.append((pos, len(text.rstrip())))
+    return spans
+
+
+@dataclass
+class SemanticChunk:
+    text: str
+    start: int
+    end: int
+    sentences: tuple[int, int]              # [첫 문장, 마지막 문장 + 1)
+    vector: Optional[list[float]] = None    # derive_vectors=True 일 때 문장 벡터로 만든 청크 벡터
+
+
+class SemanticChunker:
+    """
+    문장 임베딩 거리 기반 청커 (langchain SemanticChunker 대체).
+    - 문장마다 한 번만 embed_documents 로 임베딩 (CachedEmbeddings 면 캐시/배치)
+    - 앞뒤 buffer_size 문장을 묶은 window 벡터는 문장 벡터 행렬의 sliding sum 으로 만든다 (추가 임베딩 없음)
+    - 인접 window 간 cosine distance 를 문장 행렬 전체에 대해 numpy 로 한 번에 계산
+    - threshold_type: percentile / standard_deviation / interquartile / gradient
+    - derive_vectors=True 면 청크 벡터를 문장 벡터의 길이 가중 평균으로 만들어 적재 시 재임베딩을 생략
+    - 청크 텍스트는 원문 위치(start, end) 그대로 잘라 원래 공백/줄바꿈을 유지한다
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        threshold_type: str = "percentile",
+        threshold_amount: Optional[float] = None,
+        buffer_size: int = 1,
+        derive_vectors: bool = False,
+        sentence_splitter: Callable[[str], list[tuple[int, int]]] = sentence_spans,
+    ):
+        if threshold_type not in DEFAULT_THRESHOLD_AMOUNTS:
+            raise ValueError(f"지원하지 않는 threshold_type: {threshold_type}")
+        self.embeddings = embeddings
+        self.threshold_type = threshold_type
+        self.threshold_amount = (
+            DEFAULT_THRESHOLD_AMOUNTS[threshold_type] if threshold_amount is None else threshold_amount
+        )
+        self.buffer_size = buffer_size
+        self.derive_vectors = derive_vectors
+        self.sentence_splitter = sentence_splitter
+
+    def _window_sum(self, vectors: np.ndarray) -> np.ndarray:
+        """i 번째 행 = vectors[i - buffer_size : i + buffer_size + 1] 의 합 (누적합 차이로 한 번에)."""
+        if self.buffer_size == 0:
+            return vectors
+        n = len(vectors)
+        cumulative = np.vstack([np.zeros((1, vectors.shape[1]), dtype=vectors.dtype), np.cumsum(vectors, axis=0)])
+        index = np.arange(n)
+        lo = np.maximum(index - self.buffer_size, 0)
+        hi = np.minimum(index + self.buffer_size + 1, n)
+        return cumulative[hi] - cumulative[lo]
+
+    @staticmethod
+    def _unit(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def _threshold(self, distances: np.ndarray) -> tuple[float, np.ndarray]:
+        if self.threshold_type == "percentile":
+            return float(np.percentile(distances, self.threshold_amount)), distances
+        if self.threshold_type == "standard_deviation":
+            return float(distances.mean() + self.threshold_amount * distances.std()), distances
+        if self.threshold_type == "interquartile":
+            q1, q3 = np.percentile(distances, [25, 75])
+            return float(distances.mean() + self.threshold_amount * (q3 - q1)), distances
+        gradient = np.gradient(distances) if len(distances) > 1 else distances
+        return float(np.percentile(gradient, self.threshold_amount)), gradient
+
+    def split(self, text: str) -> list[SemanticChunk]:
+        spans = self.sentence_splitter(text)
+        if not spans:
+            return []
+
+        vectors = np.asarray(self.embeddings.embed_documents([text[s:e] for s, e in spans]), dtype=np.float32)
+        sentence_unit = self._unit(vectors)
+        # 경계 거리는 window 벡터로, 청크 벡터는 문장 벡터로 (둘 다 같은 행렬에서)
+        unit = self._unit(self._window_sum(sentence_unit))
+
+        if len(spans) > 1:
+            distances = 1.0 - np.einsum("ij,ij->i", unit[:-1], unit[1:])
+            threshold, scores = self._threshold(distances)
+            breakpoints = (np.flatnonzero(scores > threshold) + 1).tolist()
+        else:
+            breakpoints = []
+
+        lengths = np.asarray([e - s for s, e in spans], dtype=np.float32)
+        chunks = []
+        for first, last in zip([0, *breakpoints], [*breakpoints, len(spans)]):
+            start, end = spans[first][0], spans[last - 1][1]
+            vector = None
+            if self.derive_vectors:
+                mean = (sentence_unit[first:last] * lengths[first:last, None]).sum(axis=0)
+                vector = (mean / (np.linalg.norm(mean) or 1.0)).tolist()
+            chunks.append(SemanticChunk(text[start:end], start, end, (first, last), vector))
+
+        logger.info("semantic chunk -> sentences=%d, chunks=%d", len(spans), len(chunks))
+        return chunks
+
+    def split_text(self, text: str) -> list[str]:
+        return [chunk.text for chunk in self.split(text)]
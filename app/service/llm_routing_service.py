@@ -1,13 +1,19 @@
 """LLM을 사용한 문서 카테고리 라우팅 서비스."""
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any, Tuple
+import time
+from typing import Optional, Dict, Any, Tuple, Iterable, AsyncIterator
 from pathlib import Path
 from enum import Enum
 
 from openai import AsyncOpenAI
 from app.core.config import settings
 from app.domain.document.services.llm_parse_service import LlamaParseService, get_llama_parse_service
+from app.domain.document.services.centroid_classifier import CentroidClassifier
+from app.domain.llm.embedding.openai_embeding_service import OpenAIEmbed
+from app.infrastructure.executor.executor import run_io
+from app.service.pdf_service import PdfService
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +28,36 @@ class DocumentCategory(str, Enum):
     GENERAL = "general"
 
 
+CATEGORY_DESCRIPTIONS: Dict[DocumentCategory, str] = {
+    DocumentCategory.LOAN_FINANCE: "대출, 금융, 투자, 보험, 예금, 신용카드 등 금융 관련 문서",
+    DocumentCategory.IT_SYSTEM: "IT 시스템, 소프트웨어, 하드웨어, 네트워크, 데이터베이스, 개발 등 IT 관련 문서",
+    DocumentCategory.SECURITY_ACCESS: "보안, 접근 권한, 인증, 암호화, 개인정보보호 등 보안 관련 문서",
+    DocumentCategory.HR: "인사, 채용, 평가, 급여, 복리후생, 조직 등 인사 관련 문서",
+    DocumentCategory.ACCOUNTING_LEGAL: "회계, 법무, 세무, 계약, 규정, 정책 등 회계/법무 관련 문서",
+    DocumentCategory.GENERAL: "위 카테고리에 해당하지 않는 일반 문서",
+}
+
+
+def category_centroid_classifier(embeddings=None) -> CentroidClassifier:
+    """
+    카테고리 설명 임베딩 centroid 분류기.
+    GENERAL 은 '나머지' 라 설명으로 centroid 를 만들 수 없으므로 제외한다.
+    대신 어느 카테고리와도 유사도가 CENTROID_MIN_SIMILARITY 미만이거나 margin 이 작으면 abstain 하고
+    LLM 이 GENERAL 여부를 판단한다.
+    """
+    return CentroidClassifier(
+        embeddings or OpenAIEmbed().embeddings,
+        {cat: desc for cat, desc in CATEGORY_DESCRIPTIONS.items() if cat != DocumentCategory.GENERAL},
+        examples_path=str(Path(settings.CENTROID_EXAMPLES_DIR) / "document_category.jsonl"),
+    )
+
+
+class RoutingContentMode(str, Enum):
+    """라우팅에 쓸 문서 내용을 얻는 방식."""
+    SAMPLE = "sample"          # fitz 로 목차/앞 페이지/중간 페이지만 샘플링
+    FULL_PARSE = "full_parse"  # LlamaParse 전체 markdown 변환 후 자르기
+
+
 class LLMRoutingService:
     """LLM을 사용하여 PDF 문서를 카테고리별로 라우팅하는 서비스."""
 
@@ -30,6 +66,10 @@ class LLMRoutingService:
         openai_api_key: Optional[str] = None,
         model: str = "gpt-4o-mini",
         llama_parse_service: Optional[LlamaParseService] = None,
+        content_mode: Optional[RoutingContentMode] = None,
+        centroid: Optional[CentroidClassifier] = None,
+        margin_threshold: Optional[float] = None,
+        min_similarity: Optional[float] = None,
     ):
         """
         LLM 라우팅 서비스 초기화.
@@ -37,7 +77,11 @@ class LLMRoutingService:
         Args:
             openai_api_key: OpenAI API 키. None인 경우 설정에서 가져옴.
             model: 사용할 LLM 모델명 (기본값: gpt-4o-mini)
-            llama_parse_service: LlamaParse 서비스 인스턴스. None인 경우 새로 생성.
+            llama_parse_service: LlamaParse 서비스 인스턴스. None인 경우 full_parse 모드에서 처음 쓸 때 생성.
+            content_mode: 문서 내용 추출 방식 (기본값: ROUTING_CONTENT_MODE 설정)
+            centroid: 카테고리 centroid 분류기. None인 경우 CENTROID_CLASSIFIER_ENABLED 이면 처음 쓸 때 생성.
+            margin_threshold: centroid top-2 유사도 차이가 이보다 작으면 LLM 호출 (기본값: CENTROID_MARGIN_THRESHOLD)
+            min_similarity: centroid top-1 유사도가 이보다 낮으면 LLM 호출 (기본값: CENTROID_MIN_SIMILARITY)
         """
         self.api_key = openai_api_key or getattr(settings, "OPENAI_API_KEY", None)
         if not self.api_key:
@@ -47,17 +91,62 @@ class LLMRoutingService:
         
         self.client = AsyncOpenAI(api_key=self.api_key)
         self.model = model
-        self.llama_parse_service = llama_parse_service or get_llama_parse_service()
+        self._llama_parse_service = llama_parse_service
+        self.content_mode = RoutingContentMode(content_mode or settings.ROUTING_CONTENT_MODE)
 
         # 카테고리 설명
-        self.category_descriptions = {
-            DocumentCategory.LOAN_FINANCE: "대출, 금융, 투자, 보험, 예금, 신용카드 등 금융 관련 문서",
-            DocumentCategory.IT_SYSTEM: "IT 시스템, 소프트웨어, 하드웨어, 네트워크, 데이터베이스, 개발 등 IT 관련 문서",
-            DocumentCategory.SECURITY_ACCESS: "보안, 접근 권한, 인증, 암호화, 개인정보보호 등 보안 관련 문서",
-            DocumentCategory.HR: "인사, 채용, 평가, 급여, 복리후생, 조직 등 인사 관련 문서",
-            DocumentCategory.ACCOUNTING_LEGAL: "회계, 법무, 세무, 계약, 규정, 정책 등 회계/법무 관련 문서",
-            DocumentCategory.GENERAL: "위 카테고리에 해당하지 않는 일반 문서",
-        }
+        self.category_descriptions = dict(CATEGORY_DESCRIPTIONS)
+        self._centroid = centroid
+        self.margin_threshold = settings.CENTROID_MARGIN_THRESHOLD if margin_threshold is None else margin_threshold
+        self.min_similarity = settings.CENTROID_MIN_SIMILARITY if min_similarity is None else min_similarity
+
+    @property
+    def centroid(self) -> Optional[CentroidClassifier]:
+        if self._centroid is None and settings.CENTROID_CLASSIFIER_ENABLED:
+            self._centroid = category_centroid_classifier()
+        return self._centroid
+
+    @property
+    def llama_parse_service(self) -> LlamaParseService:
+        # sample 모드에서는 LlamaParse 를 쓰지 않으므로 필요할 때만 생성
+        if self._llama_parse_service is None:
+            self._llama_parse_service = get_llama_parse_service()
+        return self._llama_parse_service
+
+    async def _document_content(
+        self,
+        file_path: str,
+        max_content_length: int,
+        mode: RoutingContentMode,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        라우팅 프롬프트에 넣을 문서 내용과 메타데이터를 반환합니다.
+
+        Args:
+            file_path: PDF 파일 경로
+            max_content_length: LLM에 전달할 최대 문서 길이 (문자 수)
+            mode: 문서 내용 추출 방식
+
+        Returns:
+            (문서 내용, 메타데이터) 튜플
+        """
+        if mode == RoutingContentMode.SAMPLE:
+            content, metadata = await run_io(
+                PdfService().sample_text, file_path, max_content_length
+            )
+            return content, {**metadata, "content_mode": mode.value}
+
+        parse_result = await self.llama_parse_service.parse_file_async(
+            file_path=file_path,
+            result_type="markdown",
+        )
+        document_content = parse_result["content"]
+        if len(document_content) > max_content_length:
+            document_content = document_content[:max_content_length]
+            logger.warning(
+                f"문서 내용이 {max_content_length}자를 초과하여 잘렸습니다."
+            )
+        return document_content, {**parse_result["metadata"], "content_mode": mode.value}
 
     def _get_routing_prompt(self, document_content: str) -> str:
         """
@@ -100,6 +189,7 @@ class LLMRoutingService:
         self,
         file_path: str,
         max_content_length: int = 4000,
+        content_mode: Optional[RoutingContentMode] = None,
     ) -> Dict[str, Any]:
         """
         PDF 파일을 읽어서 적절한 카테고리로 라우팅합니다.
@@ -107,6 +197,7 @@ class LLMRoutingService:
         Args:
             file_path: 라우팅할 PDF 파일 경로
             max_content_length: LLM에 전달할 최대 문서 길이 (문자 수)
+            content_mode: 문서 내용 추출 방식 (None인 경우 서비스 기본값)
 
         Returns:
             카테고리 정보와 메타데이터를 포함한 딕셔너리
@@ -128,21 +219,30 @@ class LLMRoutingService:
         try:
             logger.info(f"문서 라우팅 시작: {file_path}")
 
-            # 1. PDF 파일 파싱
-            parse_result = await self.llama_parse_service.parse_file_async(
-                file_path=file_path,
-                result_type="markdown",
+            # 1~2. 문서 내용 추출 (sample: fitz 샘플링 / full_parse: LlamaParse 후 길이 제한)
+            document_content, content_metadata = await self._document_content(
+                file_path, max_content_length, RoutingContentMode(content_mode or self.content_mode)
             )
-            document_content = parse_result["content"]
 
-            # 2. 내용 길이 제한
-            if len(document_content) > max_content_length:
-                document_content = document_content[:max_content_length]
-                logger.warning(
-                    f"문서 내용이 {max_content_length}자를 초과하여 잘렸습니다."
-                )
-
-            # 3. LLM을 통한 카테고리 분류
+            # 3. 임베딩 centroid 로 확실한 문서는 LLM 호출 없이 결정
+            if self.centroid is not None:
+                prediction = await run_io(self.centroid.predict, document_content)
+                if prediction.confident(self.margin_threshold, self.min_similarity):
+                    logger.info(
+                        f"centroid 라우팅 완료: {file_path} -> {prediction.label} (margin={prediction.margin})"
+                    )
+                    return {
+                        "category": prediction.label,
+                        "confidence": prediction.confidence_level(self.margin_threshold),
+                        "reason": f"centroid similarity (score={prediction.score}, margin={prediction.margin} over {prediction.second_label})",
+                        "metadata": {
+                            **content_metadata,
+                            "method": "centroid",
+                            "scores": prediction.scores,
+                        },
+                    }
+
+            # 4. LLM을 통한 카테고리 분류
             prompt = self._get_routing_prompt(document_content)
             
             response = await self.client.chat.completions.create(
@@ -161,11 +261,11 @@ class LLMRoutingService:
                 max_tokens=200,
             )
 
-            # 4. 응답 파싱
+            # 5. 응답 파싱
             llm_response = response.choices[0].message.content.strip()
             category, reason = self._parse_llm_response(llm_response)
 
-            # 5. 카테고리 검증
+            # 6. 카테고리 검증
             try:
                 validated_category = DocumentCategory(category)
             except ValueError:
@@ -185,7 +285,8 @@ class LLMRoutingService:
                 "confidence": self._calculate_confidence(llm_response),
                 "reason": reason,
                 "metadata": {
-                    **parse_result["metadata"],
+                    **content_metadata,
+                    "method": "llm",
                     "model": self.model,
                     "llm_response": llm_response,
                 },
@@ -195,6 +296,66 @@ class LLMRoutingService:
             logger.error(f"문서 라우팅 중 오류 발생: {file_path}, 오류: {str(e)}")
             raise
 
+    async def route_documents(
+        self,
+        file_paths: Iterable[str],
+        concurrency: Optional[int] = None,
+        max_content_length: int = 4000,
+        content_mode: Optional[RoutingContentMode] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        여러 PDF 파일을 동시에 라우팅하고, 끝나는 순서대로 결과를 흘려보냅니다.
+
+        Args:
+            file_paths: 라우팅할 PDF 파일 경로들 (generator 도 가능, 필요한 만큼만 읽음)
+            concurrency: 동시에 처리할 파일 수 (기본값: ROUTING_CONCURRENCY 설정)
+            max_content_length: LLM에 전달할 최대 문서 길이 (문자 수)
+            content_mode: 문서 내용 추출 방식 (None인 경우 서비스 기본값)
+
+        Yields:
+            파일별 결과 딕셔너리
+            {
+                "file_path": "...",
+                "status": "ok" | "error",
+                "latency_ms": 123.4,
+                "category": ..., "confidence": ..., "reason": ...   # status == ok
+                "error": "..."                                      # status == error
+            }
+        """
+        concurrency = concurrency or settings.ROUTING_CONCURRENCY
+        paths = iter(file_paths)
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            # 고정된 수의 worker 가 경로를 하나씩 가져가므로 수천 개여도 task 수는 concurrency 개
+            for file_path in paths:
+                start = time.perf_counter()
+                try:
+                    routed = await self.route_document(file_path, max_content_length, content_mode)
+                    item = {"file_path": file_path, "status": "ok", **routed}
+                except Exception as e:
+                    item = {"file_path": file_path, "status": "error", "error": str(e)}
+                item["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+                await results.put(item)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        remaining = len(workers)
+        done_marker = object()
+        for task in workers:
+            task.add_done_callback(lambda _: results.put_nowait(done_marker))
+
+        try:
+            while remaining:
+                item = await results.get()
+                if item is done_marker:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            # 소비자가 중간에 끊으면 남은 작업 취소
+            for task in workers:
+                task.cancel()
+
     def _parse_llm_response(self, response: str) -> Tuple[str, str]:
         """
         LLM 응답을 파싱하여 카테고리와 이유를 추출합니다.
@@ -284,6 +445,7 @@ class LLMRoutingService:
         file_bytes: bytes,
         file_name: str,
         max_content_length: int = 4000,
+        content_mode: Optional[RoutingContentMode] = None,
     ) -> Dict[str, Any]:
         """
         바이트 데이터로부터 PDF 파일을 읽어서 적절한 카테고리로 라우팅합니다.
@@ -292,6 +454,7 @@ class LLMRoutingService:
             file_bytes: PDF 파일의 바이트 데이터
             file_name: 파일 이름 (확장자 포함)
             max_content_length: LLM에 전달할 최대 문서 길이 (문자 수)
+            content_mode: 문서 내용 추출 방식 (None인 경우 서비스 기본값)
 
         Returns:
             카테고리 정보와 메타데이터를 포함한 딕셔너리
@@ -308,6 +471,7 @@ class LLMRoutingService:
                 result = await self.route_document(
                     file_path=tmp_file_path,
                     max_content_length=max_content_length,
+                    content_mode=content_mode,
                 )
                 
                 return result
@@ -1,19 +1,123 @@
 import fitz
-import base64
 import logging
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterable, Optional, Union
 from uuid import uuid4
 from sqlalchemy.testing.suite.test_reflection import metadata
 
 from app.domain.document.entity.doc import Doc
 from app.domain.document.entity.documentinfo import DocumentInfo
+from app.domain.document.entity.document_stream import DocumentStream
+from app.domain.document.entity.image_extraction_mode import ImageExtractionMode
+from app.core.config import settings
+from app.infrastructure.image_store.image_store import ImageStore
+from app.service.chunk.parser.boilerplate_index import BoilerplateIndex
 
 logger = logging.getLogger(__name__)
 
+# 메모리 bytes 또는 디스크에 spool 된 파일 경로
+PdfSource = Union[bytes, str, os.PathLike]
+
+_TOC_PAGE = re.compile(r"(목\s*차|차\s*례|table\s+of\s+contents|^\s*contents\s*$)", re.I | re.M)
+
+_PAGES_MODE = "pages"
+_SECTIONS_MODE = "sections"
+
+
+def _extract_page_range(
+    source: dict,
+    filetype: str,
+    start: int,
+    end: int,
+    mode: str,
+    options: dict,
+) -> list:
+    """
+    process-pool worker.
+    [start, end) 페이지만 추출한다. source 는 둘 중 하나:
+    - {"path": ...}            : 디스크에 spool 된 파일을 직접 연다
+    - {"shm": name, "size": n} : shared memory 에 올라간 PDF bytes 를 복사 없이 연다
+    """
+    image_store_dir = options.get("image_store_dir")
+    service = PdfService(
+        image_mode=options["image_mode"],
+        image_store=ImageStore(image_store_dir) if image_store_dir else None,
+    )
+
+    if "path" in source:
+        with fitz.open(source["path"], filetype=filetype) as doc:
+            return _extract_pages(service, doc, filetype, start, end, mode, options)
+
+    shm = shared_memory.SharedMemory(name=source["shm"])
+    try:
+        buf = shm.buf[:source["size"]]
+        doc = fitz.open(stream=buf, filetype=filetype)
+        try:
+            return _extract_pages(service, doc, filetype, start, end, mode, options)
+        finally:
+            doc.close()
+            buf.release()
+    finally:
+        shm.close()
+
+
+def _extract_pages(service, doc, filetype: str, start: int, end: int, mode: str, options: dict) -> list:
+    images_seen: dict[int, dict] = {}
+    result = []
+    for page_index in range(start, end):
+        page = doc.load_page(page_index)
+        if mode == _SECTIONS_MODE:
+            result.extend(service._page_sections(doc, page, page_index, images_seen))
+        else:
+            text = page.get_text("text")
+            result.append((
+                text,
+                service._page_doc(
+                    doc, page, page_index, text,
+                    options["doc_uuid"], options["file_name"], filetype,
+                    images_seen,
+                ),
+            ))
+    return result
+
+
+def open_pdf(source: PdfSource, filetype: str = "pdf"):
+    """
+    bytes 면 메모리 stream 으로, 경로면 파일을 직접 연다.
+    경로로 열면 MuPDF 가 필요한 부분만 읽으므로 전체 파일을 메모리에 올리지 않는다.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return fitz.open(os.fspath(source), filetype=filetype)
+    return fitz.open(stream=source, filetype=filetype)
+
+
+def write_sub_pdf(doc, page_indexes: Iterable[int], path: str) -> None:
+    """
+    doc 에서 page_indexes(0-based) 페이지만 순서대로 담은 PDF 를 path 에 저장한다.
+    같은 입력이면 같은 bytes 가 나오도록 새 문서 ID 를 만들지 않는다 (content-hash 캐시 key 용).
+    """
+    sub = fitz.open()
+    try:
+        for page_index in page_indexes:
+            sub.insert_pdf(doc, from_page=page_index, to_page=page_index)
+        sub.save(path, no_new_id=True)
+    finally:
+        sub.close()
+
 class PdfService:
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        image_mode: Optional[ImageExtractionMode] = None,
+        image_store: Optional[ImageStore] = None,
+    ):
+        self.image_mode = ImageExtractionMode(image_mode or settings.IMAGE_EXTRACTION_MODE)
+        self.image_store = image_store
+        if self.image_mode == ImageExtractionMode.PERSIST and self.image_store is None:
+            self.image_store = ImageStore(settings.IMAGE_STORE_DIR)
     # ------------------------------
     # 1. Layout 기반 섹션 감지기
     # ------------------------------
@@ -57,39 +161,36 @@ class PdfService:
     # ------------------------------
     # 2. PDF → 페이지별 → 섹션별 parsing
     # ------------------------------
-    def parse_pdf(self, pdf_bytes: bytes, filetype: str = "pdf") -> list[dict]:
-        doc = fitz.open(stream=pdf_bytes, filetype=filetype)
-        result = []
-        for page_num, page in enumerate(doc):
-            # 섹션 감지
-            sections = self.split_sections_layout(page)
-
-            imgs = []
-            for img in page.get_images(full=True):
-                xref = img[0]
-                try:
-                    pix = fitz.Pixmap(doc, xref)
-                    img_bytes = pix.tobytes("png")
-                    encoded = base64.b64encode(img_bytes).decode("utf-8")
-                except:
-                    continue
-
-                imgs.append({
-                    "xref": xref,
-                    # "image_base64": encoded
-                })
-
-            # 섹션 별로 저장
-            for sec in sections:
-                result.append({
-                    "page": page_num + 1,
-                    "text": sec,
-                    "images": imgs
-                })
+    def parse_pdf(self, pdf_bytes: PdfSource, filetype: str = "pdf", parallel: bool = False) -> list[dict]:
+        if parallel:
+            result = self._run_parallel(
+                pdf_bytes, filetype, _SECTIONS_MODE, **self._image_options()
+            )
+        else:
+            doc = open_pdf(pdf_bytes, filetype)
+            images_seen: dict[int, dict] = {}
+            result = []
+            for page_num, page in enumerate(doc):
+                result.extend(self._page_sections(doc, page, page_num, images_seen))
 
         logger.info("Parsed PDF:\n" + json.dumps(result, ensure_ascii=False, indent=2))
         return result
 
+    def _page_sections(self, doc, page, page_num: int, images_seen: Optional[dict] = None) -> list[dict]:
+        # 섹션 감지
+        sections = self.split_sections_layout(page)
+        imgs = self.extract_page_images(doc, page, images_seen)
+
+        # 섹션 별로 저장
+        return [
+            {
+                "page": page_num + 1,
+                "text": sec,
+                "images": imgs
+            }
+            for sec in sections
+        ]
+
     # 기존 normalize — 지금은 사용 안 해도 되지만 남겨둠
     def normalize_numbered_lines(self, text: str) -> str:
         lines = text.splitlines()
@@ -102,72 +203,279 @@ class PdfService:
                 merged.append(line)
         return "\n".join(merged)
 
-    def parse_full_text(self, pdf_bytes: bytes, filetype: str = "pdf") -> str:
-        doc = fitz.open(stream=pdf_bytes, filetype=filetype)
+    def sample_text(
+        self,
+        source: PdfSource,
+        budget: int = 4000,
+        first_pages: int = 2,
+        filetype: str = "pdf",
+    ) -> tuple[str, dict]:
+        """
+        전체 parse 없이 라우팅용 대표 샘플만 뽑는다.
+        - 목차 (outline, 없으면 앞쪽의 '목차/contents' 페이지)
+        - 앞 first_pages 페이지 + 중간 페이지
+        각 구간에 budget 을 균등 배분하고, 짧은 구간이 남긴 몫은 잘린 구간에 다시 채운다.
+        """
+        with open_pdf(source, filetype) as doc:
+            total = len(doc)
+            sections: list[tuple[str, str]] = []
+            toc_page: Optional[int] = None
+
+            toc = doc.get_toc(simple=True)
+            if toc:
+                sections.append((
+                    "목차",
+                    "\n".join(f"{'  ' * (level - 1)}{title} ... {page}" for level, title, page in toc),
+                ))
+            else:
+                for page_index in range(min(total, 5)):
+                    text = doc.load_page(page_index).get_text("text")
+                    if _TOC_PAGE.search(text):
+                        sections.append(("목차", text))
+                        toc_page = page_index
+                        break
+
+            # 짧은 문서에서 중간 페이지가 앞 페이지와 겹치거나, 목차로 이미 넣은 페이지는 다시 넣지 않는다
+            indexes = list(range(min(first_pages, total)))
+            if total > first_pages:
+                indexes.append(total // 2)
+            for page_index in dict.fromkeys(indexes):
+                if page_index == toc_page:
+                    continue
+                sections.append((f"p.{page_index + 1}", doc.load_page(page_index).get_text("text").strip()))
+
+        sections = [(label, text) for label, text in sections if text]
+        metadata = {
+            "pages_count": total,
+            "sampled_pages": [label for label, _ in sections],
+        }
+        if not sections:
+            return "", metadata
+
+        # "[label]\n" 머리와 구간 사이 "\n\n" 도 budget 에 포함
+        budget = max(budget - sum(len(label) + 5 for label, _ in sections), 0)
+        share = budget // len(sections)
+        taken = [min(len(text), share) for _, text in sections]
+        left = budget - sum(taken)
+        for i, (_, text) in enumerate(sections):
+            extra = min(len(text) - taken[i], left)
+            taken[i] += extra
+            left -= extra
+
+        sample = "\n\n".join(
+            f"[{label}]\n{text[:n]}" for (label, text), n in zip(sections, taken)
+        )
+        return sample, metadata
+
+    def parse_full_text(self, pdf_bytes: PdfSource, filetype: str = "pdf") -> str:
+        doc = open_pdf(pdf_bytes, filetype)
         full_text = ""
         for page in doc:
             text = page.get_text("text")
             full_text += text + "\n"
         return full_text
 
-    def normal_parse(self,pdf_bytes, file_name,filetype:str ="pdf") -> DocumentInfo:
-        doc = fitz.open(stream=pdf_bytes, filetype=filetype)
-
-        doc_uuid = uuid4()
-        result = []
-        doc_list: list[Doc] =[]
-        content:str = ""
-        for page_num, page in enumerate(doc):
-            text = page.get_text("text")
-            imgs = []
-
-            for img in page.get_images(full=True):
-                xref = img[0]
-                pix = fitz.Pixmap(doc, xref)
-                img_bytes = pix.tobytes("png")
-
-                # base64 인코딩
-                encoded = base64.b64encode(img_bytes).decode("utf-8")
-
-                imgs.append({
-                    "xref": xref,
-                    # "image_base64": encoded
-                })
-
-            result.append({
-                "page": page_num + 1,
-                "text": text,
-                "images": imgs,
-                "doc_uuid": f"{file_name}_{doc_uuid}",
-                "file_name" : file_name,
-                "source_type" : filetype,
-            })
-            content += text + "\n"
-
-            metadata = {
-                "rotation": page.rotation,
-                "rect": list(page.rect),  # 페이지 크기
+    def normal_parse(self,pdf_bytes, file_name,filetype:str ="pdf", doc_id: Optional[str] = None) -> DocumentInfo:
+        return self.stream_parse(pdf_bytes, file_name, filetype, doc_id).to_document_info()
 
-                "page": page_num + 1,
-                # "text": text,
-                "images": imgs,
-                "doc_uuid": f"{file_name}_{doc_uuid}",
-                "file_name": file_name,
-                "source_type": filetype,
-                "role":"page"
-            }
-            doc_info: Doc = Doc.from_document_pdf(text,metadata)
-            doc_list.append(doc_info)
+    # ------------------------------
+    # 3. 페이지 단위 스트리밍 parsing
+    # ------------------------------
+    def stream_parse(self, pdf_bytes, file_name, filetype: str = "pdf", doc_id: Optional[str] = None) -> DocumentStream:
+        """
+        페이지를 하나씩 Doc 으로 흘려보내는 generator 기반 parse.
+        전체 텍스트/Doc 리스트를 미리 만들지 않으므로 페이지 수와 무관하게 메모리가 일정하다.
+        """
+        doc = open_pdf(pdf_bytes, filetype)
+        doc_uuid = f"{file_name}_{doc_id or uuid4()}"
+        images_seen: dict[int, dict] = {}
+
+        def load_text(page_index: int) -> str:
+            return doc.load_page(page_index).get_text("text")
+
+        def build_page(page_index: int, text: str) -> Doc:
+            page = doc.load_page(page_index)
+            return self._page_doc(doc, page, page_index, text, doc_uuid, file_name, filetype, images_seen)
 
         meta:dict =  {
             "pages_count" : len(doc),
             "file_name": file_name,
             "source_type": filetype,
-            "doc_uuid": f"{file_name}_{doc_uuid}"
+            "doc_uuid": doc_uuid
+        }
+        return DocumentStream(
+            metadata=meta,
+            pages_count=len(doc),
+            load_text=load_text,
+            build_page=build_page,
+            boilerplate=BoilerplateIndex.from_settings(),
+        )
+
+    def _page_doc(
+        self,
+        doc,
+        page,
+        page_index: int,
+        text: str,
+        doc_uuid: str,
+        file_name: str,
+        filetype: str,
+        images_seen: Optional[dict] = None,
+    ) -> Doc:
+        metadata = {
+            "rotation": page.rotation,
+            "rect": list(page.rect),  # 페이지 크기
+
+            "page": page_index + 1,
+            "images": self.extract_page_images(doc, page, images_seen),
+            "doc_uuid": doc_uuid,
+            "file_name": file_name,
+            "source_type": filetype,
+            "role":"page"
         }
-        doc_info : DocumentInfo = DocumentInfo.from_doc_info(content,meta,doc_list)
+        return Doc.from_document_pdf(text, metadata)
 
-        return doc_info
+    # ------------------------------
+    # 4. 멀티 프로세스 페이지 추출
+    # ------------------------------
+    def parallel_parse(
+        self,
+        pdf_bytes,
+        file_name,
+        filetype: str = "pdf",
+        workers: Optional[int] = None,
+        page_range_size: Optional[int] = None,
+        doc_id: Optional[str] = None,
+    ) -> DocumentInfo:
+        """
+        normal_parse 의 process-pool 버전.
+        문서를 page range 로 나눠 각 worker 가 shared memory 의 같은 bytes 를 열어 추출하고,
+        결과는 페이지 순서대로 다시 합쳐 DocumentInfo 로 만든다.
+        """
+        doc_uuid = f"{file_name}_{doc_id or uuid4()}"
+        pages = self._run_parallel(
+            pdf_bytes, filetype, _PAGES_MODE,
+            workers=workers,
+            page_range_size=page_range_size,
+            file_name=file_name,
+            doc_uuid=doc_uuid,
+            **self._image_options(),
+        )
+
+        texts = [text for text, _ in pages]
+        doc_list: list[Doc] = [page_doc for _, page_doc in pages]
+        meta:dict =  {
+            "pages_count" : len(doc_list),
+            "file_name": file_name,
+            "source_type": filetype,
+            "doc_uuid": doc_uuid
+        }
+
+        boilerplate = BoilerplateIndex.from_settings()
+        if boilerplate is not None:
+            # worker 는 페이지 하나만 보므로 반복 줄은 모든 페이지를 모은 뒤 지우고, 바뀐 페이지만 다시 정규화
+            stripped = boilerplate.strip_pages(texts)
+            doc_list = [
+                Doc.from_document_pdf(new, page_doc.metadata) if new != old else page_doc
+                for old, new, page_doc in zip(texts, stripped, doc_list)
+            ]
+            texts = stripped
+            meta.update(boilerplate.stats())
+
+        content = "".join(f"{text}\n" for text in texts)
+        return DocumentInfo.from_doc_info(content, meta, doc_list)
+
+    def _image_options(self) -> dict:
+        # worker 프로세스에서도 같은 이미지 모드/저장소를 쓰도록 전달
+        return {
+            "image_mode": self.image_mode.value,
+            "image_store_dir": str(self.image_store.root) if self.image_store else None,
+        }
+
+    def _run_parallel(
+        self,
+        pdf_bytes,
+        filetype: str,
+        mode: str,
+        workers: Optional[int] = None,
+        page_range_size: Optional[int] = None,
+        **kwargs,
+    ) -> list:
+        workers = workers or settings.PDF_EXTRACT_WORKERS
+        page_range_size = page_range_size or settings.PDF_PAGE_RANGE_SIZE
+
+        with open_pdf(pdf_bytes, filetype) as doc:
+            pages_count = len(doc)
+        ranges = [
+            (start, min(start + page_range_size, pages_count))
+            for start in range(0, pages_count, page_range_size)
+        ]
+
+        shm = None
+        if isinstance(pdf_bytes, (str, os.PathLike)):
+            # 디스크 파일은 worker 가 경로로 직접 연다 (복사 없음)
+            source = {"path": os.fspath(pdf_bytes)}
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=max(len(pdf_bytes), 1))
+            shm.buf[:len(pdf_bytes)] = pdf_bytes
+            source = {"shm": shm.name, "size": len(pdf_bytes)}
+
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(ranges)) or 1) as pool:
+                futures = [
+                    pool.submit(
+                        _extract_page_range,
+                        source, filetype, start, end, mode, kwargs,
+                    )
+                    for start, end in ranges
+                ]
+                # submit 순서 == page 순서 이므로 그대로 이어 붙이면 된다
+                result = []
+                for future in futures:
+                    result.extend(future.result())
+            return result
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    # ------------------------------
+    # 5. 이미지 추출 (off / metadata / persist)
+    # ------------------------------
+    def extract_page_images(self, doc, page, images_seen: Optional[dict] = None) -> list[dict]:
+        """
+        페이지 이미지 정보를 image_mode 에 맞춰 수집한다.
+        - OFF      : 빈 리스트
+        - METADATA : get_images() 의 xref / 크기만 사용 (Pixmap 디코딩 없음)
+        - PERSIST  : 원본 스트림을 ImageStore 에 1회 저장하고 hash 만 기록
+        images_seen 에 xref 별 결과를 캐시해 같은 문서 안에서는 한 번만 처리한다.
+        """
+        if self.image_mode == ImageExtractionMode.OFF:
+            return []
+
+        images_seen = {} if images_seen is None else images_seen
+        imgs = []
+        for img in page.get_images(full=True):
+            xref, _, width, height = img[:4]
+            if xref not in images_seen:
+                if self.image_mode == ImageExtractionMode.METADATA:
+                    images_seen[xref] = {"xref": xref, "width": width, "height": height}
+                else:
+                    images_seen[xref] = self._persist_image(doc, xref)
+            if images_seen[xref] is not None:
+                imgs.append(images_seen[xref])
+        return imgs
+
+    def _persist_image(self, doc, xref: int) -> Optional[dict]:
+        try:
+            # PNG 재인코딩 없이 PDF 에 들어있는 원본 스트림을 그대로 사용
+            extracted = doc.extract_image(xref)
+        except Exception as e:
+            logger.warning("image extract failed xref=%s: %s", xref, e)
+            return None
+        if not extracted:
+            return None
+        return {"hash": self.image_store.put(extracted["image"], extracted["ext"])}
 
 
 
@@ -0,0 +1,149 @@
+import logging
+import re
+import statistics
+from dataclasses import dataclass, field
+from typing import Optional
+
+import fitz
+
+from app.core.config import settings
+from app.service.chunk.nlp.nlp_service import NLPService
+
+logger = logging.getLogger(__name__)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+@dataclass
+class PageTriage:
+    """페이지 하나의 fitz 추출 품질 점검 결과."""
+    page: int
+    text_chars: int
+    image_ratio: float
+    table_count: int
+    table_ratio: float
+    broken_rate: float
+    local: bool
+    reasons: list[str] = field(default_factory=list)
+    # find_tables 결과 (page_markdown 에서 다시 찾지 않도록 보관)
+    tables: list = field(default_factory=list, repr=False, compare=False)
+
+
+class PdfTriageService:
+    """
+    LlamaParse 로 보내기 전 페이지별 fitz 추출 품질을 점검한다.
+    - text layer 유무 (스캔 페이지 판별)
+    - 이미지 면적 비율
+    - 표 면적 비율 (page.find_tables)
+    - 줄 단위 깨짐 비율 (NLPService.is_broken)
+    통과한 페이지는 로컬에서 markdown 으로 변환하고, 나머지만 LlamaParse 로 보낸다.
+    """
+
+    def __init__(
+        self,
+        nlp_service: Optional[NLPService] = None,
+        min_text_chars: Optional[int] = None,
+        max_image_ratio: Optional[float] = None,
+        max_table_ratio: Optional[float] = None,
+        max_broken_rate: Optional[float] = None,
+        max_sample_sentences: int = 40,
+    ):
+        self.nlp_service = nlp_service or NLPService()
+        # 0 도 유효한 기준값이므로 None 일 때만 설정값을 쓴다
+        self.min_text_chars = settings.TRIAGE_MIN_TEXT_CHARS if min_text_chars is None else min_text_chars
+        self.max_image_ratio = settings.TRIAGE_MAX_IMAGE_RATIO if max_image_ratio is None else max_image_ratio
+        self.max_table_ratio = settings.TRIAGE_MAX_TABLE_RATIO if max_table_ratio is None else max_table_ratio
+        self.max_broken_rate = settings.TRIAGE_MAX_BROKEN_RATE if max_broken_rate is None else max_broken_rate
+        self.max_sample_sentences = max_sample_sentences
+
+    def triage(self, doc: fitz.Document) -> list[PageTriage]:
+        return [self.triage_page(page) for page in doc]
+
+    def triage_page(self, page: fitz.Page) -> PageTriage:
+        text = page.get_text("text")
+        page_area = abs(page.rect) or 1.0
+
+        image_area = sum(
+            abs(fitz.Rect(info["bbox"]) & page.rect) for info in page.get_image_info()
+        )
+        tables = page.find_tables().tables
+        table_area = sum(abs(fitz.Rect(table.bbox)) for table in tables)
+
+        triage = PageTriage(
+            page=page.number + 1,
+            text_chars=len(text.strip()),
+            image_ratio=round(min(image_area / page_area, 1.0), 3),
+            table_count=len(tables),
+            table_ratio=round(min(table_area / page_area, 1.0), 3),
+            broken_rate=round(self.broken_rate(text), 3),
+            local=True,
+            tables=tables,
+        )
+
+        if triage.text_chars < self.min_text_chars:
+            triage.reasons.append("no text layer")
+        if triage.image_ratio > self.max_image_ratio:
+            triage.reasons.append("image heavy")
+        if triage.table_ratio > self.max_table_ratio:
+            triage.reasons.append("table heavy")
+        if triage.broken_rate > self.max_broken_rate:
+            triage.reasons.append("broken lines")
+        triage.local = not triage.reasons
+        return triage
+
+    def broken_rate(self, text: str) -> float:
+        """
+        fitz 는 줄바꿈 위치에서 문장을 자르므로 줄을 이어 붙여 문장 단위로 다시 나눈 뒤
+        깨진 문장 비율을 본다 (짧은 조각은 번호/머리글이므로 제외, 앞쪽 일부만 검사).
+        """
+        joined = " ".join(line.strip() for line in text.splitlines() if line.strip())
+        sentences = [s for s in _SENTENCE_END.split(joined) if len(s.strip()) >= 10]
+        sentences = sentences[:self.max_sample_sentences]
+        if not sentences:
+            return 0.0
+        return sum(self.nlp_service.is_broken_many(sentences)) / len(sentences)
+
+
+def page_markdown(page: fitz.Page, heading_scale: float = 1.25, tables: Optional[list] = None) -> str:
+    """
+    fitz 페이지를 markdown 으로 변환한다.
+    - 표는 Table.to_markdown() 으로, 표 영역의 텍스트는 중복되지 않게 제외
+      (tables 를 주면 그대로 쓰고, 없으면 page.find_tables 로 찾는다)
+    - 본문 평균보다 heading_scale 배 이상 큰 글자의 줄은 heading 으로
+    - 블록/표는 위→아래 순서로 배치
+    """
+    if tables is None:
+        tables = page.find_tables().tables
+    table_rects = [fitz.Rect(table.bbox) for table in tables]
+
+    blocks = page.get_text("dict")["blocks"]
+    sizes = [
+        span["size"]
+        for block in blocks if block.get("type") == 0
+        for line in block["lines"]
+        for span in line["spans"] if span["text"].strip()
+    ]
+    body_size = statistics.median(sizes) if sizes else 0
+
+    parts: list[tuple[float, str]] = [(rect.y0, table.to_markdown()) for rect, table in zip(table_rects, tables)]
+    for block in blocks:
+        if block.get("type") != 0:
+            continue
+        block_rect = fitz.Rect(block["bbox"])
+        if any(block_rect.intersects(rect) for rect in table_rects):
+            continue
+
+        lines = []
+        for line in block["lines"]:
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+            line_text = "".join(span["text"] for span in spans).strip()
+            if body_size and max(span["size"] for span in spans) >= body_size * heading_scale:
+                line_text = f"## {line_text}"
+            lines.append(line_text)
+        if lines:
+            parts.append((block_rect.y0, "\n".join(lines)))
+
+    parts.sort(key=lambda part: part[0])
+    return "\n\n".join(text for _, text in parts)
@@ -0,0 +1,168 @@
+"""
+Ingest worker entry point.
+
+    python -m app.worker --workers 4
+
+API 는 작업 큐에 ingest task 를 넣기만 하고, 여기서 띄운 worker 프로세스들이
+task 를 꺼내 ParseDocumentService 파이프라인을 실행한다.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+from typing import Optional
+
+from app.core.config import settings
+from app.infrastructure.task_queue.task_queue import Task, TaskQueue, TaskStatus
+from app.infrastructure.task_queue.task_queue_factory import TaskQueueFactory
+
+logger = logging.getLogger(__name__)
+
+
+class IngestWorker:
+    """
+    작업 큐에서 ingest task 를 하나씩 꺼내 실행한다.
+    - 처리 중에는 heartbeat 스레드가 lease 를 연장한다 (긴 LlamaParse 도중 재전달 방지)
+    - 성공 → ack, 실패 → nack (시도 횟수에 비례해 재시도 지연, 초과 시 dead-letter)
+    - 업로드 파일은 ack 또는 dead-letter 된 뒤에만 삭제한다
+    """
+
+    def __init__(
+        self,
+        worker_id: str,
+        queue: Optional[TaskQueue] = None,
+        parse_service=None,
+        poll_interval: Optional[float] = None,
+        retry_delay: Optional[float] = None,
+        visibility_timeout: Optional[float] = None,
+    ):
+        self.worker_id = worker_id
+        self.queue = queue or TaskQueueFactory.get_queue()
+        self._parse_service = parse_service
+        self.poll_interval = poll_interval or settings.TASK_QUEUE_POLL_INTERVAL
+        self.retry_delay = settings.TASK_QUEUE_RETRY_DELAY if retry_delay is None else retry_delay
+        self.visibility_timeout = visibility_timeout or settings.TASK_QUEUE_VISIBILITY_TIMEOUT
+
+    @property
+    def parse_service(self):
+        if self._parse_service is None:
+            # worker 프로세스 안에서만 LLM / Qdrant 클라이언트를 만든다
+            from app.application.service.parse_document_service import ParseDocumentService
+            self._parse_service = ParseDocumentService()
+        return self._parse_service
+
+    def run(self, stop_event) -> None:
+        logger.info("worker %s started (pid=%s)", self.worker_id, os.getpid())
+        while not stop_event.is_set():
+            if not self.run_once():
+                stop_event.wait(self.poll_interval)
+        logger.info("worker %s stopped", self.worker_id)
+
+    def run_once(self) -> bool:
+        """task 하나를 처리했으면 True, 큐가 비어 있으면 False."""
+        task = self.queue.dequeue(self.visibility_timeout)
+        if task is None:
+            return False
+
+        logger.info(
+            "worker %s picked task %s (attempt %d/%d)",
+            self.worker_id, task.task_id, task.attempts, task.max_attempts,
+        )
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(task, stop_heartbeat), daemon=True
+        )
+        heartbeat.start()
+        try:
+            self.handle(task)
+        except Exception as e:
+            logger.exception("task %s failed", task.task_id)
+            status = self.queue.nack(task, repr(e), self.retry_delay * task.attempts)
+            if status == TaskStatus.DEAD:
+                logger.error("task %s moved to dead-letter", task.task_id)
+                self._cleanup(task)
+        else:
+            if self.queue.ack(task):
+                self._cleanup(task)
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+        return True
+
+    def handle(self, task: Task) -> None:
+        payload = task.payload
+        self.parse_service.execute_path(
+            payload["path"],
+            payload["filename"],
+            file_hash=payload.get("sha256"),
+            stream=payload.get("stream", False),
+        )
+
+    def _heartbeat(self, task: Task, stop: threading.Event) -> None:
+        interval = self.visibility_timeout / 3
+        while not stop.wait(interval):
+            if not self.queue.extend(task, self.visibility_timeout):
+                logger.warning("task %s lease lost", task.task_id)
+                return
+
+    @staticmethod
+    def _cleanup(task: Task) -> None:
+        path = task.payload.get("path")
+        if path and os.path.exists(path):
+            os.unlink(path)
+
+
+def _worker_main(worker_id: str, stop_event) -> None:
+    # Ctrl+C / SIGTERM 은 부모가 받아 stop_event 로 전달한다 (진행 중 task 는 끝까지 처리)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _configure_logging()
+    IngestWorker(worker_id).run(stop_event)
+
+
+def _configure_logging() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ingest worker pool")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    _configure_logging()
+    ctx = multiprocessing.get_context("spawn")
+    stop_event = ctx.Event()
+
+    def _stop(signum, frame):
+        logger.info("signal %s received, stopping workers...", signum)
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+
+    processes = [
+        ctx.Process(
+            target=_worker_main,
+            args=(f"{socket.gethostname()}-{i}", stop_event),
+            name=f"ingest-worker-{i}",
+        )
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    logger.info("started %d ingest workers", len(processes))
+
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+임베딩 centroid 분류기 정확도 / LLM 호출 절감률 평가.
+
+라벨이 붙은 JSONL({"path" 또는 "text", "label"}) 을 읽어 centroid 로만 분류했을 때의
+정확도와, margin 임계값 / 최소 유사도를 넘어 LLM 을 건너뛸 수 있는 비율을 출력한다.
+CENTROID_CLASSIFIER_ENABLED 를 켜기 전에 이 결과로 임계값을 정한다.
+
+    python -m benchmarks.centroid_classifier_eval data/eval/category.jsonl --target category
+    python -m benchmarks.centroid_classifier_eval data/eval/type.jsonl --target type --margins 0.01 0.03 0.05
+"""
+import argparse
+import json
+
+from app.core.config import settings
+from app.domain.document.services.document_classifier_service import document_type_centroid_classifier
+from app.service.llm_routing_service import category_centroid_classifier
+from app.service.pdf_service import PdfService
+
+
+def load_rows(path: str) -> list[tuple[str, str]]:
+    pdf_service = PdfService()
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            text = row.get("text")
+            if text is None:
+                text, _ = pdf_service.sample_text(row["path"])
+            rows.append((text, row["label"]))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("dataset")
+    parser.add_argument("--target", choices=["category", "type"], default="category")
+    parser.add_argument("--margins", type=float, nargs="+", default=[settings.CENTROID_MARGIN_THRESHOLD])
+    parser.add_argument("--min-similarity", type=float, default=settings.CENTROID_MIN_SIMILARITY)
+    args = parser.parse_args()
+
+    classifier = category_centroid_classifier() if args.target == "category" else document_type_centroid_classifier()
+    rows = load_rows(args.dataset)
+    predictions = classifier.predict_many([text for text, _ in rows])
+    labels = [label for _, label in rows]
+
+    correct = sum(p.label == label for p, label in zip(predictions, labels))
+    print(f"samples: {len(rows)}  centroid-only accuracy: {correct / max(len(rows), 1):.3f}")
+    print(f"{'margin':>8} {'llm_saved':>10} {'accuracy(confident)':>20}")
+    for margin in args.margins:
+        confident = [(p, label) for p, label in zip(predictions, labels) if p.confident(margin, args.min_similarity)]
+        saved = len(confident) / max(len(rows), 1)
+        accuracy = sum(p.label == label for p, label in confident) / max(len(confident), 1)
+        print(f"{margin:>8.3f} {saved:>10.3f} {accuracy:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+PdfService 직렬 추출(normal_parse) vs 멀티 프로세스 추출(parallel_parse) 벤치마크.
+
+    python -m benchmarks.pdf_extract_bench --workers 4 --page-range-size 50
+"""
+import argparse
+import time
+
+import fitz
+
+from app.service.pdf_service import PdfService
+
+
+def make_pdf(pages: int, lines: int = 40) -> bytes:
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page()
+        for line in range(lines):
+            page.insert_text(
+                (72, 60 + line * 18),
+                f"{page_num + 1}-{line} Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+            )
+    return doc.tobytes()
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--page-range-size", type=int, default=None)
+    args = parser.parse_args()
+
+    service = PdfService()
+    print(f"{'pages':>6} {'serial(s)':>10} {'parallel(s)':>12} {'speedup':>8}")
+    for pages in args.pages:
+        pdf_bytes = make_pdf(pages)
+        serial = timed(lambda: service.normal_parse(pdf_bytes, "bench.pdf"))
+        parallel = timed(
+            lambda: service.parallel_parse(
+                pdf_bytes,
+                "bench.pdf",
+                workers=args.workers,
+                page_range_size=args.page_range_size,
+            )
+        )
+        print(f"{pages:>6} {serial:>10.3f} {parallel:>12.3f} {serial / parallel:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
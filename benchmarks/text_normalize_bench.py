@@ -0,0 +1,69 @@
+"""
+TextParseProcessor 기존 5단계 정규화 vs 단일 패스 normalize 벤치마크 (MB 단위 한국어 텍스트).
+
+    python -m benchmarks.text_normalize_bench --mb 1 4
+"""
+import argparse
+import random
+import time
+
+from app.service.chunk.parser.text_parseprocessor import TextParseProcessor
+
+SAMPLE_LINES = [
+    "제1조(목적) 이 규정은 회사의 “여신 업무” 처리 절차를 정한다.",
+    "대출 신청인은 소득 증빙 서류를 제출하여야 하며 심사 담당자는",
+    "제출된 서류의 진위 여부를 확인한 후 승인 여부를 결정한다.",
+    "  ② 금리는 기준금리 + 가산금리로 산정하고   우대금리는 별표 1에 따른다",
+    "",
+    "금-",
+    "융 상품 판매 시 설명 의무를 준수해야 합니다",
+    "※ 본 문서는 내부 용도로만 사용하십시오 — 외부 유출 금지",
+    "\t표 1\t구분\t내용\t비고",
+]
+
+
+def make_text(mb: float, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines, size = [], 0
+    while size < mb * 1024 * 1024:
+        line = rng.choice(SAMPLE_LINES)
+        lines.append(line)
+        size += len(line.encode("utf-8")) + 1
+    return "\n".join(lines)
+
+
+def staged(processor: TextParseProcessor, text: str) -> str:
+    text = processor.normalize_unicode(text)
+    text = processor.normalize_punctuation(text)
+    text = processor.fix_hyphenated_linebreaks(text)
+    text = processor.normalize_whitespace(text)
+    return processor.merge_broken_lines(text)
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=float, nargs="+", default=[1, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    processor = TextParseProcessor()
+    print(f"{'MB':>5} {'staged(s)':>10} {'fused(s)':>9} {'speedup':>8}")
+    for mb in args.mb:
+        text = make_text(mb)
+        assert staged(processor, text) == processor.normalize(text)
+        staged_time = timed(lambda: staged(processor, text), args.repeat)
+        fused_time = timed(lambda: processor.normalize(text), args.repeat)
+        print(f"{mb:>5.1f} {staged_time:>10.3f} {fused_time:>9.3f} {staged_time / fused_time:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
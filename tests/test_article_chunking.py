@@ -0,0 +1,119 @@
+"""Statute article/clause chunker tests (character count stands in for the tokenizer)."""
+
+import asyncio
+import time
+
+from app.domain.document.entity.doc import Doc
+from app.domain.document.entity.documentinfo import DocumentInfo
+from app.service.chunk.article_chunking_service import ArticleChunkingService, scan_articles
+from app.service.chunk.parser.text_parseprocessor import TextParseProcessor
+
+REGULATION = """복무 규정
+제1장 총칙
+제1조(목적) 이 규정은 직원의 복무에 관한 사항을 정함을 목적으로 한다.
+제2조(정의) 이 규정에서 사용하는 용어의 뜻은 다음과 같다.
+1. "직원"이란 회사와 근로계약을 맺은 사람을 말한다.
+2. "부서장"이란 부서를 관리하는 사람을 말한다.
+제2장 근무
+제3조(근무시간) ① 근무시간은 1일 8시간으로 한다.
+② 제1항에도 불구하고 부서장은 업무상 필요한 경우 근무시간을 조정할 수 있다.
+③ 시차 출퇴근은 제4조에 따른다.
+제3조의2(재택근무) 재택근무는 부서장의 승인을 받아야 한다.
+부칙
+제1조(시행일) 이 규정은 2024년 1월 1일부터 시행한다.
+"""
+
+
+def test_scan_finds_articles_clauses_and_items() -> None:
+    articles = scan_articles(REGULATION)
+
+    assert [(a.label, a.title, a.addenda) for a in articles] == [
+        ("제1조", "목적", 0), ("제2조", "정의", 0), ("제3조", "근무시간", 0),
+        ("제3조의2", "재택근무", 0), ("제1조", "시행일", 1),
+    ]
+    assert articles[0].chapter == "제1장 총칙" and articles[2].chapter == "제2장 근무"
+    # 본문 속 "제4조에 따른다" 는 새 조가 아니다
+    assert [c.number for c in articles[2].clauses] == [1, 2, 3]
+    assert len(articles[1].clauses[0].items) == 2
+
+
+def test_scan_survives_normalization() -> None:
+    # 정규화는 ① -> 1 로 바꾸고 문장 끝이 아닌 줄을 합친다
+    articles = scan_articles(TextParseProcessor.normalize(REGULATION))
+
+    assert [a.label for a in articles] == ["제1조", "제2조", "제3조", "제3조의2", "제1조"]
+    assert [c.number for c in articles[2].clauses] == [1, 2, 3]
+
+
+def test_children_link_to_parents_and_short_clauses_merge() -> None:
+    service = ArticleChunkingService(max_tokens=200, min_tokens=60, count=len)
+    parents, children = service.split(REGULATION, {"file_name": "rule.pdf"})
+
+    parent_ids = {p.metadata["chunk_id"] for p in parents}
+    assert len(parents) == 5 and len(parent_ids) == 5
+    assert all(c.metadata["parent_id"] in parent_ids for c in children if c.metadata["article"])
+    # 제목(서문)은 parent 없는 child
+    assert children[0].metadata["article"] is None and children[0].content.startswith("복무 규정")
+
+    article3 = [c for c in children if c.metadata["article"] == "제3조"]
+    # ① 은 짧아서 ② 와 합쳐지고, ③ 도 짧아 앞 청크에 붙는다
+    assert len(article3) == 1 and article3[0].content.startswith("제3조(근무시간) ①")
+    assert all(c.tokens <= 200 for c in children)
+
+
+def test_long_clause_splits_on_items_and_scans_fast() -> None:
+    items = "\n".join(f"{n}. 항목 {n} 에 관한 상세 기준을 정한다." for n in range(1, 21))
+    article = f"제1조(기준) ① 기준은 다음과 같다.\n{items}\n② 끝.\n"
+    service = ArticleChunkingService(max_tokens=200, min_tokens=0, count=len)
+    _, children = service.split(article)
+
+    assert len(children) > 2 and all(c.tokens <= 200 for c in children)
+    # 긴 항은 호 경계에서 나뉜다
+    assert [c.content.split(".")[0] for c in children] == ["제1조(기준) ① 기준은 다음과 같다", "8", "15", "② 끝"]
+
+    regulation = "\n".join(
+        f"제{n}조(조항{n}) ① 이 조는 {n}번째 기준을 정한다.\n② 세부 사항은 따로 정한다.\n1. 가\n2. 나"
+        for n in range(1, 1001)
+    )
+    started = time.perf_counter()
+    parents, _ = service.split(regulation)
+    assert len(parents) == 1000
+    assert time.perf_counter() - started < 1.0
+
+
+def test_forward_reference_does_not_start_an_article() -> None:
+    text = (
+        "제1조(목적) 이 규정은 위원회 운영을 정한다.\n"
+        "제2조(정의) 용어의 뜻은 다음과 같다.\n"
+        '1. "위원회"란 제10조 제1항에 따른 위원회를 말한다.\n'
+        "2. 위원장은 제10조에 따라 선임한다.\n"
+        "제3조(구성) 위원회는 5명으로 구성한다.\n"
+        "제4조(임기) 임기는 2년으로 한다.\n"
+        "제10조(위원회) ① 위원회를 둔다.\n"
+    )
+    for source in (text, TextParseProcessor.normalize(text)):
+        articles = scan_articles(source)
+        assert [(a.label, a.title) for a in articles] == [
+            ("제1조", "목적"), ("제2조", "정의"), ("제3조", "구성"), ("제4조", "임기"), ("제10조", "위원회"),
+        ]
+
+
+class StubSummaries(ArticleChunkingService):
+    """LLM 대신 조마다 고정 요약 (achunk 의 chunk 는 프로세스 풀로 가므로 모듈 수준 클래스)."""
+
+    async def asummarize(self, parents, concurrency=None):
+        return [Doc.from_normalized("요약", {"role": "summary", "parent_id": p.metadata["chunk_id"]}) for p in parents]
+
+
+def test_sync_and_async_paths_both_add_summaries() -> None:
+    service = StubSummaries(max_tokens=200, min_tokens=60, count=len)
+
+    def roles(doc: DocumentInfo) -> list[str]:
+        return [d.metadata.get("role") for d in doc.child_documents]
+
+    sync = service.chunk_with_summaries(DocumentInfo.from_doc_info(REGULATION, {}, []), summarize=True)
+    async_ = asyncio.run(service.achunk(DocumentInfo.from_doc_info(REGULATION, {}, []), summarize=True))
+    assert roles(sync) == roles(async_) and roles(sync).count("summary") == 5
+    # summarize=False 면 요약 없이 chunk 와 같다
+    plain = service.chunk_with_summaries(DocumentInfo.from_doc_info(REGULATION, {}, []), summarize=False)
+    assert "summary" not in roles(plain)
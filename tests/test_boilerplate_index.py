@@ -0,0 +1,37 @@
+"""Repeated header/footer detection tests."""
+
+from app.service.chunk.parser.boilerplate_index import BoilerplateIndex
+from app.service.chunk.parser.text_parseprocessor import TextParseProcessor
+
+
+TOPICS = ["목적", "정의", "적용범위", "대출한도", "금리", "상환", "연체", "담보"]
+
+
+def make_pages(count: int) -> list[str]:
+    return [
+        f"여신업무 규정\n제{i}조({TOPICS[i % 8]}) 이 조는 {TOPICS[i % 8]}에 관한 사항을 정한다.\n"
+        f"{TOPICS[(i + 3) % 8]} 기준은 별표에 따른다.\n- {i} -\n대외비"
+        for i in range(1, count + 1)
+    ]
+
+
+def test_strip_pages_removes_repeated_edge_lines() -> None:
+    index = BoilerplateIndex(min_pages=3, min_ratio=0.5)
+    stripped = index.strip_pages(make_pages(6))
+
+    assert stripped[0] == "제1조(정의) 이 조는 정의에 관한 사항을 정한다.\n금리 기준은 별표에 따른다."
+    assert set(index.boilerplate_lines()) == {"여신업무 규정", "- # -", "대외비"}
+    assert all("이 조는" in page for page in stripped)
+
+
+def test_short_documents_are_left_untouched() -> None:
+    pages = make_pages(2)
+    assert BoilerplateIndex(min_pages=3).strip_pages(pages) == pages
+
+
+def test_preprocess_text_applies_explicit_patterns() -> None:
+    text = "ACME Corp\n본문 첫 줄입니다.\nPage 3\n"
+    result = TextParseProcessor().preprocess_text(
+        text, header_patterns=[r"ACME Corp"], footer_patterns=[r"Page \d+"], boilerplate_phrases=["첫 "]
+    )
+    assert result == "본문 줄입니다."
@@ -0,0 +1,45 @@
+"""Centroid classifier: abstain floor, margin-based confidence and one-time example loading."""
+
+import json
+from unittest import mock
+
+from langchain_core.embeddings import Embeddings
+
+from app.domain.document.services.centroid_classifier import CentroidClassifier
+
+AXES = {"대출": 0, "보안": 1}
+
+
+class AxisEmbeddings(Embeddings):
+    model = "axis-test"
+
+    def embed_documents(self, texts):
+        vectors = []
+        for text in texts:
+            vector = [0.0, 0.0, 1.0]   # 어느 축 단어도 없으면 세 번째(무관) 축
+            for word, i in AXES.items():
+                vector[i] += text.count(word) * 2
+            vectors.append(vector)
+        return vectors
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+def test_abstains_when_no_centroid_is_close_and_reads_examples_once(tmp_path) -> None:
+    examples = tmp_path / "examples.jsonl"
+    examples.write_text(json.dumps({"label": "loan", "text": "대출 대출"}, ensure_ascii=False) + "\n", encoding="utf-8")
+    classifier = CentroidClassifier(
+        AxisEmbeddings(), {"loan": "대출 문서", "security": "보안 문서"}, examples_path=str(examples)
+    )
+
+    with mock.patch("builtins.open", wraps=open) as opened:
+        loan = classifier.predict("대출 대출 대출 안내")
+        general = classifier.predict("점심 메뉴 공지")
+        classifier.predict("보안 점검")
+    assert opened.call_count == 1
+
+    assert loan.label == "loan" and loan.confident(0.03, 0.6)
+    assert loan.confidence_level(0.03) == "high"
+    # 일반 문서는 margin 이 0 이 아니어도 최소 유사도 미만이라 abstain
+    assert not general.confident(0.0, 0.6)
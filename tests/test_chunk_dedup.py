@@ -0,0 +1,154 @@
+"""MinHash LSH near-duplicate chunk elimination tests."""
+
+from unittest import mock
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from qdrant_client import QdrantClient
+
+from app.infrastructure.dedup.chunk_deduplicator import ChunkDeduplicator, DedupMode
+from app.infrastructure.dedup.minhash_index import MinHashLshIndex
+from app.infrastructure.langchain.upsert import Upsert
+from app.infrastructure.qdrant.qdrant_langchain_repository import QdrantLangchainRepository
+
+CLAUSE = (
+    "제3조(대출한도) 대출한도는 신청인의 연간 소득과 기존 부채를 고려하여 산정하며, "
+    "담보대출의 경우 담보물 감정가액의 70퍼센트를 초과할 수 없다. 다만 위원회의 승인을 받은 경우에는 예외로 한다."
+)
+# 숫자는 같고 문구만 조금 다른 사본
+COPY = CLAUSE.replace("예외로 한다", "예외로 할 수 있다")
+REVISED = CLAUSE.replace("70퍼센트", "60퍼센트")
+OTHER = (
+    "제9조(정보보호) 직원은 고객의 개인정보를 업무 목적 외로 열람하거나 외부에 제공하여서는 아니 되며, "
+    "위반 시 인사규정에 따라 징계한다. 정보보호 담당자는 분기마다 접근 기록을 점검한다."
+)
+
+
+def make_dedup(tmp_path, mode=DedupMode.SKIP) -> ChunkDeduplicator:
+    index = MinHashLshIndex(str(tmp_path / "test.db"), threshold=0.8)
+    return ChunkDeduplicator(index, mode)
+
+
+def child(text: str, **metadata) -> Document:
+    return Document(page_content=text, metadata={"role": "child", **metadata})
+
+
+def test_near_duplicate_is_skipped_across_runs(tmp_path) -> None:
+    first = make_dedup(tmp_path)
+    result = first.filter([child(CLAUSE), child(OTHER)])
+    assert len(result.docs) == 2
+    first.commit(result)
+
+    # 다른 인스턴스(다음 ingest)에서도 sqlite 인덱스로 중복을 찾는다
+    second = make_dedup(tmp_path)
+    result = second.filter([child(COPY, file_name="v2.pdf")], ids=["p-new"])
+    assert result.docs == []
+    assert result.duplicates[0]["similarity"] >= 0.8
+
+
+def test_revision_with_different_numbers_is_kept(tmp_path) -> None:
+    dedup = make_dedup(tmp_path)
+    dedup.commit(dedup.filter([child(CLAUSE)]))
+
+    # 70퍼센트 -> 60퍼센트 개정은 문자열이 거의 같아도 다른 조항
+    result = dedup.filter([child(REVISED, file_name="v2.pdf")])
+    assert [d.page_content for d in result.docs] == [REVISED] and result.duplicates == []
+
+
+def test_duplicates_within_batch_and_role_separation(tmp_path) -> None:
+    dedup = make_dedup(tmp_path)
+    page = Document(page_content=CLAUSE, metadata={"role": "page"})
+    result = dedup.filter([page, child(CLAUSE), child(COPY)])
+    # page 와 child 는 비교하지 않고, 같은 batch 의 child 끼리는 중복 처리
+    assert [d.metadata["role"] for d in result.docs] == ["page", "child"]
+    assert len(result.duplicates) == 1
+
+
+def test_alias_mode_records_canonical_point(tmp_path) -> None:
+    dedup = make_dedup(tmp_path, DedupMode.ALIAS)
+    first = dedup.filter([child(CLAUSE)], ids=["p-1"])
+    dedup.commit(first)
+
+    second = dedup.filter([child(COPY, file_name="v2.pdf")], ids=["p-2"])
+    dedup.commit(second)
+    aliases = dedup.index.aliases_of("p-1")
+    assert [a["point_id"] for a in aliases] == ["p-2"]
+
+
+class FixedEmbeddings(Embeddings):
+    def embed_documents(self, texts):
+        return [[1.0, 0.0, 0.0] for _ in texts]
+
+    def embed_query(self, text):
+        return [1.0, 0.0, 0.0]
+
+
+def test_alias_mode_merges_source_into_canonical_payload(tmp_path) -> None:
+    client = QdrantClient(":memory:")
+    dedup = make_dedup(tmp_path, DedupMode.ALIAS)
+    canonical_id, copy_id = "00000000-0000-0000-0000-000000000001", "00000000-0000-0000-0000-000000000002"
+
+    with mock.patch("app.infrastructure.qdrant.qdrant_langchain_repository.QdrantClientFactory.get_client",
+                    return_value=client), \
+            mock.patch.object(Upsert, "_deduplicator", return_value=dedup):
+        upsert = Upsert(FixedEmbeddings(), QdrantLangchainRepository)
+        upsert.upsert_vectors([child(CLAUSE, file_name="v1.pdf")], [[1.0, 0.0, 0.0]], "rules", ids=[canonical_id])
+        kept = upsert.upsert_vectors([child(COPY, file_name="v2.pdf", page=3)], [[1.0, 0.0, 0.0]], "rules", ids=[copy_id])
+
+    assert kept == 0
+    (point,) = client.retrieve("rules", [canonical_id])
+    # v2.pdf 의 사본은 적재되지 않고 원본 point 의 metadata.aliases 로 찾을 수 있다
+    assert point.payload["metadata"]["file_name"] == "v1.pdf"
+    assert point.payload["metadata"]["aliases"] == [{"file_name": "v2.pdf", "page": 3, "role": "child"}]
+
+
+def test_index_forgets_deleted_points(tmp_path) -> None:
+    dedup = make_dedup(tmp_path)
+    dedup.commit(dedup.filter([child(CLAUSE), child(OTHER)], ids=["p-1", "p-2"]))
+
+    assert dedup.index.remove(["p-1", "missing"]) == 1
+    assert dedup.filter([child(COPY)]).duplicates == []
+    dedup.index.drop()
+    assert dedup.index.stats()["chunks"] == 0
+
+
+def test_stale_canonical_point_is_not_used(tmp_path) -> None:
+    dedup = make_dedup(tmp_path)
+    dedup.commit(dedup.filter([child(CLAUSE)], ids=["p-1"]))
+
+    # 인덱스에는 있지만 Qdrant 에서는 이미 지워진 원본
+    result = dedup.filter([child(COPY)], ids=["p-2"], alive=lambda ids: set())
+    assert result.ids == ["p-2"] and result.duplicates == []
+    assert dedup.index.stats()["chunks"] == 0
+
+
+def test_repository_delete_paths_clean_the_index(tmp_path) -> None:
+    from app.infrastructure.dedup import chunk_deduplicator
+    from app.infrastructure.vector_store.vector_filter import VectorFilter
+
+    client = QdrantClient(":memory:")
+    ids = ["00000000-0000-0000-0000-000000000001", "00000000-0000-0000-0000-000000000002"]
+    chunk_deduplicator.get_chunk_deduplicator.cache_clear()
+    with mock.patch.object(chunk_deduplicator.settings, "DEDUP_INDEX_DIR", str(tmp_path)), \
+            mock.patch.object(chunk_deduplicator.settings, "DEDUP_THRESHOLD", 0.8), \
+            mock.patch("app.infrastructure.qdrant.qdrant_langchain_repository.QdrantClientFactory.get_client",
+                       return_value=client):
+        upsert = Upsert(FixedEmbeddings(), QdrantLangchainRepository, deduplicate=True)
+        repository = upsert.embed_repository
+        upsert.upsert_vectors(
+            [child(CLAUSE, file_name="v1.pdf"), child(OTHER, file_name="v1.pdf")], [[1.0, 0.0, 0.0]] * 2, "rules", ids
+        )
+        index = chunk_deduplicator.get_chunk_deduplicator("rules").index
+        assert index.stats()["chunks"] == 2
+
+        repository.delete_by_filter("rules", [VectorFilter.match("metadata.file_name", "v1.pdf")])
+        assert index.stats()["chunks"] == 0
+        # 같은 내용을 다시 적재하면 지워진 point 와 중복으로 판정되지 않는다
+        reingested = upsert.upsert_vectors(
+            [child(CLAUSE)], [[1.0, 0.0, 0.0]], "rules", ["00000000-0000-0000-0000-000000000003"]
+        )
+        assert reingested == 1
+
+        repository.delete_collection("rules")
+        assert index.stats()["chunks"] == 0
+    chunk_deduplicator.get_chunk_deduplicator.cache_clear()
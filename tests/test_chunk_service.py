@@ -0,0 +1,40 @@
+"""ChunkService offset-based chunk tests."""
+
+import pickle
+
+from app.domain.document.chunk.service.chunk_service import ChunkService
+from app.domain.document.entity.chunk_span import ChunkSpan
+from app.domain.document.entity.doc import Doc
+from app.domain.document.entity.documentinfo import DocumentInfo
+
+PARAGRAPH = "제{n}조(목적) 이 규정은 여신 업무의 처리 기준을 정한다. 담당자는 심사 결과를 기록하여야 한다.\n\n"
+
+
+def make_info() -> DocumentInfo:
+    content = "".join(PARAGRAPH.format(n=n) for n in range(1, 60))
+    pages = [Doc.from_document_pdf(content[:2000], {"page": 1, "role": "page"})]
+    return DocumentInfo.from_doc_info(content, {"file_name": "a.pdf"}, pages)
+
+
+def test_full_chunk_spans_point_into_shared_content() -> None:
+    info = ChunkService().full_chunk(make_info(), chunk_size=300, chunk_overlap=50)
+    chunks = info.child_documents
+
+    assert all(isinstance(c, ChunkSpan) for c in chunks)
+    # 모든 청크가 같은 정규화 원문을 공유하고, 문서 metadata 는 수정되지 않는다
+    assert len({id(c.source) for c in chunks}) == 1
+    assert info.metadata == {"file_name": "a.pdf"}
+    assert [c.metadata["chunk_index"] for c in chunks] == list(range(len(chunks)))
+    assert all(c.metadata["total_chunks"] == len(chunks) for c in chunks)
+    assert all(c.content == c.source.content[c.start:c.end] and c.content for c in chunks)
+
+
+def test_chunk_uses_page_metadata_and_survives_pickle() -> None:
+    info = ChunkService().chunk(make_info(), 300, 50)
+    first = info.child_documents[0]
+    assert first.metadata["page"] == 1 and first.metadata["role"] == "child"
+
+    restored = pickle.loads(pickle.dumps(info))
+    assert [d.page_content for d in restored.get_upsert_document()] == [
+        d.page_content for d in info.get_upsert_document()
+    ]
@@ -0,0 +1,92 @@
+"""Rule thresholds and the rule -> centroid -> LLM classification cascade (centroid and LLM stubbed)."""
+
+import json
+from unittest import mock
+
+from app.domain.document.entity.doc import Doc
+from app.domain.document.entity.document_type import DocumentType
+from app.domain.document.entity.documentinfo import DocumentInfo
+from app.domain.document.services.centroid_classifier import CentroidPrediction
+from app.domain.document.services.document_classifier_service import ClassificationStats, DocumentClassifierService
+from app.service.chunk.rule.document_type_rule import AMBIGUOUS, DocumentTypeRule
+
+POLICY_PAGE = "제1조(목적) 이 규정은 목적을 정한다.\n제2조(정의) 용어를 정의한다.\n제3조(적용) 모든 직원에게 적용한다."
+MANUAL_PAGE = "import os\ndef main():\nclass Runner:\npip install runner\ngit clone repo"
+PLAIN_PAGE = "이번 주 점심 메뉴를 안내합니다."
+
+
+def test_rule_resolves_only_above_share_and_margin() -> None:
+    rule = DocumentTypeRule()
+
+    policy = rule.decide([POLICY_PAGE] * 3)
+    assert (policy.document_type, policy.confidence) == (DocumentType.POLICY.value, 1.0)
+    # 2:1 -> share 0.67, margin 0.33 : 기본값(0.6 / 0.3)으로는 확정
+    assert rule.decide([POLICY_PAGE, POLICY_PAGE, MANUAL_PAGE]).document_type == DocumentType.POLICY.value
+    # 같은 문서도 margin 기준을 올리면 AMBIGUOUS
+    assert DocumentTypeRule(min_margin=0.5).decide([POLICY_PAGE, POLICY_PAGE, MANUAL_PAGE]).document_type == AMBIGUOUS
+    # 1:1 -> share 0.5 < 0.6
+    assert rule.decide([POLICY_PAGE, MANUAL_PAGE]).document_type == AMBIGUOUS
+
+
+def test_rule_falls_through_on_weak_or_empty_pages() -> None:
+    rule = DocumentTypeRule()
+
+    # 점수가 min_page_score 미만인 페이지는 투표하지 않는다
+    weak = rule.decide([PLAIN_PAGE, "결과를 요약한다."])
+    assert not weak.resolved and weak.confidence == 0.0
+    assert rule.decide(["", "  \n"]).reason == "empty document"
+
+
+class StubCentroid:
+    def __init__(self, prediction: CentroidPrediction):
+        self.prediction = prediction
+        self.calls = 0
+
+    def predict(self, text: str) -> CentroidPrediction:
+        self.calls += 1
+        return self.prediction
+
+
+def make_doc(*pages: str) -> DocumentInfo:
+    return DocumentInfo.from_doc_info("\n".join(pages), {}, [Doc.from_normalized(p, {}) for p in pages])
+
+
+def make_service(prediction: CentroidPrediction) -> tuple[DocumentClassifierService, StubCentroid, ClassificationStats]:
+    centroid, stats = StubCentroid(prediction), ClassificationStats()
+    service = DocumentClassifierService(
+        stats=stats, centroid=centroid, margin_threshold=0.1, min_similarity=0.5
+    )
+    return service, centroid, stats
+
+
+LLM_ANSWER = json.dumps({"document_type": "REPORT", "confidence": 0.7, "reason": "llm"})
+
+
+def test_cascade_stops_at_the_first_confident_stage() -> None:
+    confident = CentroidPrediction("MANUAL", 0.8, "REPORT", 0.3, {"MANUAL": 0.8, "REPORT": 0.5})
+    service, centroid, stats = make_service(confident)
+
+    with mock.patch("app.domain.document.services.document_classifier_service.LlmClient") as llm:
+        by_rule = service.classify(make_doc(POLICY_PAGE, POLICY_PAGE))
+        by_centroid = service.classify(make_doc(PLAIN_PAGE))
+
+    assert (by_rule.method, by_rule.document_type) == ("rule", DocumentType.POLICY.value)
+    # 규칙이 확정하면 centroid 는 호출되지 않는다
+    assert centroid.calls == 1
+    assert (by_centroid.method, by_centroid.document_type, by_centroid.confidence) == ("centroid", "MANUAL", 0.8)
+    llm.assert_not_called()
+    assert stats.counts == {"rule": 1, "centroid": 1, "llm": 0}
+
+
+def test_cascade_falls_back_to_llm_when_centroid_abstains() -> None:
+    # margin 은 충분하지만 top-1 유사도가 min_similarity 미만 -> abstain
+    far = CentroidPrediction("MANUAL", 0.4, "REPORT", 0.3, {"MANUAL": 0.4, "REPORT": 0.1})
+    service, centroid, stats = make_service(far)
+
+    with mock.patch("app.domain.document.services.document_classifier_service.LlmClient") as llm:
+        llm.return_value.ask.return_value = LLM_ANSWER
+        result = service.classify(make_doc(PLAIN_PAGE))
+
+    assert (result.method, result.document_type) == ("llm", "REPORT")
+    assert centroid.calls == 1 and llm.return_value.ask.call_count == 1
+    assert stats.counts == {"rule": 0, "centroid": 0, "llm": 1}
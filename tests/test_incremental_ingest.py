@@ -0,0 +1,112 @@
+"""Incremental (versioned) ingest: page diff, stale point deletion and result counts on in-memory Qdrant."""
+
+from unittest import mock
+
+import fitz
+import pytest
+from langchain_core.embeddings import Embeddings
+from qdrant_client import QdrantClient
+
+from app.application.service.incremental_ingest_service import IncrementalIngestService
+from app.infrastructure.langchain.upsert import Upsert
+from app.infrastructure.qdrant.qdrant_langchain_repository import QdrantLangchainRepository
+
+COLLECTION = "incremental"
+
+
+class FixedEmbeddings(Embeddings):
+    def __init__(self):
+        self.texts: list[str] = []
+
+    def embed_documents(self, texts):
+        self.texts.extend(texts)
+        return [[1.0, 0.0, 0.0] for _ in texts]
+
+    def embed_query(self, text):
+        return [1.0, 0.0, 0.0]
+
+
+@pytest.fixture
+def service():
+    client = QdrantClient(":memory:")
+    with mock.patch(
+        "app.infrastructure.qdrant.qdrant_langchain_repository.QdrantClientFactory.get_client", return_value=client
+    ):
+        upsert = Upsert(FixedEmbeddings(), QdrantLangchainRepository, deduplicate=False)
+        yield IncrementalIngestService(COLLECTION, chunk_size=800, chunk_overlap=0, upsert=upsert)
+
+
+def write_pdf(path, pages: list[str]) -> str:
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    doc.save(str(path))
+    return str(path)
+
+
+def pages(service) -> list[tuple[int, str]]:
+    """남아 있는 point 의 (page, version) — 페이지마다 page point + child 청크."""
+    return sorted({
+        (p["metadata"]["page"], p["metadata"]["version"])
+        for p in service.repository.scroll_payload(COLLECTION, [], fields=["metadata"])
+    })
+
+
+def test_unchanged_pages_are_reused_and_changed_pages_replaced(service, tmp_path) -> None:
+    v1 = write_pdf(tmp_path / "v1.pdf", ["Page one text", "Page two text", "Page three text"])
+    first = service.execute_path(v1, "rule.pdf", doc_key="rule", version="v1")
+    assert (first.pages_changed, first.pages_reused, first.chunks_upserted, first.chunks_deleted) == (3, 0, 6, 0)
+
+    embedded = len(service.upsert.embed_model.texts)
+    v2 = write_pdf(tmp_path / "v2.pdf", ["Page one text", "Page two revised", "Page three text"])
+    second = service.execute_path(v2, "rule.pdf", doc_key="rule", version="v2")
+
+    assert second.to_dict() == {
+        "doc_key": "rule", "version": "v2", "pages_total": 3,
+        "pages_changed": 1, "pages_reused": 2, "pages_removed": 0,
+        "chunks_upserted": 2, "chunks_reused": 4, "chunks_deleted": 2,
+    }
+    # 바뀐 페이지(page + child)만 임베딩
+    assert len(service.upsert.embed_model.texts) == embedded + 2
+    # 2 페이지의 이전 버전 point 는 지워지고 새 버전만 남는다
+    assert pages(service) == [(1, "v1"), (2, "v2"), (3, "v1")]
+
+
+def test_removed_trailing_pages_are_deleted(service, tmp_path) -> None:
+    service.execute_path(write_pdf(tmp_path / "v1.pdf", ["A page", "B page", "C page"]), "r.pdf", "r", "v1")
+
+    result = service.execute_path(write_pdf(tmp_path / "v2.pdf", ["A page"]), "r.pdf", "r", "v2")
+
+    assert (result.pages_total, result.pages_reused, result.pages_removed) == (1, 1, 2)
+    assert (result.chunks_upserted, result.chunks_deleted) == (0, 4)
+    assert pages(service) == [(1, "v1")]
+
+
+def test_mixed_hashes_after_interrupted_run_are_reconciled(service, tmp_path) -> None:
+    service.execute_path(write_pdf(tmp_path / "v1.pdf", ["A page", "B page"]), "r.pdf", "r", "v1")
+    v2 = write_pdf(tmp_path / "v2.pdf", ["A page", "B revised"])
+
+    # v2 적재 직후, 이전 버전 삭제 전에 중단된 상태
+    with mock.patch.object(QdrantLangchainRepository, "delete_by_filter", side_effect=RuntimeError("killed")):
+        with pytest.raises(RuntimeError):
+            service.execute_path(v2, "r.pdf", "r", "v2")
+    assert pages(service) == [(1, "v1"), (2, "v1"), (2, "v2")]
+
+    # 2 페이지는 hash 가 섞여 있으므로 다시 변경으로 처리, 같은 id 로 덮어쓰고 v1 만 지운다
+    result = service.execute_path(v2, "r.pdf", "r", "v2")
+    assert (result.pages_changed, result.pages_reused, result.chunks_upserted, result.chunks_deleted) == (1, 1, 2, 2)
+    assert pages(service) == [(1, "v1"), (2, "v2")]
+
+
+def test_delete_keeps_points_of_the_current_version(service, tmp_path) -> None:
+    service.execute_path(write_pdf(tmp_path / "v1.pdf", ["A page", "B page"]), "r.pdf", "r", "v1")
+
+    with mock.patch.object(
+        QdrantLangchainRepository, "delete_by_filter", autospec=True, wraps=QdrantLangchainRepository.delete_by_filter
+    ) as delete:
+        service.execute_path(write_pdf(tmp_path / "v2.pdf", ["A changed", "B page"]), "r.pdf", "r", "v2")
+
+    (_, collection, filters, *_), kwargs = delete.call_args
+    assert collection == COLLECTION
+    assert [(f.key, f.value) for f in filters] == [("metadata.doc_key", "r"), ("metadata.page", [1])]
+    assert [(f.key, f.value) for f in kwargs["exclude"]] == [("metadata.version", "v2")]
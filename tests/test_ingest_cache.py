@@ -0,0 +1,36 @@
+"""Ingest cache: a streamed upload leaves a marker that later stream / non-stream calls hit."""
+
+import asyncio
+from unittest import mock
+
+from langchain_core.runnables import RunnableLambda
+
+from app.application.service.parse_document_service import ParseDocumentService
+from app.domain.document.rule.entity.document_classification import DocumentClassification
+from app.infrastructure.cache.ingest_cache import IngestCache
+
+CLASSIFICATION = DocumentClassification(document_type="manual", confidence=1.0, reason="rule", method="rule")
+
+
+def test_stream_upsert_writes_a_marker_the_next_calls_hit(tmp_path) -> None:
+    cache = IngestCache(str(tmp_path), "test")
+    service = ParseDocumentService(ingest_cache=cache)
+    runs = []
+    stream_chain = RunnableLambda(
+        lambda x: runs.append(x["doc_id"]) or {**x, "classification": CLASSIFICATION, "upsert_count": 7}
+    )
+
+    with mock.patch.object(service, "_build_stream_chain", return_value=stream_chain), \
+            mock.patch.object(service, "_chain") as chain:
+        assert service._execute_stream("a.pdf", "a.pdf", "hash-a") == "ok"
+        entry = cache.get("hash-a")
+        assert (entry.upsert_count, entry.chunk_count, entry.chunks) == (7, 7, [])
+
+        # 두 번째 스트림 / 비스트림 / async 호출은 전부 캐시에서 끝난다
+        service._execute_stream("a.pdf", "a.pdf", "hash-a")
+        service._execute("a.pdf", "a.pdf", "hash-a")
+        assert asyncio.run(service.aingest("a.pdf", "a.pdf", "hash-a")) == 7
+
+    assert runs == ["hash-a"]
+    chain.invoke.assert_not_called()
+    chain.ainvoke.assert_not_called()
@@ -0,0 +1,75 @@
+"""LlamaParse result cache: TTL, LRU eviction order, oversized entries, counters and precomputed hashes."""
+
+from types import SimpleNamespace
+from unittest import mock
+
+from llama_index.core.schema import Document
+
+from app.domain.document.services import llm_parse_service
+from app.domain.document.services.llm_parse_service import LlamaParseService
+from app.infrastructure.cache import llama_parse_cache
+from app.infrastructure.cache.llama_parse_cache import LlamaParseCache
+
+
+def docs(text: str) -> list[dict]:
+    return [{"text": text, "metadata": {"page": 1}}]
+
+
+def entry_size(text: str) -> int:
+    return len(llama_parse_cache.json.dumps(docs(text), ensure_ascii=False).encode("utf-8"))
+
+
+def test_ttl_expires_entries(tmp_path) -> None:
+    cache = LlamaParseCache(str(tmp_path / "llama.db"), max_bytes=10_000, ttl_seconds=60)
+    with mock.patch.object(llama_parse_cache.time, "time", return_value=1000.0):
+        cache.put("a", docs("aaaa"))
+    with mock.patch.object(llama_parse_cache.time, "time", return_value=1059.0):
+        assert cache.get("a") == docs("aaaa")
+    with mock.patch.object(llama_parse_cache.time, "time", return_value=1061.0):
+        assert cache.get("a") is None
+
+    # 만료된 항목은 miss 로 세고 삭제
+    assert {k: cache.stats()[k] for k in ("hits", "misses", "entries")} == {"hits": 1, "misses": 1, "entries": 0}
+
+
+def test_lru_evicts_least_recently_used_and_skips_oversized(tmp_path) -> None:
+    size = entry_size("x" * 10)
+    cache = LlamaParseCache(str(tmp_path / "llama.db"), max_bytes=size * 3, ttl_seconds=3600)
+    clock = iter(range(100, 200))
+
+    with mock.patch.object(llama_parse_cache.time, "time", side_effect=lambda: float(next(clock))):
+        for key in "abc":
+            cache.put(key, docs(key * 10))
+        # a 를 읽어 최근 사용으로 만들면 다음 evict 대상은 b
+        assert cache.get("a") is not None
+        cache.put("d", docs("d" * 10))
+
+        assert cache.get("b") is None
+        assert all(cache.get(key) is not None for key in "acd")
+
+        # 한도보다 큰 결과는 저장하지 않고, 기존 항목도 밀어내지 않는다
+        cache.put("huge", docs("h" * size * 3))
+        assert cache.get("huge") is None
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"]) == (3, 1)
+    assert stats["bytes"] <= stats["max_bytes"]
+    assert (stats["hits"], stats["misses"]) == (4, 2) and stats["hit_rate"] == round(4 / 6, 4)
+
+
+def test_precomputed_hash_skips_rehashing(tmp_path) -> None:
+    cache = LlamaParseCache(str(tmp_path / "llama.db"), max_bytes=10_000, ttl_seconds=3600)
+    service = LlamaParseService(api_key="test", cache=cache)
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.4 test")
+
+    remote = mock.Mock(return_value=[Document(text="본문", metadata={})])
+    service.parser = SimpleNamespace(result_type="markdown", language="ko", load_data=remote)
+
+    with mock.patch.object(llm_parse_service, "sha256_file") as rehash:
+        first = service.load_data(str(path), file_hash="upload-sha")
+        second = service.load_data(str(path), file_hash="upload-sha")
+
+    rehash.assert_not_called()
+    assert remote.call_count == 1
+    assert [d.text for d in first] == [d.text for d in second] == ["본문"]
@@ -0,0 +1,57 @@
+"""Page-range split parsing: page offsets across ranges, gather order and the doc-count mismatch fallback."""
+
+import asyncio
+
+import fitz
+from llama_index.core.schema import Document
+
+from app.domain.document.services.llm_parse_service import LlamaParseService
+from app.infrastructure.cache.llama_parse_cache import LlamaParseCache
+
+
+# 페이지마다 다른 줄 (숫자만 다른 줄은 반복 머리글로 지워진다)
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo"]
+
+
+def write_pdf(path) -> str:
+    doc = fitz.open()
+    for word in WORDS:
+        doc.new_page().insert_text((72, 72), f"{word} section body")
+    doc.save(str(path))
+    return str(path)
+
+
+class StubRemote:
+    """sub-PDF 페이지 텍스트를 그대로 돌려준다. 3 페이지로 시작하는 range 는 결과 수가 다르다."""
+
+    def __init__(self):
+        self.finished: list[str] = []
+
+    async def __call__(self, sub_path: str, file_hash=None) -> list[Document]:
+        with fitz.open(sub_path) as sub:
+            texts = [page.get_text("text").strip() for page in sub]
+        # 첫 range 가 가장 늦게 끝나도 결과는 페이지 순서여야 한다
+        await asyncio.sleep(0.05 if texts[0].startswith("alpha") else 0)
+        self.finished.append(texts[0].split()[0])
+        if texts[0].startswith("charlie"):
+            # 두 번째 페이지만, sub-PDF 기준 페이지 번호와 함께
+            return [Document(text=f"remote {texts[1]}", metadata={"page_number": 2})]
+        return [Document(text=f"remote {text}", metadata={}) for text in texts]
+
+
+def test_pages_are_offset_per_range_and_mismatch_falls_back_locally(tmp_path) -> None:
+    service = LlamaParseService(api_key="test", cache=LlamaParseCache(str(tmp_path / "llama.db")))
+    remote = StubRemote()
+    service.aload_data = remote
+
+    info = service.parse_path_split(write_pdf(tmp_path / "five.pdf"), "five.pdf", page_range_size=2, concurrency=3)
+
+    assert sorted(remote.finished) == ["alpha", "charlie", "echo"] and remote.finished[-1] == "alpha"
+    assert [d.metadata["page"] for d in info.documents] == [1, 2, 3, 4, 5]
+    assert [d.metadata["page_range"] for d in info.documents] == ["1-2", "1-2", "3-4", "3-4", "5-5"]
+    contents = [d.content for d in info.documents]
+    assert contents[0] == "remote alpha section body" and contents[4] == "remote echo section body"
+    # 결과가 1개뿐인 3-4 range: 4 페이지는 metadata 로 매칭, 3 페이지는 로컬 markdown
+    assert contents[3] == "remote delta section body"
+    assert contents[2] == "charlie section body" and info.documents[2].metadata["parser"] == "local"
+    assert (info.metadata["pages_count"], info.metadata["page_ranges"]) == (5, 3)
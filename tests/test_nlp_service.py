@@ -0,0 +1,48 @@
+"""Batched Kiwi analysis tests: vectorised broken-sentence rules and sentence offsets."""
+
+import random
+
+from app.service.chunk.nlp.nlp_service import NLPService
+
+
+def reference_is_broken(tokens, text: str) -> bool:
+    # 문장 하나씩 검사하던 기존 규칙 그대로
+    pos = [t.tag for t in tokens]
+    if not any(p.startswith("V") for p in pos):
+        return True
+    if any(all(p.startswith("N") for p in pos[i:i + 3]) for i in range(len(pos) - 2)):
+        return True
+    if any(pos[i].startswith("N") and pos[i + 1].startswith("N") and pos[i + 2].startswith("J") for i in range(len(pos) - 2)):
+        return True
+    if "JKS" in pos or "JKO" in pos:
+        last_j = max(i for i, p in enumerate(pos) if p in ("JKS", "JKO"))
+        if not any(p.startswith("V") for p in pos[last_j:]):
+            return True
+    if len(pos) <= 3 and all(p.startswith("N") for p in pos):
+        return True
+    return sum(1 for ch in text if not ch.isalnum() and ch not in " .,-()") > 3
+
+
+def test_batch_is_broken_matches_per_sentence_rules() -> None:
+    words = ["회사는", "직원을", "채용한다.", "인사", "관리", "규정", "보고서를", "제출한다", "★", "_", "(주)", "결재", "하여야", "한다", "@#"]
+    rng = random.Random(0)
+    texts = ["", "회사는 직원을 채용한다."] + [
+        " ".join(rng.choice(words) for _ in range(rng.randint(1, 10))) for _ in range(300)
+    ]
+    service = NLPService()
+
+    expected = [reference_is_broken(tokens, text) for tokens, text in zip(service.tokenize_many(texts), texts)]
+    assert service.is_broken_many(texts) == expected
+    assert service.is_broken("직원은 규정을 지켜야 한다.") is False
+
+
+def test_split_sentences_returns_source_offsets() -> None:
+    text = "이 규정은 복무에 관한 사항을 정한다 세부 사항은 따로 정함\n\n\n둘째 문단이다. 끝"
+    spans = NLPService().split_sentences(text)
+
+    sentences = [text[s:e] for s, e in spans]
+    assert sentences[0].startswith("이 규정은") and sentences[-1] == "끝"
+    assert "둘째 문단이다." in sentences
+    # 문장부호 없이 끝나는 문장도 나뉜다
+    assert len(sentences) >= 4
+    assert NLPService().split_sentences_many(["", "   "]) == [[], []]
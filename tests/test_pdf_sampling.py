@@ -0,0 +1,23 @@
+"""Routing sample: no page is sampled twice on short documents or when it was taken as the TOC."""
+
+import fitz
+
+from app.service.pdf_service import PdfService
+
+
+def make_pdf(path, pages: list[str]) -> str:
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    doc.save(str(path))
+    return str(path)
+
+
+def test_short_pdf_samples_each_page_once_and_skips_toc_page(tmp_path) -> None:
+    path = make_pdf(tmp_path / "three.pdf", ["Contents\n1. Intro", "Intro page", "Last page"])
+
+    text, metadata = PdfService().sample_text(path)
+
+    # 앞 2 페이지 + 중간(p.2) 중 p.2 는 한 번만, p.1 은 목차로만
+    assert metadata["sampled_pages"] == ["목차", "p.2"]
+    assert text.count("Intro page") == 1 and text.count("Contents") == 1
@@ -0,0 +1,72 @@
+"""PDF triage: explicit zero thresholds, a single find_tables pass per page and remote page mapping."""
+
+from unittest import mock
+
+import fitz
+
+from app.domain.document.entity.doc import Doc
+from app.domain.document.entity.documentinfo import DocumentInfo
+from app.domain.document.services.hybrid_parse_service import HybridParseService
+from app.service.pdf_triage_service import PageTriage, PdfTriageService, page_markdown
+
+
+def make_pdf() -> fitz.Document:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Heading", fontsize=20)
+    page.insert_text((72, 110), "This page has a normal text layer for local parsing.", fontsize=11)
+    return doc
+
+
+def test_zero_thresholds_are_kept() -> None:
+    service = PdfTriageService(min_text_chars=0, max_image_ratio=0.0, max_broken_rate=0.0)
+    assert (service.min_text_chars, service.max_image_ratio, service.max_broken_rate) == (0, 0.0, 0.0)
+
+
+def test_tables_found_in_triage_are_reused_for_markdown() -> None:
+    doc = make_pdf()
+    find_tables = fitz.Page.find_tables
+
+    with mock.patch.object(fitz.Page, "find_tables", autospec=True, side_effect=find_tables) as found:
+        triage = PdfTriageService(max_broken_rate=1.0).triage(doc)[0]
+        markdown = page_markdown(doc.load_page(0), tables=triage.tables)
+
+    assert found.call_count == 1
+    assert triage.local and markdown.startswith("## Heading")
+
+
+class RemoteTriage:
+    """모든 페이지를 LlamaParse 로 보낸다."""
+
+    def triage(self, doc):
+        return [PageTriage(page.number + 1, 0, 0.0, 0, 0.0, 0.0, False, ["no text layer"]) for page in doc]
+
+
+class StubLlamaParse:
+    """sub-PDF 3 페이지 중 두 번째 페이지 결과만, metadata 페이지 번호와 함께 돌려준다."""
+
+    def __init__(self):
+        self.pages_sent = []
+
+    def parse_path(self, sub_path, file_name):
+        with fitz.open(sub_path) as sub:
+            self.pages_sent.append(len(sub))
+        docs = [Doc.from_normalized("원격 두 번째 페이지", {"page": 2})]
+        return DocumentInfo.from_doc_info(docs[0].content, {}, docs)
+
+
+def test_remote_result_count_mismatch_maps_by_page_and_falls_back_locally(tmp_path) -> None:
+    doc = fitz.open()
+    for n in range(1, 4):
+        doc.new_page().insert_text((72, 72), f"Local page {n}")
+    path = tmp_path / "three.pdf"
+    doc.save(str(path))
+
+    llama = StubLlamaParse()
+    info = HybridParseService(RemoteTriage(), llama).parse(str(path), "three.pdf")
+
+    assert llama.pages_sent == [3]
+    pages = {d.metadata["page"]: (d.content, d.metadata["parser"]) for d in info.documents}
+    # 2 페이지는 metadata 로 맞춰 원격 결과, 나머지는 빈 페이지 대신 로컬 markdown
+    assert pages[2] == ("원격 두 번째 페이지", "llama_parse")
+    assert pages[1] == ("Local page 1", "local") and pages[3] == ("Local page 3", "local")
@@ -0,0 +1,41 @@
+"""Path-based routing endpoint must stay inside ROUTING_PATH_ROOT."""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routing_controller import _iter_paths
+from app.core.config import settings
+from app.main import app
+from app.schemas.routing import RouteBatchPathsRequest
+
+client = TestClient(app)
+URL = "/api/v1/routing/batch/paths"
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    base = tmp_path / "docs"
+    (base / "sub").mkdir(parents=True)
+    (base / "sub" / "a.pdf").write_bytes(b"%PDF")
+    (tmp_path / "secret.pdf").write_bytes(b"%PDF")
+    os.symlink(tmp_path / "secret.pdf", base / "sub" / "link.pdf")
+    monkeypatch.setattr(settings, "ROUTING_PATH_ROOT", str(base))
+    return base
+
+
+def test_disabled_without_root(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "ROUTING_PATH_ROOT", None)
+    assert client.post(URL, json={"paths": ["/etc/passwd"]}).status_code == 403
+
+
+def test_rejects_paths_outside_root(root) -> None:
+    for path in ["/etc/passwd", "../secret.pdf", "sub/../../secret.pdf", "sub/link.pdf"]:
+        assert client.post(URL, json={"paths": [path]}).status_code == 403, path
+    assert client.post(URL, json={"directory": ".."}).status_code == 403
+
+
+def test_directory_glob_skips_escaping_symlinks(root) -> None:
+    request = RouteBatchPathsRequest(directory="sub", pattern="*.pdf", recursive=True)
+    assert list(_iter_paths(request, root.resolve())) == [str((root / "sub" / "a.pdf").resolve())]
@@ -0,0 +1,86 @@
+"""Semantic chunker tests with deterministic topic embeddings and the embedding cache."""
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.infrastructure.cache.embedding_cache import CachedEmbeddings, EmbeddingCache
+from app.service.chunk.semantic_chunker import SemanticChunker, sentence_spans
+
+TOPICS = {"사과": 0, "바다": 1, "기차": 2}
+
+
+class TopicEmbeddings(Embeddings):
+    """문장 안 주제 단어 개수로 벡터를 만든다."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        vectors = []
+        for text in texts:
+            vector = [0.01] * len(TOPICS)
+            for word, i in TOPICS.items():
+                vector[i] += text.count(word)
+            vectors.append(vector)
+        return vectors
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def make_text() -> str:
+    groups = [
+        ["사과는 빨갛다.", "사과는 달다.", "사과 나무가 있다."],
+        ["바다는 넓다.", "바다에  배가 떠 있다.", "바다는 푸르다."],
+        ["기차가 달린다.", "기차역에 사람이 많다."],
+    ]
+    return "\n".join(" ".join(group) for group in groups)
+
+
+def test_breaks_on_topic_change_and_keeps_source_offsets() -> None:
+    text = make_text()
+    embeddings = TopicEmbeddings()
+    chunks = SemanticChunker(embeddings, threshold_amount=50, buffer_size=0, derive_vectors=True).split(text)
+
+    assert [chunk.text.split(".")[0][:2] for chunk in chunks] == ["사과", "바다", "기차"]
+    # 청크는 원문 위치 그대로 (공백 두 칸도 유지)
+    assert all(text[chunk.start:chunk.end] == chunk.text for chunk in chunks)
+    assert "바다에  배가" in chunks[1].text
+    # 문장 임베딩은 한 번의 호출로
+    assert len(embeddings.calls) == 1 and len(embeddings.calls[0]) == len(sentence_spans(text))
+    # 청크 벡터는 해당 주제 축을 향한다
+    for chunk, axis in zip(chunks, range(3)):
+        assert int(np.argmax(chunk.vector)) == axis
+        assert abs(np.linalg.norm(chunk.vector) - 1.0) < 1e-5
+
+
+def test_buffered_windows_embed_each_sentence_once() -> None:
+    text = make_text()
+    embeddings = TopicEmbeddings()
+    chunks = SemanticChunker(embeddings, threshold_amount=50, buffer_size=1, derive_vectors=True).split(text)
+
+    spans = sentence_spans(text)
+    # buffer_size 는 임베딩 입력을 늘리지 않는다: 문장마다 한 번, 한 번의 호출
+    assert embeddings.calls == [[text[s:e] for s, e in spans]]
+    assert [chunk.text.split(".")[0][:2] for chunk in chunks] == ["사과", "바다", "기차"]
+    for chunk in chunks:
+        first, last = chunk.sentences
+        sentence_vectors = np.asarray(TopicEmbeddings().embed_documents([text[s:e] for s, e in spans[first:last]]))
+        unit = sentence_vectors / np.linalg.norm(sentence_vectors, axis=1, keepdims=True)
+        lengths = np.asarray([e - s for s, e in spans[first:last]], dtype=float)
+        expected = (unit * lengths[:, None]).sum(axis=0)
+        assert np.allclose(chunk.vector, expected / np.linalg.norm(expected), atol=1e-5)
+
+
+def test_cached_embeddings_skip_known_texts_and_batch_misses(tmp_path) -> None:
+    inner = TopicEmbeddings()
+    cached = CachedEmbeddings(inner, EmbeddingCache(str(tmp_path / "emb.db")), batch_size=2, namespace="topic")
+
+    first = cached.embed_documents(["사과", "바다", "사과", "기차"])
+    assert [len(call) for call in inner.calls] == [2, 1]  # 중복 제거 후 batch 단위
+    second = cached.embed_documents(["기차", "사과", "새 문장 사과"])
+
+    assert len(inner.calls) == 3 and inner.calls[-1] == ["새 문장 사과"]
+    assert np.allclose(second[0], first[3]) and np.allclose(second[1], first[0])
+    assert (cached.hits, cached.misses) == (2, 4)
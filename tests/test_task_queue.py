@@ -0,0 +1,55 @@
+"""SQLite task queue delivery semantics tests."""
+
+import time
+
+from app.infrastructure.task_queue.sqlite_task_queue import SqliteTaskQueue
+from app.infrastructure.task_queue.task_queue import TaskStatus
+
+
+def make_queue(tmp_path, **kwargs) -> SqliteTaskQueue:
+    return SqliteTaskQueue(str(tmp_path / "queue.db"), **kwargs)
+
+
+def test_dequeue_hides_task_until_ack(tmp_path) -> None:
+    """A leased task is invisible to other consumers and ack marks it done."""
+    queue = make_queue(tmp_path, visibility_timeout=60)
+    task_id = queue.enqueue({"path": "a.pdf"})
+
+    task = queue.dequeue()
+    assert task.task_id == task_id
+    assert task.payload == {"path": "a.pdf"}
+    assert task.attempts == 1
+    assert queue.dequeue() is None
+
+    assert queue.ack(task)
+    assert queue.get(task_id).status == TaskStatus.DONE
+
+
+def test_expired_lease_is_redelivered_and_stale_ack_ignored(tmp_path) -> None:
+    """Tasks whose visibility timeout expires are delivered again (at-least-once)."""
+    queue = make_queue(tmp_path, visibility_timeout=0.05)
+    queue.enqueue({"path": "a.pdf"})
+
+    first = queue.dequeue()
+    time.sleep(0.1)
+    second = queue.dequeue()
+
+    assert second.task_id == first.task_id
+    assert second.attempts == 2
+    assert not queue.ack(first)
+    assert queue.ack(second)
+
+
+def test_nack_retries_then_dead_letters(tmp_path) -> None:
+    """Failures are retried until max_attempts, then moved to the dead-letter set."""
+    queue = make_queue(tmp_path, max_attempts=2)
+    task_id = queue.enqueue({"path": "a.pdf"})
+
+    assert queue.nack(queue.dequeue(), "boom") == TaskStatus.QUEUED
+    assert queue.nack(queue.dequeue(), "boom") == TaskStatus.DEAD
+    assert queue.dequeue() is None
+
+    dead = queue.dead_letters()
+    assert [task.task_id for task in dead] == [task_id]
+    assert dead[0].error == "boom"
+    assert queue.stats()["dead"] == 1
@@ -0,0 +1,51 @@
+"""TextParseProcessor single-pass normaliser equivalence tests."""
+
+import random
+import re
+import unicodedata
+
+from app.service.chunk.parser.text_parseprocessor import TextParseProcessor
+
+
+def staged_pipeline(text: str) -> str:
+    """Original five-pass pipeline (uncompiled patterns), kept as the reference."""
+    text = unicodedata.normalize("NFKC", text)
+    text = re.sub(r"[“”«»‟]", '"', text)
+    text = re.sub(r"[‘’‚‛]", "'", text)
+    text = re.sub(r"[‐-‒–—─]", "-", text)
+    text = text.replace("\u00A0", " ").replace("\u200B", "")
+    text = re.sub(r"(\w+)-\n(\w+)", r"\1\2", text)
+    text = TextParseProcessor.normalize_whitespace(text)
+    return TextParseProcessor.merge_broken_lines(text)
+
+
+ALPHABET = (
+    ["금", "융", "다", "요", "죠", "가", "a", "1", "_", "１", "ﾀ"]
+    + [".", "!", "?", "…", "-", "—", "–", "‐", "‒", "─", "“", "”", "‘", "’", "«", "»"]
+    + [" ", " ", "\t", "\n", "\n", "\r\n", "\r", "\u00A0", "\u200B", "\u3000", "\x0c", "\x1f", "\u2028"]
+    + ["-\n", "-\n", "-\r\n", "-\u200B\n"]
+)
+
+
+def test_normalize_matches_staged_pipeline_on_fuzzed_text() -> None:
+    rng = random.Random(17)
+    processor = TextParseProcessor()
+    for _ in range(3000):
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 60)))
+        assert processor.preprocess_text(text) == staged_pipeline(text), repr(text)
+
+
+def test_normalize_examples() -> None:
+    assert TextParseProcessor.normalize("금-\n융 상품은\n\n\n판매한다.\n다음") == "금융 상품은\n\n판매한다.\n다음"
+    # 정규식과 같이 다음 줄 단어 전체를 소비한 뒤에는 연속 하이픈을 잇지 않는다
+    assert TextParseProcessor.normalize("a-\nb-\nc") == staged_pipeline("a-\nb-\nc")
+    assert TextParseProcessor.normalize("") == ""
+
+
+def test_doc_from_many_matches_single_construction() -> None:
+    from app.domain.document.entity.doc import Doc
+
+    items = [("금-\n융 상품\n안내", {"page": 1}), ("", {"page": 2}), ("“약관”  제1조.", {"page": 3})]
+    docs = Doc.from_many(items)
+    assert docs == [Doc.from_document_pdf(text, metadata) for text, metadata in items]
+    assert all(doc.normalized for doc in docs)
@@ -0,0 +1,48 @@
+"""Token-budget chunker tests (character count stands in for the tokenizer)."""
+
+from app.core.config import settings
+from app.domain.document.chunk.service.token_chunker import TokenChunker, token_limits
+from app.domain.document.entity.document_type import DocumentType
+
+
+class CountingTokenizer:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def __call__(self, text: str) -> int:
+        self.calls.append(text)
+        return len(text)
+
+
+def make_text() -> str:
+    paragraphs = [f"제{n}조 " + " ".join(["가나다라마바사"] * (n % 5 + 1)) for n in range(1, 40)]
+    paragraphs.append("아" * 250)  # 구분자가 없는 긴 문단
+    return "\n\n".join(paragraphs)
+
+
+def test_chunks_fit_budget_and_paragraphs_are_encoded_once() -> None:
+    text = make_text()
+    counter = CountingTokenizer()
+    chunks = TokenChunker(max_tokens=100, overlap_tokens=0, count=counter, sep_tokens=2).split(text)
+
+    assert all(tokens <= 100 and end - start <= 100 for start, end, tokens in chunks)
+    assert all(tokens == end - start for start, end, tokens in chunks)
+    # 예산 안의 문단은 한 번씩만 encode (커지는 buffer 를 다시 encode 하지 않음)
+    short_paragraphs = [p for p in text.split("\n\n") if len(p) <= 100]
+    assert all(counter.calls.count(p) == 1 for p in short_paragraphs)
+    # 긴 문단까지 빠짐없이 이어진다
+    assert "".join(text[s:e] for s, e, _ in chunks).replace("\n", "") == text.replace("\n", "")
+
+
+def test_overlap_repeats_trailing_units() -> None:
+    text = "\n\n".join(f"문단{n:02d} " + "내용" * 10 for n in range(10))
+    chunks = TokenChunker(max_tokens=80, overlap_tokens=30, count=len, sep_tokens=2).split(text)
+    assert len(chunks) > 1
+    for (_, prev_end, _), (next_start, _, _) in zip(chunks, chunks[1:]):
+        assert next_start < prev_end
+
+
+def test_token_limits_per_document_type() -> None:
+    assert token_limits(DocumentType.MANUAL)[0] == settings.CHUNK_TOKEN_LIMITS["manual"]
+    assert token_limits(DocumentType.UNKNOWN)[0] == settings.CHUNK_MAX_TOKENS
+    assert token_limits(None)[0] == settings.CHUNK_MAX_TOKENS